@@ -7,21 +7,32 @@ __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
 import time
+import math
+import functools
+import inspect
 from enum import Enum
 from abc import abstractmethod
-import copy
 import logging
-from typing import Union
+from typing import TYPE_CHECKING, List, Set, Type, Union
 
 import numpy as np
 
 # CommonRoad packages
 from commonroad.scenario.obstacle import Obstacle, DynamicObstacle, StaticObstacle
-from commonroad.prediction.prediction import TrajectoryPrediction
-from commonroad.visualization.mp_renderer import MPRenderer
 from commonroad.prediction.prediction import SetBasedPrediction
 
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
+from commonroad_crime.data_structure.curvilinear_projection import (
+    CurvilinearProjection,
+)
+from commonroad_crime.data_structure.lanelet_locator import LaneletLocator
+from commonroad_crime.data_structure.conflict_area_timing import ConflictAreaTiming
+from commonroad_crime.data_structure.collision_service import CollisionCheckerService
+from commonroad_crime.data_structure.road_topology import RoadTopology
+from commonroad_crime.data_structure.result_cache import (
+    ResultCache,
+    configuration_hash,
+)
 from commonroad_crime.data_structure.type import (
     TypeTime,
     TypeNone,
@@ -30,20 +41,85 @@ from commonroad_crime.data_structure.type import (
     TypePotential,
     TypeProbability,
 )
-import commonroad_crime.utility.visualization as utils_vis
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.logger as utils_log
 
 from commonroad_dc.pycrccosy import CurvilinearCoordinateSystem
 
+if TYPE_CHECKING:
+    from commonroad.visualization.mp_renderer import MPRenderer
+
+# the visualization is only imported when a measure is visualized
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
+
 logger = logging.getLogger(__name__)
 
 
+def _reuse_compute_result(compute):
+    """
+    Decorates the `compute` function of a measure such that the results are reused:
+    - an evaluator shared by several measures (see `CriMeBase.get_dependency`) returns the previous result if it is
+      called again with the same arguments;
+    - results are stored in and obtained from the `CriMeBase.result_cache`.
+    """
+    signature = inspect.signature(compute)
+
+    @functools.wraps(compute)
+    def wrapper(self, *args, **kwargs):
+        result_cache = CriMeBase.result_cache if self.cache_results else None
+        if not self._shared and result_cache is None:
+            return compute(self, *args, **kwargs)
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        key = tuple(
+            (name, value)
+            for name, value in arguments.arguments.items()
+            if name not in ["self", "verbose"]
+        )
+        if self._shared_result is not None and self._shared_result[0] == key:
+            return self._shared_result[1]
+        self._shared_result = None
+        if result_cache is not None:
+            cache_key = self._result_cache_key(key)
+            value = result_cache.get(cache_key)
+            if value is ResultCache.MISS:
+                value = compute(self, *args, **kwargs)
+                result_cache.put(cache_key, value)
+            else:
+                self._restore_cached_result(arguments.arguments, value)
+        else:
+            value = compute(self, *args, **kwargs)
+        if self._shared:
+            self._shared_result = (key, value)
+        return value
+
+    return wrapper
+
+
 class CriMeBase:
     """Base class for CRIticality MEasures"""
 
     measure_name: Enum = TypeNone.NONE
     monotone: Enum = TypeMonotone.NEG
+    # measures whose evaluators are used by this measure
+    dependencies: List[Type["CriMeBase"]] = []
+    # cache for the results of `compute` shared by all measures, which is disabled by default since only the returned
+    # values are restored for a cache hit; it is enabled by assigning a `ResultCache`
+    result_cache: Union[ResultCache, None] = None
+    # cache for the CLCS of the ego vehicles keyed by the lanelet network and the initial lanelet, which is disabled if
+    # set to None
+    clcs_cache: Union[ResultCache, None] = ResultCache(maxsize=128)
+    # whether the results of the measure can be cached, i.e., are deterministic and other measures do not rely on the
+    # internal states of its evaluator
+    cache_results: bool = True
+    # whether the measure is evaluated w.r.t. pairs of the ego vehicle and another vehicle, so that the vehicles that do
+    # not interact with the ego vehicle can be skipped
+    pairwise_interaction: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "compute" in cls.__dict__:
+            cls.compute = _reuse_compute_result(cls.compute)
 
     def __init__(self, config: CriMeConfiguration):
         """
@@ -57,16 +133,20 @@ class CriMeBase:
         self.configuration = config
         self.value = None
         self.time_step = 0
+        # whether the evaluator is shared with other measures, see `get_dependency`
+        self._shared = False
+        self._shared_result = None
         # =======  Scenario or scene  ========
-        if config.scenario:
-            self.sce = copy.deepcopy(config.scenario)
-        else:
-            self.sce = copy.deepcopy(config.scene)
-        if self.sce is None:
+        # the scenario/scene is shared by all measures and must not be modified, see `ScenarioContext`
+        self._context = config.scenario_context
+        if self._context is None:
             utils_log.print_and_log_warning(
                 logger, "Scenario/scene in the configuration needs to be first updated"
             )
+        self.sce = self._context.ego_view(self.configuration.vehicle.ego_id)
         self.dt = self.sce.dt
+        # columnar states of the ego vehicle and the other vehicles
+        self.trajectories = self._context.trajectories
 
         assert self.sce.obstacle_by_id(self.configuration.vehicle.ego_id), (
             "<Criticality: the provided ego vehicle "
@@ -80,19 +160,11 @@ class CriMeBase:
         if not isinstance(self.ego_vehicle, StaticObstacle) and not isinstance(
             self.ego_vehicle.prediction, SetBasedPrediction
         ):
-            utils_gen.check_elements_state_list(
-                [self.ego_vehicle.initial_state]
-                + self.ego_vehicle.prediction.trajectory.states_in_time_interval(
-                    time_begin=self.ego_vehicle.initial_state.time_step + 1,
-                    time_end=self.ego_vehicle.prediction.final_time_step,
-                ),
-                self.dt,
-            )
             self._update_clcs()
         self.other_vehicle: Union[Obstacle, DynamicObstacle, StaticObstacle, None] = (
             None  # optional
         )
-        self.rnd: Union[MPRenderer, None] = None
+        self.rnd: Union["MPRenderer", None] = None
 
     @property
     def clcs(self):
@@ -104,6 +176,41 @@ class CriMeBase:
             "Please set up the `clcs` via the `update` function in the configuration."
         )
 
+    @property
+    def lanelet_locator(self) -> LaneletLocator:
+        """
+        Point-location index of the lanelets of the scenario, shared with the other measures.
+        """
+        return self._context.lanelet_locator
+
+    @property
+    def conflict_area_timing(self) -> ConflictAreaTiming:
+        """
+        Enter and exit times of the vehicles at the conflict areas, shared with the other measures.
+        """
+        return self._context.conflict_area_timing
+
+    @property
+    def collision_service(self) -> CollisionCheckerService:
+        """
+        Collision checker of the scenario, shared with the other measures; the ego vehicle is excluded per query.
+        """
+        return self._context.collision_service
+
+    @property
+    def road_topology(self) -> RoadTopology:
+        """
+        Topology of the lanelet network of the scenario, shared with the other measures.
+        """
+        return self._context.road_topology
+
+    @property
+    def curvilinear_projection(self) -> CurvilinearProjection:
+        """
+        Curvilinear coordinates of the trajectories in the CLCS of the ego vehicle, shared with the other measures.
+        """
+        return self._context.projection(self.clcs)
+
     def __repr__(self):
         return f"{self.measure_name}"
 
@@ -130,10 +237,18 @@ class CriMeBase:
                 self.ego_vehicle.initial_state.time_step
             ]
         )[0]
-        reference_path = utils_gen.generate_reference_path(
-            ego_initial_lanelet_id, self.sce.lanelet_network
-        )
-        clcs = CurvilinearCoordinateSystem(reference_path)
+        # the CLCS is not modified after its construction and can therefore be shared among the configurations
+        key = (self._context.network_fingerprint, ego_initial_lanelet_id)
+        clcs = ResultCache.MISS
+        if self.clcs_cache is not None:
+            clcs = self.clcs_cache.get(key)
+        if clcs is ResultCache.MISS:
+            reference_path = utils_gen.generate_reference_path(
+                ego_initial_lanelet_id, self.sce.lanelet_network
+            )
+            clcs = CurvilinearCoordinateSystem(reference_path)
+            if self.clcs_cache is not None:
+                self.clcs_cache.put(key, clcs)
         self.configuration.update(CLCS=clcs)
 
     def _initialize_vis(
@@ -147,7 +262,7 @@ class CriMeBase:
         """
         if plot_limit is None:
             plot_limit = self.configuration.debug.plot_limits
-        self.rnd = MPRenderer(figsize=figsize, plot_limits=plot_limit)
+        self.rnd = utils_vis.MPRenderer(figsize=figsize, plot_limits=plot_limit)
         utils_vis.draw_sce_at_time_step(
             self.rnd, self.configuration, self.sce, self.time_step
         )
@@ -203,27 +318,61 @@ class CriMeBase:
             raise ValueError(
                 f"<Criticality>: Vehicle (id: {vehicle_id}) is not contained in the scenario!"
             )
-        self.other_vehicle = copy.deepcopy(self.sce.obstacle_by_id(vehicle_id))
-        if isinstance(self.other_vehicle, DynamicObstacle):
-            if isinstance(self.other_vehicle.prediction, TrajectoryPrediction):
-                utils_gen.check_elements_state_list(
-                    [self.other_vehicle.initial_state]
-                    + self.other_vehicle.prediction.trajectory.state_list,
-                    self.dt,
-                )
-            else:
-                utils_gen.check_elements_state(
-                    self.other_vehicle.initial_state, dt=self.dt
-                )
-        else:
-            utils_gen.check_elements_state(self.other_vehicle.initial_state, dt=self.dt)
+        self.other_vehicle = self._context.other_vehicle(
+            vehicle_id, self.ego_vehicle.obstacle_id
+        )
+
+    def reset(self):
+        """
+        Resets the results of the previous evaluation so that the evaluator can be reused for another time step.
+        """
+        self.value = None
+        self.rnd = None
+        self._shared_result = None
+
+    def _result_cache_key(self, key: tuple) -> tuple:
+        """
+        Returns the key in the `result_cache` for the arguments of `compute`, given as (name, value) pairs without
+        `verbose`.
+        """
+        return (
+            type(self),
+            self._context.context_id,
+            self.ego_vehicle.obstacle_id,
+            key,
+            configuration_hash(self.configuration),
+        )
+
+    def _restore_cached_result(self, arguments: dict, value: float):
+        """
+        Updates the evaluator with the cached result of `compute` for the given arguments.
+        """
+        self.value = value
+        if arguments.get("time_step") is not None:
+            self.time_step = arguments["time_step"]
+        if arguments.get("vehicle_id") is not None:
+            self.set_other_vehicles(arguments["vehicle_id"])
+
+    def get_dependency(self, measure: Type["CriMeBase"]) -> "CriMeBase":
+        """
+        Returns the evaluator of a measure that this measure depends on. If the evaluators are planned by the
+        `CriMeInterface`, the evaluator is shared with all other measures depending on it and its results are
+        computed only once per time step and vehicle. Otherwise, a private evaluator is constructed.
+
+        :param measure: type of the measure in `dependencies`
+        """
+        shared_evaluators = self._context.shared_evaluators
+        if shared_evaluators is None:
+            return measure(self.configuration)
+        if measure not in shared_evaluators:
+            evaluator = measure(self.configuration)
+            evaluator._shared = True
+            shared_evaluators[measure] = evaluator
+        return shared_evaluators[measure]
 
     def _except_obstacle_in_same_lanelet(self, expected_value: float, verbose: bool):
-        if not utils_gen.check_in_same_lanelet(
-            self.sce.lanelet_network,
-            self.ego_vehicle,
-            self.other_vehicle,
-            self.time_step,
+        if not self.lanelet_locator.share_lane_corridor(
+            self.ego_vehicle, self.other_vehicle, self.time_step
         ):
             utils_log.print_and_log_info(
                 logger,
@@ -265,49 +414,22 @@ class CriMeBase:
 
         self.time_step = time_step
 
-        if vehicle_id:
-            other_veh_ids = [vehicle_id]
-        else:
-            other_veh_ids = [
-                veh.obstacle_id
-                for veh in self.sce.obstacles
-                if veh.obstacle_id is not self.ego_vehicle.obstacle_id
-                and veh.state_at_time(self.time_step) is not None
-            ]
-
         time_start = time.time()
-        criti_list = []
-        if self.measure_name in [
-            TypeTime.TTR,
-            TypeTime.TTM,
-            TypeTime.TTB,
-            TypeTime.TTK,
-            TypeTime.TTS,
-            TypeReachableSet.DA,
-            TypePotential.PF,
-            TypeProbability.P_MC,
-        ]:
+        if not self.is_evaluated_per_vehicle():
             criti = self.compute(time_step=time_step, vehicle_id=None, verbose=verbose)
         else:
-            for v_id in other_veh_ids:
+            criti_list = []
+            partners = self.get_interaction_partners(time_step, vehicle_id)
+            for v_id in self.get_other_vehicle_ids(time_step, vehicle_id):
+                if partners is not None and v_id not in partners:
+                    criti_list.append(self.neutral_value())
+                    continue
                 criti_list.append(
                     self.compute(time_step=time_step, vehicle_id=v_id, verbose=verbose)
                 )
-            if len([c for c in criti_list if c is not None]) > 0:
-                if np.all(np.isnan(criti_list)):
-                    utils_log.print_and_log_warning(
-                        logger,
-                        f"* Due to the missing entries, all elements are NaN, "
-                        f"the result for time step {time_step} is NaN",
-                    )
-                    return np.nan
-                # Not all elements are NaN, return the max/min of the non-NaN values
-                if self.monotone == TypeMonotone.POS:
-                    criti = np.nanmax(criti_list)
-                else:
-                    criti = np.nanmin(criti_list)
-            else:
-                return None
+            criti = self.aggregate_criticality(criti_list, time_step)
+            if criti is None or np.isnan(criti):
+                return criti
         time_computation = time.time() - time_start
         utils_log.print_and_log_info(
             logger, f"*\t\t {self.measure_name} of the scenario: {criti}", verbose
@@ -317,6 +439,85 @@ class CriMeBase:
         )
         return criti
 
+    def is_evaluated_per_vehicle(self) -> bool:
+        """
+        Returns whether the measure is computed for each other vehicle and then aggregated, or once for the whole
+        scene.
+        """
+        return self.measure_name not in [
+            TypeTime.TTR,
+            TypeTime.TTM,
+            TypeTime.TTB,
+            TypeTime.TTK,
+            TypeTime.TTS,
+            TypeReachableSet.DA,
+            TypePotential.PF,
+            TypeProbability.P_MC,
+        ]
+
+    def get_other_vehicle_ids(
+        self, time_step: int, vehicle_id: Union[int, None] = None
+    ) -> List[int]:
+        """
+        Returns the ids of the other vehicles to be evaluated at the given time step.
+        """
+        if vehicle_id:
+            return [vehicle_id]
+        return [
+            veh.obstacle_id
+            for veh in self.sce.obstacles
+            if veh.obstacle_id is not self.ego_vehicle.obstacle_id
+            and veh.state_at_time(time_step) is not None
+        ]
+
+    def get_interaction_partners(
+        self, time_step: int, vehicle_id: Union[int, None] = None
+    ) -> Union[Set[int], None]:
+        """
+        Returns the ids of the vehicles that might interact with the ego vehicle within the interaction horizon of the
+        configuration, or None if all vehicles are evaluated, i.e., if no horizon is set, the vehicle is given, or the
+        measure is not pairwise.
+        """
+        horizon = self.configuration.general.interaction_horizon
+        if horizon is None or vehicle_id is not None or not self.pairwise_interaction:
+            return None
+        return self._context.interaction_index.partners(
+            self.ego_vehicle,
+            time_step,
+            int(round(horizon / self.dt)),
+            self.configuration.general.interaction_distance,
+        )
+
+    def neutral_value(self) -> float:
+        """
+        Value of the measure w.r.t. a vehicle that does not interact with the ego vehicle.
+        """
+        if self.monotone == TypeMonotone.POS:
+            return 0.0
+        return math.inf
+
+    def aggregate_criticality(
+        self, criti_list: List[float], time_step: int
+    ) -> Union[float, None]:
+        """
+        Aggregates the criticality values w.r.t. the other vehicles using the monotonicity of the measure.
+        """
+        if len([c for c in criti_list if c is not None]) > 0:
+            if np.all(np.isnan(criti_list)):
+                utils_log.print_and_log_warning(
+                    logger,
+                    f"* Due to the missing entries, all elements are NaN, "
+                    f"the result for time step {time_step} is NaN",
+                )
+                return np.nan
+            # Not all elements are NaN, return the max/min of the non-NaN values
+            if self.monotone == TypeMonotone.POS:
+                return np.nanmax(criti_list)
+            else:
+                return np.nanmin(criti_list)
+        else:
+            return None
+
     @abstractmethod
     def visualize(self):
         """
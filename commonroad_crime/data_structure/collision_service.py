@@ -0,0 +1,286 @@
+__author__ = "Yuanfei Lin"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["KoSi"]
+__version__ = "0.4.0"
+__maintainer__ = "Yuanfei Lin"
+__email__ = "commonroad@lists.lrz.de"
+__status__ = "beta"
+
+import logging
+import math
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from commonroad.geometry.shape import Rectangle, Shape
+from commonroad.prediction.prediction import TrajectoryPrediction
+from commonroad.scenario.obstacle import DynamicObstacle
+from commonroad.scenario.scenario import Scenario
+
+import commonroad_dc.boundary.boundary as boundary
+import commonroad_dc.pycrcc as pycrcc
+
+from commonroad_crime.data_structure.scene import Scene
+from commonroad_crime.data_structure.trajectory_store import (
+    StateColumn,
+    TrajectoryStore,
+)
+import commonroad_crime.utility.general as utils_gen
+
+# the collision dispatch imports matplotlib, hence it is only imported when a collision checker is built
+pycrcc_dispatch = utils_gen.lazy_import(
+    "commonroad_dc.collision.collision_detection.pycrcc_collision_dispatch"
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _CollisionWindow:
+    """
+    Collision checker with the occupancies of the dynamic obstacles within [time_begin, time_end].
+    """
+
+    __slots__ = ("time_begin", "time_end", "collision_checker", "objects")
+
+    def __init__(
+        self,
+        time_begin: int,
+        time_end: int,
+        collision_checker: pycrcc.CollisionChecker,
+        objects: Dict[int, pycrcc.TimeVariantCollisionObject],
+    ):
+        self.time_begin = time_begin
+        self.time_end = time_end
+        self.collision_checker = collision_checker
+        self.objects = objects
+
+    def contains(self, time_begin: int, time_end: int) -> bool:
+        return self.time_begin <= time_begin and time_end <= self.time_end
+
+
+class CollisionCheckerService:
+    """
+    Collision checker of a scenario shared by all measures. The road boundary is triangulated and the collision
+    objects of the static obstacles are created once. The ego vehicle is excluded per query by filtering the
+    colliding objects by its id, so that the checker does not need to be rebuilt for each ego vehicle.
+
+    Queries with time-variant collision objects, e.g., the trajectory of the ego vehicle from a time step on, are
+    checked against a windowed checker that only contains the occupancies of the dynamic obstacles within a time
+    window around the queried time steps. The window is kept while the queries fall into it and slides forward once
+    the queries have passed half of it, so that evaluating a long recording step by step neither creates the
+    occupancies of the whole recording at once nor rebuilds the checker at every time step.
+    """
+
+    def __init__(
+        self,
+        sce: Union[Scenario, Scene],
+        trajectories: Optional[TrajectoryStore] = None,
+    ):
+        """
+        :param sce: scenario or scene, which must not be modified afterward
+        :param trajectories: store of the states of the obstacles in the scenario, from which the rectangular
+            occupancies are created
+        """
+        self._sce = sce
+        self._trajectories = (
+            trajectories if trajectories is not None else TrajectoryStore()
+        )
+        # static obstacles and the road boundary are grouped as in `create_collision_checker`
+        self._static_objects = pycrcc.ShapeGroup()
+        for obs in sce.static_obstacles:
+            co = pycrcc_dispatch.create_collision_object(obs)
+            if isinstance(co, pycrcc.ShapeGroup):
+                for shape in co.unpack():
+                    self._static_objects.add_shape(shape)
+            else:
+                self._static_objects.add_shape(co)
+        road_boundary = boundary.create_road_boundary_obstacle(
+            sce,
+            method="aligned_triangulation",
+            return_scenario_obstacle=False,
+            axis=2,
+        )
+        for shape in road_boundary.unpack():
+            self._static_objects.add_shape(shape)
+        # collision objects over all time steps, which are only created for queries without time steps or drawing
+        self._dynamic_objects: Optional[Dict[int, pycrcc.CollisionObject]] = None
+        # id of the excluded obstacle: collision checker without it, e.g., for the visualization
+        self._collision_checkers: Dict[int, pycrcc.CollisionChecker] = {}
+        self._collision_checker: Optional[pycrcc.CollisionChecker] = None
+        # id of the obstacle: occupancy shapes of the obstacles whose occupancies are not rectangles
+        self._occupancy_shapes: Dict[int, List[Shape]] = {}
+        self._window: Optional[_CollisionWindow] = None
+
+    @property
+    def dynamic_objects(self) -> Dict[int, pycrcc.CollisionObject]:
+        """
+        Collision objects of the dynamic obstacles over all their time steps.
+        """
+        if self._dynamic_objects is None:
+            self._dynamic_objects = {
+                obs.obstacle_id: pycrcc_dispatch.create_collision_object(obs)
+                for obs in self._sce.dynamic_obstacles
+            }
+        return self._dynamic_objects
+
+    @property
+    def collision_checker(self) -> pycrcc.CollisionChecker:
+        """
+        Collision checker with all obstacles over all time steps and the road boundary.
+        """
+        if self._collision_checker is None:
+            self._collision_checker = self.collision_checker_without()
+        return self._collision_checker
+
+    def collision_checker_without(
+        self, obstacle_id: Union[int, None] = None
+    ) -> pycrcc.CollisionChecker:
+        """
+        Returns a collision checker with the collision objects of all obstacles except the given one and the road
+        boundary. The collision objects are shared with the other checkers.
+
+        :param obstacle_id: id of the excluded obstacle, e.g., the ego vehicle
+        """
+        if obstacle_id is not None and obstacle_id in self._collision_checkers:
+            return self._collision_checkers[obstacle_id]
+        collision_checker = pycrcc.CollisionChecker()
+        for dynamic_obstacle_id, co in self.dynamic_objects.items():
+            if dynamic_obstacle_id != obstacle_id:
+                collision_checker.add_collision_object(co)
+        collision_checker.add_collision_object(self._static_objects)
+        if obstacle_id is not None:
+            self._collision_checkers[obstacle_id] = collision_checker
+        return collision_checker
+
+    def _rectangle_objects(
+        self, obstacle: DynamicObstacle, time_begin: int, time_end: int
+    ) -> Union[List[pycrcc.CollisionObject], None]:
+        """
+        Creates the rectangular occupancies of the obstacle from its stored states as `create_collision_object`
+        does, or returns None if they cannot be read off the states.
+        """
+        shape = obstacle.obstacle_shape
+        if (
+            not isinstance(shape, Rectangle)
+            or not isinstance(obstacle.prediction, TrajectoryPrediction)
+            or obstacle.prediction.shape != shape
+            or shape.orientation != 0.0
+            or np.any(shape.center != 0.0)
+            or self._trajectories.dtype != np.float64
+        ):
+            return None
+        time_steps, states = self._trajectories.states_in_time_interval(
+            obstacle, time_begin, time_end
+        )
+        poses = states[
+            [StateColumn.POSITION_X, StateColumn.POSITION_Y, StateColumn.ORIENTATION]
+        ]
+        if len(time_steps) != time_end - time_begin + 1 or np.isnan(poses).any():
+            return None
+        half_length, half_width = 0.5 * shape.length, 0.5 * shape.width
+        return [
+            (
+                pycrcc.RectAABB(half_length, half_width, x, y)
+                if math.isclose(theta, 0.0)
+                else pycrcc.RectOBB(half_length, half_width, theta, x, y)
+            )
+            for x, y, theta in zip(*poses.tolist())
+        ]
+
+    def _occupancy_objects(
+        self, obstacle: DynamicObstacle, time_begin: int, time_end: int
+    ) -> List[pycrcc.CollisionObject]:
+        shapes = self._occupancy_shapes.get(obstacle.obstacle_id)
+        if shapes is None:
+            initial_time_step = obstacle.initial_state.time_step
+            shapes = [obstacle.occupancy_at_time(initial_time_step).shape]
+            if obstacle.prediction is not None:
+                # the occupancy set is created anew on every access, so it is only requested once
+                shapes += [occ.shape for occ in obstacle.prediction.occupancy_set]
+            self._occupancy_shapes[obstacle.obstacle_id] = shapes
+        offset = obstacle.initial_state.time_step
+        return [
+            pycrcc_dispatch.create_collision_object(shape)
+            for shape in shapes[time_begin - offset : time_end - offset + 1]
+        ]
+
+    def _window_object(
+        self, obstacle: DynamicObstacle, time_begin: int, time_end: int
+    ) -> Union[pycrcc.TimeVariantCollisionObject, None]:
+        """
+        Returns the collision object of the obstacle restricted to [time_begin, time_end], or None if the obstacle
+        does not exist within this time interval.
+        """
+        initial_time_step = obstacle.initial_state.time_step
+        final_time_step = (
+            obstacle.prediction.final_time_step
+            if obstacle.prediction is not None
+            else initial_time_step
+        )
+        time_begin = max(time_begin, initial_time_step)
+        time_end = min(time_end, final_time_step)
+        if time_begin > time_end:
+            return None
+        objects = self._rectangle_objects(obstacle, time_begin, time_end)
+        if objects is None:
+            objects = self._occupancy_objects(obstacle, time_begin, time_end)
+        tvo = pycrcc.TimeVariantCollisionObject(time_begin)
+        for co in objects:
+            tvo.append_obstacle(co)
+        return tvo
+
+    def window(self, time_begin: int, time_end: int) -> _CollisionWindow:
+        """
+        Returns a windowed collision checker that contains the occupancies of the dynamic obstacles at least within
+        [time_begin, time_end] and the static obstacles as well as the road boundary. A new window reaches as far
+        ahead of the queried time interval as the interval is long, so that the following time steps of a
+        step-by-step evaluation still fall into it.
+
+        :param time_begin: first queried time step
+        :param time_end: last queried time step (inclusive)
+        """
+        window = self._window
+        if (
+            window is not None
+            and window.contains(time_begin, time_end)
+            and 2 * (time_begin - window.time_begin)
+            <= window.time_end - window.time_begin
+        ):
+            return window
+        window_end = time_end + (time_end - time_begin + 1)
+        if window is not None:
+            window_end = max(window_end, window.time_end)
+        collision_checker = pycrcc.CollisionChecker()
+        objects = {}
+        for obs in self._sce.dynamic_obstacles:
+            co = self._window_object(obs, time_begin, window_end)
+            if co is not None:
+                collision_checker.add_collision_object(co)
+                objects[obs.obstacle_id] = co
+        collision_checker.add_collision_object(self._static_objects)
+        window = _CollisionWindow(time_begin, window_end, collision_checker, objects)
+        self._window = window
+        return window
+
+    def collide(
+        self, co: pycrcc.CollisionObject, excluded_obstacle_id: Union[int, None] = None
+    ) -> bool:
+        """
+        Checks whether the collision object collides with an obstacle other than the excluded one or with the road
+        boundary.
+
+        :param co: collision object, e.g., of the ego vehicle
+        :param excluded_obstacle_id: id of the obstacle that is ignored, e.g., the ego vehicle
+        """
+        if isinstance(co, pycrcc.TimeVariantCollisionObject):
+            window = self.window(co.time_start_idx(), co.time_end_idx())
+            collision_checker, objects = window.collision_checker, window.objects
+        else:
+            collision_checker, objects = self.collision_checker, self.dynamic_objects
+        excluded_co = objects.get(excluded_obstacle_id)
+        if excluded_co is None:
+            return collision_checker.collide(co)
+        return any(
+            colliding_co is not excluded_co
+            for colliding_co in collision_checker.find_all_colliding_objects(co)
+        )
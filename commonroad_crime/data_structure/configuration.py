@@ -21,6 +21,7 @@ from commonroad.common.solution import VehicleType
 from commonroad_dc.pycrccosy import CurvilinearCoordinateSystem
 from commonroad_dc.feasibility.vehicle_dynamics import PointMassDynamics
 from commonroad_crime.data_structure.scene import Scene
+from commonroad_crime.data_structure.scenario_context import ScenarioContext
 import commonroad_crime.utility.general as utils_general
 
 from vehiclemodels.parameters_vehicle1 import parameters_vehicle1
@@ -214,6 +215,13 @@ class GeneralConfiguration(BaseConfig):
     path_logs: str = path_root_abs + "/output/logs/"
     path_icons: str = path_root_abs + "/docs/icons/"
     name_scenario: Optional[str] = None
+    # store the trajectories of the obstacles in single precision to halve the memory
+    float32_trajectories: bool = False
+    # measures evaluated per vehicle skip the vehicles that do not come closer to the ego vehicle than the interaction
+    # distance (in m) within the interaction horizon (in s) and assign them the neutral value of the measure, e.g.,
+    # inf for TTC; None evaluates all vehicles
+    interaction_horizon: Optional[float] = None
+    interaction_distance: float = 50.0
 
     @property
     def path_scenario(self):
@@ -409,6 +417,32 @@ class CriMeConfiguration(BaseConfig):
     def __post_init__(self):
         self.scenario: Optional[Scenario] = None
         self.scene: Optional[Scene] = None
+        self._scenario_context: Optional[ScenarioContext] = None
+
+    @property
+    def scenario_context(self) -> Optional[ScenarioContext]:
+        """
+        Read-only context of the scenario/scene shared by all measures using this configuration. It is rebuilt
+        whenever the scenario/scene is updated.
+        """
+        sce = self.scenario if self.scenario else self.scene
+        if sce is None:
+            return None
+        if (
+            self._scenario_context is None
+            or self._scenario_context.source is not sce
+            or self._scenario_context.float32 != self.general.float32_trajectories
+        ):
+            self._scenario_context = ScenarioContext(
+                sce, self.general.float32_trajectories
+            )
+        return self._scenario_context
+
+    def __getstate__(self):
+        # the context is rebuilt lazily and does not need to be transferred, e.g., to worker processes
+        state = self.__dict__.copy()
+        state["_scenario_context"] = None
+        return state
 
     def update(
         self,
@@ -426,6 +460,9 @@ class CriMeConfiguration(BaseConfig):
         4. scenario + clcs
         5. scene + clcs
         """
+        if sce is not None:
+            # the scenario/scene might have been modified in place
+            self._scenario_context = None
         if isinstance(sce, Scene):
             self.scene = sce
             self.general.name_scenario = str(sce.scenario_id)
@@ -0,0 +1,98 @@
+__author__ = "Yuanfei Lin"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["KoSi"]
+__version__ = "0.4.0"
+__maintainer__ = "Yuanfei Lin"
+__email__ = "commonroad@lists.lrz.de"
+__status__ = "beta"
+
+import logging
+import math
+from typing import Dict, Tuple, Union
+
+import numpy as np
+import shapely
+from shapely.geometry import Polygon as ShapelyPolygon
+
+from commonroad.scenario.obstacle import DynamicObstacle
+
+import commonroad_crime.utility.general as utils_gen
+
+logger = logging.getLogger(__name__)
+
+
+class ConflictAreaTiming:
+    """
+    Times at which the vehicles enter and exit the conflict areas. The occupancy polygons of a vehicle are collected
+    once for all its time steps, and whether they intersect a conflict area is evaluated with one vectorized shapely
+    predicate and stored per pair of vehicle and conflict area. The enter and exit times for any time step are then
+    read off the stored flags. As for the :class:`TrajectoryStore`, the vehicles and conflict areas are identified by
+    object and must not be modified afterward.
+    """
+
+    def __init__(self):
+        # id of the vehicle: (vehicle, initial time step, occupancy polygons)
+        self._occupancies: Dict[int, Tuple[DynamicObstacle, int, np.ndarray]] = {}
+        # (id of the vehicle, id of the conflict area): (vehicle, conflict area, intersection flags)
+        self._flags: Dict[
+            Tuple[int, int], Tuple[DynamicObstacle, ShapelyPolygon, np.ndarray]
+        ] = {}
+
+    def __len__(self):
+        return len(self._flags)
+
+    def occupancies(self, vehicle: DynamicObstacle) -> Tuple[int, np.ndarray]:
+        """
+        Returns the initial time step of the vehicle and its occupancy polygons from this time step up to the last
+        state of its trajectory.
+
+        :param vehicle: dynamic obstacle with a trajectory prediction
+        """
+        entry = self._occupancies.get(id(vehicle))
+        if entry is None or entry[0] is not vehicle:
+            time_steps, polygons = utils_gen.obtain_occupancy_polygons(vehicle)
+            entry = (vehicle, int(time_steps[0]), polygons)
+            self._occupancies[id(vehicle)] = entry
+        return entry[1], entry[2]
+
+    def _intersection_flags(
+        self, vehicle: DynamicObstacle, ca: ShapelyPolygon
+    ) -> Tuple[int, np.ndarray]:
+        initial_time_step, polygons = self.occupancies(vehicle)
+        key = (id(vehicle), id(ca))
+        entry = self._flags.get(key)
+        if entry is None or entry[0] is not vehicle or entry[1] is not ca:
+            shapely.prepare(ca)
+            entry = (vehicle, ca, shapely.intersects(polygons, ca))
+            self._flags[key] = entry
+        return initial_time_step, entry[2]
+
+    def time_info(
+        self, vehicle: DynamicObstacle, time_step: int, ca: Union[ShapelyPolygon, None]
+    ) -> Tuple[Union[int, float], Union[int, float], Union[int, float]]:
+        """
+        Returns the duration of the vehicle within the conflict area as well as its enter and exit time when
+        starting at the time step. The enter time is the time step before the first occupancy intersecting the
+        conflict area and the exit time is the time step of the first occupancy afterward that does not intersect
+        it. Unknown times are math.inf.
+
+        :param vehicle: dynamic obstacle with a trajectory prediction
+        :param time_step: time step from which the conflict area is checked
+        :param ca: conflict area
+        """
+        if ca is None:
+            return math.inf, math.inf, math.inf
+        initial_time_step, flags = self._intersection_flags(vehicle, ca)
+        # the occupancies are checked up to the time step len(state_list) - 1
+        time_end = len(vehicle.prediction.trajectory.state_list)
+        flags = flags[time_step - initial_time_step : time_end - initial_time_step]
+        inside = np.flatnonzero(flags)
+        if len(inside) == 0:
+            return math.inf, math.inf, math.inf
+        enter_index = int(inside[0])
+        enter_time = max(time_step + enter_index - 1, 0)
+        outside = np.flatnonzero(~flags[enter_index:])
+        if len(outside) == 0:
+            return math.inf, enter_time, math.inf
+        exit_time = time_step + enter_index + int(outside[0])
+        return exit_time - enter_time, enter_time, exit_time
@@ -7,8 +7,11 @@ __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
 import os
+import copy
 import logging
-from typing import List, Type
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Type, Union
 from lxml import etree
 
 from commonroad_crime.data_structure.base import CriMeBase
@@ -18,6 +21,46 @@ import commonroad_crime.utility.logger as utils_log
 logger = logging.getLogger(__name__)
 
 
+def sort_by_dependencies(measures: List[Type[CriMeBase]]) -> List[Type[CriMeBase]]:
+    """
+    Sorts the measures topologically such that each measure is preceded by the given measures it (transitively)
+    depends on.
+
+    :param measures: types of the measures
+    """
+    order = []
+
+    def visit(measure: Type[CriMeBase]):
+        if measure in order:
+            return
+        for dependency in measure.dependencies:
+            visit(dependency)
+        order.append(measure)
+
+    for m in measures:
+        visit(m)
+    return [m for m in order if m in measures]
+
+
+def _evaluate_time_steps(
+    config: CriMeConfiguration,
+    measures: List[Type[CriMeBase]],
+    time_steps: List[int],
+    vehicle_id: Union[int, None],
+    verbose: bool,
+) -> Dict[int, Dict[str, float]]:
+    """
+    Evaluates the measures at the given time steps with evaluators that are constructed once, e.g., in a worker
+    process of `CriMeInterface.evaluate_scenario`.
+    """
+    crime_interface = CriMeInterface(config)
+    for time_step in time_steps:
+        crime_interface.evaluate_scene(
+            measures, time_step, vehicle_id, verbose=verbose, reuse_evaluators=True
+        )
+    return crime_interface.criticality_dict
+
+
 class CriMeInterface:
     """
     Interface for Criticality Measures
@@ -30,6 +73,116 @@ class CriMeInterface:
         self.time_end = 0
         self.measures = []
         self.measure_evaluators = []
+        # evaluators shared by the planned measures and their dependencies, see `_plan_evaluators`
+        self._shared_evaluators: Dict[Type[CriMeBase], CriMeBase] = dict()
+        self._reuse_evaluators = False
+
+    def _plan_evaluators(
+        self, measures: List[Type[CriMeBase]], reuse: bool
+    ) -> List[CriMeBase]:
+        """
+        Constructs the evaluators of the given measures in the topological order of their dependencies. The
+        evaluators of the measures and of their dependencies are shared, so that each sub-measure is computed only
+        once per time step and vehicle. If reused, the evaluators are only constructed once for the ego vehicle and
+        the scenario/scene in the configuration and reset before each evaluation.
+
+        :param measures: types of the measures
+        :param reuse: whether the evaluators of a previous time step can be reused
+        """
+        self._reuse_evaluators = reuse
+        context = self.config.scenario_context
+        # the evaluators (and the CLCS in the configuration) are only valid for the same ego vehicle and scenario
+        if not reuse or any(
+            m_evaluator.ego_vehicle.obstacle_id != self.config.vehicle.ego_id
+            or m_evaluator._context is not context
+            for m_evaluator in self._shared_evaluators.values()
+        ):
+            self._shared_evaluators = dict()
+        evaluators = []
+        context.shared_evaluators = self._shared_evaluators
+        try:
+            for measure in sort_by_dependencies(measures):
+                if measure not in self._shared_evaluators:
+                    m_evaluator = measure(self.config)
+                    m_evaluator._shared = True
+                    self._shared_evaluators[measure] = m_evaluator
+                m_evaluator = self._shared_evaluators[measure]
+                if not any(m_evaluator is evl for evl in self.measure_evaluators):
+                    self.measure_evaluators.append(m_evaluator)
+                evaluators.append(m_evaluator)
+        finally:
+            context.shared_evaluators = None
+        for m_evaluator in self._shared_evaluators.values():
+            m_evaluator.reset()
+        return evaluators
+
+    @staticmethod
+    def _compute_planned_criticality(
+        evaluators: List[CriMeBase],
+        time_step: int,
+        vehicle_id: Union[int, None],
+        verbose: bool,
+    ) -> Dict[CriMeBase, Union[float, None]]:
+        """
+        Computes the criticality of the planned evaluators. The measures evaluated per vehicle are computed vehicle by
+        vehicle in the planned order, such that the shared dependencies are computed once for all consumers.
+        """
+        criticality = dict()
+        evaluators_per_vehicle = []
+        for m_evaluator in evaluators:
+            if m_evaluator.is_evaluated_per_vehicle():
+                evaluators_per_vehicle.append(m_evaluator)
+            else:
+                criticality[m_evaluator] = m_evaluator.compute_criticality(
+                    time_step, vehicle_id, verbose=verbose
+                )
+        if (
+            len(evaluators_per_vehicle) < 2
+            or evaluators_per_vehicle[0].ego_vehicle.state_at_time(time_step) is None
+        ):
+            for m_evaluator in evaluators_per_vehicle:
+                criticality[m_evaluator] = m_evaluator.compute_criticality(
+                    time_step, vehicle_id, verbose=verbose
+                )
+            return criticality
+        criti_lists = {m_evaluator: [] for m_evaluator in evaluators_per_vehicle}
+        for m_evaluator in evaluators_per_vehicle:
+            m_evaluator.time_step = time_step
+        # the interaction partners are shared by the pairwise measures
+        partners = next(
+            (
+                m_evaluator.get_interaction_partners(time_step, vehicle_id)
+                for m_evaluator in evaluators_per_vehicle
+                if m_evaluator.pairwise_interaction
+            ),
+            None,
+        )
+        for v_id in evaluators_per_vehicle[0].get_other_vehicle_ids(
+            time_step, vehicle_id
+        ):
+            for m_evaluator in evaluators_per_vehicle:
+                if (
+                    m_evaluator.pairwise_interaction
+                    and partners is not None
+                    and v_id not in partners
+                ):
+                    criti_lists[m_evaluator].append(m_evaluator.neutral_value())
+                    continue
+                criti_lists[m_evaluator].append(
+                    m_evaluator.compute(
+                        time_step=time_step, vehicle_id=v_id, verbose=verbose
+                    )
+                )
+        for m_evaluator in evaluators_per_vehicle:
+            criticality[m_evaluator] = m_evaluator.aggregate_criticality(
+                criti_lists[m_evaluator], time_step
+            )
+            utils_log.print_and_log_info(
+                logger,
+                f"*\t\t {m_evaluator.measure_name} of the scenario: {criticality[m_evaluator]}",
+                verbose,
+            )
+        return criticality
 
     def evaluate_scene(
         self,
@@ -37,9 +190,12 @@ class CriMeInterface:
         time_step: int = 0,
         vehicle_id: int = None,
         verbose: bool = True,
+        reuse_evaluators: bool = False,
     ):
         """
         Evaluate the criticality of given measures
+
+        :param reuse_evaluators: whether the evaluators constructed at previous time steps are reused
         """
         utils_log.print_and_log_info(
             logger,
@@ -52,14 +208,27 @@ class CriMeInterface:
         for measure in measures:
             if measure not in self.measures:
                 self.measures.append(measure)
-            m_evaluator = measure(self.config)
-            if measure.measure_name.value not in self.criticality_dict[time_step]:
+        measures = [
+            measure
+            for measure in measures
+            if measure.measure_name.value not in self.criticality_dict[time_step]
+        ]
+        if measures:
+            criticality = self._compute_planned_criticality(
+                self._plan_evaluators(measures, reuse_evaluators),
+                time_step,
+                vehicle_id,
+                verbose,
+            )
+            criticality = {
+                m_evaluator.measure_name.value: value
+                for m_evaluator, value in criticality.items()
+            }
+            # the results are stored in the order of the given measures
+            for measure in measures:
                 self.criticality_dict[time_step][measure.measure_name.value] = (
-                    m_evaluator.compute_criticality(
-                        time_step, vehicle_id, verbose=verbose
-                    )
+                    criticality[measure.measure_name.value]
                 )
-                self.measure_evaluators.append(m_evaluator)
         # printing out the summary of the evaluations
         utils_log.print_and_log_info(
             logger, "*********************************", verbose
@@ -81,7 +250,20 @@ class CriMeInterface:
         time_end: int = 1,
         vehicle_id: int = None,
         verbose: bool = True,
+        reuse_evaluators: bool = True,
+        n_workers: int = 1,
+        executor: Optional[Executor] = None,
     ):
+        """
+        Evaluate the criticality of given measures over the time interval.
+
+        :param reuse_evaluators: whether each measure is constructed only once and reused for all time steps
+        :param n_workers: number of worker processes among which the time steps are split into consecutive chunks;
+            the results are identical to the serial evaluation, but the evaluators remain in the workers and are
+            therefore not available for `visualize`
+        :param executor: executor, e.g., a `ProcessPoolExecutor` or a cluster client, to which the `n_workers`
+            chunks are submitted instead of a process pool created for this call
+        """
         # Check if time_start is larger than time_end
         if time_start > time_end:
             utils_log.print_and_log_error(
@@ -102,8 +284,24 @@ class CriMeInterface:
             time_start,
             time_end,
         )
-        for time_step in range(time_start, time_end + 1):
-            self.evaluate_scene(measures, time_step, vehicle_id, verbose=verbose)
+        if n_workers > 1 or executor is not None:
+            self._evaluate_in_parallel(
+                measures,
+                list(range(time_start, time_end + 1)),
+                vehicle_id,
+                verbose,
+                n_workers,
+                executor,
+            )
+        else:
+            for time_step in range(time_start, time_end + 1):
+                self.evaluate_scene(
+                    measures,
+                    time_step,
+                    vehicle_id,
+                    verbose=verbose,
+                    reuse_evaluators=reuse_evaluators,
+                )
         # printing out the summary of the evaluations
         utils_log.print_and_log_info(
             logger, "*********************************", verbose
@@ -120,6 +318,76 @@ class CriMeInterface:
                 verbose,
             )
 
+    def _evaluate_in_parallel(
+        self,
+        measures: List[Type[CriMeBase]],
+        time_steps: List[int],
+        vehicle_id: Union[int, None],
+        verbose: bool,
+        n_workers: int,
+        executor: Optional[Executor],
+    ):
+        """
+        Splits the time steps that have not been evaluated yet into consecutive chunks, evaluates them in parallel,
+        and merges the results in the order of the time steps and the given measures, i.e., as `evaluate_scene`
+        would have stored them.
+        """
+        for measure in measures:
+            if measure not in self.measures:
+                self.measures.append(measure)
+        pending = [
+            time_step
+            for time_step in time_steps
+            if any(
+                measure.measure_name.value
+                not in self.criticality_dict.get(time_step, {})
+                for measure in measures
+            )
+        ]
+        if not pending:
+            return
+        n_chunks = max(min(n_workers, len(pending)), 1)
+        chunk_size = -(-len(pending) // n_chunks)
+        chunks = [
+            pending[i : i + chunk_size] for i in range(0, len(pending), chunk_size)
+        ]
+        utils_log.print_and_log_info(
+            logger,
+            f"* Evaluating {len(pending)} time steps in {len(chunks)} chunks...",
+            verbose,
+        )
+        own_executor = executor is None
+        if own_executor:
+            # forked workers may deadlock on the locks of the native thread pools of the parent process
+            executor = ProcessPoolExecutor(
+                max_workers=len(chunks), mp_context=multiprocessing.get_context("spawn")
+            )
+        try:
+            # each chunk receives its own copy of the configuration, which is shared otherwise, e.g., by threads
+            futures = [
+                executor.submit(
+                    _evaluate_time_steps,
+                    copy.deepcopy(self.config),
+                    measures,
+                    chunk,
+                    vehicle_id,
+                    verbose,
+                )
+                for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+        finally:
+            if own_executor:
+                executor.shutdown()
+        for chunk, criticality_dict in zip(chunks, results):
+            for time_step in chunk:
+                criticality = self.criticality_dict.setdefault(time_step, {})
+                for measure in measures:
+                    if measure.measure_name.value not in criticality:
+                        criticality[measure.measure_name.value] = criticality_dict[
+                            time_step
+                        ][measure.measure_name.value]
+
     def visualize(self, time_step: int = None):
         self.config.debug.draw_visualization = True
         for m_evaluator in self.measure_evaluators:
@@ -128,6 +396,13 @@ class CriMeInterface:
             else:
                 if m_evaluator.time_step == time_step:
                     m_evaluator.visualize()
+                elif self._reuse_evaluators and any(
+                    m_evaluator is evl for evl in self._shared_evaluators.values()
+                ):
+                    # reused evaluators only keep the results of the last time step
+                    m_evaluator.reset()
+                    m_evaluator.compute_criticality(time_step, verbose=False)
+                    m_evaluator.visualize()
 
     def save_to_file(self, output_dir: str):
         """
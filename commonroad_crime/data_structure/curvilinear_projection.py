@@ -0,0 +1,119 @@
+__author__ = "Yuanfei Lin"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["KoSi"]
+__version__ = "0.4.0"
+__maintainer__ = "Yuanfei Lin"
+__email__ = "commonroad@lists.lrz.de"
+__status__ = "beta"
+
+import logging
+from typing import Dict, Tuple, Union
+
+import numpy as np
+
+from commonroad.scenario.obstacle import Obstacle, DynamicObstacle
+from commonroad_dc.pycrccosy import CurvilinearCoordinateSystem
+
+from commonroad_crime.data_structure.trajectory_store import (
+    TrajectoryStore,
+    StateColumn,
+)
+import commonroad_crime.utility.solver as utils_sol
+
+logger = logging.getLogger(__name__)
+
+
+class CurvilinearProjection:
+    """
+    Curvilinear coordinates of the trajectories of the obstacles in a CLCS. The positions of an obstacle at all its
+    time steps are converted in one call the first time they are requested, so that, e.g., the headway at different
+    time steps only needs to look up the stored coordinates. Positions outside the projection domain are NaN.
+
+    As for the :class:`TrajectoryStore`, the obstacles are identified by object.
+    """
+
+    def __init__(
+        self, clcs: CurvilinearCoordinateSystem, trajectories: TrajectoryStore
+    ):
+        """
+        :param clcs: curvilinear coordinate system
+        :param trajectories: store of the obstacle states
+        """
+        self.clcs = clcs
+        self._trajectories = trajectories
+        # (id of the obstacle, offset): (obstacle, time steps, coordinates of shape (2, n))
+        self._coordinates: Dict[
+            Tuple[int, float], Tuple[Obstacle, np.ndarray, np.ndarray]
+        ] = {}
+
+    def __len__(self):
+        return len(self._coordinates)
+
+    def coordinates(
+        self, obstacle: Obstacle, offset: float = 0.0
+    ) -> Tuple[Union[np.ndarray, None], np.ndarray]:
+        """
+        Returns the time steps of the obstacle and the curvilinear coordinates (s, d) of its positions as an array of
+        shape (2, n). For obstacles without a time step, e.g., static obstacles, the time steps are None and the
+        coordinates are valid at all time steps.
+
+        :param obstacle: obstacle of the scenario
+        :param offset: offset added to both Cartesian coordinates of the positions before the conversion
+        """
+        key = (id(obstacle), offset)
+        entry = self._coordinates.get(key)
+        if entry is None or entry[0] is not obstacle:
+            if isinstance(obstacle, DynamicObstacle) and obstacle.prediction:
+                time_steps, states = self._trajectories.states_in_time_interval(
+                    obstacle,
+                    obstacle.initial_state.time_step,
+                    obstacle.prediction.final_time_step,
+                )
+                positions = states[StateColumn.POSITION]
+            else:
+                time_steps = None
+                positions = self._trajectories.position(obstacle, 0).reshape(2, 1)
+            coordinates = utils_sol.convert_to_curvilinear_coords_batch(
+                self.clcs, positions.T.astype(float) + offset
+            ).T
+            entry = (obstacle, time_steps, coordinates)
+            self._coordinates[key] = entry
+        return entry[1], entry[2]
+
+    def coordinates_at(
+        self, obstacle: Obstacle, time_step: int, offset: float = 0.0
+    ) -> Union[np.ndarray, None]:
+        """
+        Returns the curvilinear coordinates (s, d) of the obstacle at the time step or None if the obstacle has no
+        state at this time step.
+
+        :param obstacle: obstacle of the scenario
+        :param time_step: time step
+        :param offset: offset added to both Cartesian coordinates of the position before the conversion
+        """
+        time_steps, coordinates = self.coordinates(obstacle, offset)
+        if time_steps is None:
+            return coordinates[:, 0]
+        index = np.searchsorted(time_steps, time_step)
+        if index < len(time_steps) and time_steps[index] == time_step:
+            return coordinates[:, index]
+        return None
+
+    def coordinates_in_time_interval(
+        self, obstacle: Obstacle, time_begin: int, time_end: int, offset: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the time steps within [time_begin, time_end] at which the obstacle has a state and the corresponding
+        curvilinear coordinates as an array of shape (2, n).
+
+        :param obstacle: obstacle of the scenario
+        :param time_begin: first time step
+        :param time_end: last time step (inclusive)
+        :param offset: offset added to both Cartesian coordinates of the positions before the conversion
+        """
+        time_steps, coordinates = self.coordinates(obstacle, offset)
+        if time_steps is None:
+            time_steps = np.arange(time_begin, time_end + 1)
+            return time_steps, np.repeat(coordinates, len(time_steps), axis=1)
+        begin, end = np.searchsorted(time_steps, [time_begin, time_end + 1])
+        return time_steps[begin:end], coordinates[:, begin:end]
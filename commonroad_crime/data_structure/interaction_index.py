@@ -0,0 +1,131 @@
+__author__ = "Yuanfei Lin"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["KoSi"]
+__version__ = "0.4.0"
+__maintainer__ = "Yuanfei Lin"
+__email__ = "commonroad@lists.lrz.de"
+__status__ = "beta"
+
+import logging
+import math
+from typing import Dict, List, Set, Tuple, Union
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from commonroad.geometry.shape import Circle, Polygon, Rectangle, Shape
+from commonroad.scenario.obstacle import Obstacle
+from commonroad.scenario.scenario import Scenario
+
+from commonroad_crime.data_structure.scene import Scene
+from commonroad_crime.data_structure.trajectory_store import TrajectoryStore
+
+logger = logging.getLogger(__name__)
+
+
+def _circumradius(shape: Shape) -> float:
+    """
+    Radius of the circle around the reference point that encloses the shape.
+    """
+    if isinstance(shape, Rectangle):
+        return math.hypot(shape.length, shape.width) / 2
+    if isinstance(shape, Circle):
+        return shape.radius
+    if isinstance(shape, Polygon):
+        return float(np.max(np.linalg.norm(shape.vertices, axis=1)))
+    # unknown extent, e.g., shape groups
+    return math.inf
+
+
+class InteractionIndex:
+    """
+    Spatio-temporal index of the obstacle positions for finding the vehicles that can interact with the ego vehicle.
+    For each time step, a KD-tree over the positions of all obstacles with a state is built when it is first needed.
+
+    A vehicle is a candidate interaction partner if the distance between the shapes of the ego vehicle and the vehicle
+    falls below the interaction distance at any time step within the horizon. The distance between the shapes is
+    under-approximated using the circumcircles, so that no interacting vehicle is missed. Obstacles whose position
+    or extent is unknown, e.g., with set-based predictions, are always candidates.
+    """
+
+    def __init__(self, sce: Union[Scenario, Scene], trajectories: TrajectoryStore):
+        """
+        :param sce: scenario or scene
+        :param trajectories: store of the obstacle states
+        """
+        self._obstacles: List[Obstacle] = list(sce.obstacles)
+        self._trajectories = trajectories
+        self._radii = {
+            obstacle.obstacle_id: _circumradius(obstacle.obstacle_shape)
+            for obstacle in self._obstacles
+        }
+        finite_radii = [r for r in self._radii.values() if math.isfinite(r)]
+        self._max_radius = max(finite_radii, default=0.0)
+        self._always_candidates = {
+            obstacle_id
+            for obstacle_id, radius in self._radii.items()
+            if not math.isfinite(radius)
+        }
+        self._trees: Dict[int, Tuple[Union[cKDTree, None], List[int]]] = {}
+
+    def _tree(self, time_step: int) -> Tuple[Union[cKDTree, None], List[int]]:
+        if time_step not in self._trees:
+            positions = []
+            obstacle_ids = []
+            for obstacle in self._obstacles:
+                if obstacle.obstacle_id in self._always_candidates:
+                    continue
+                position = self._trajectories.position(obstacle, time_step)
+                if position is None:
+                    if obstacle.state_at_time(time_step) is not None:
+                        # the state is uncertain
+                        self._always_candidates.add(obstacle.obstacle_id)
+                    continue
+                if np.isnan(position).any():
+                    self._always_candidates.add(obstacle.obstacle_id)
+                    continue
+                positions.append(position)
+                obstacle_ids.append(obstacle.obstacle_id)
+            tree = cKDTree(np.array(positions)) if positions else None
+            self._trees[time_step] = (tree, obstacle_ids)
+        return self._trees[time_step]
+
+    def partners(
+        self,
+        ego_vehicle: Obstacle,
+        time_step: int,
+        horizon: int,
+        distance: float,
+    ) -> Set[int]:
+        """
+        Returns the ids of the candidate interaction partners of the ego vehicle.
+
+        :param ego_vehicle: ego vehicle
+        :param time_step: first time step
+        :param horizon: number of time steps after the first time step to be considered
+        :param distance: interaction distance between the shapes of the vehicles
+        """
+        candidates = set()
+        ego_radius = _circumradius(ego_vehicle.obstacle_shape)
+        radius = distance + ego_radius + self._max_radius
+        for ts in range(time_step, time_step + horizon + 1):
+            ego_position = self._trajectories.position(ego_vehicle, ts)
+            if ego_position is None:
+                continue
+            tree, obstacle_ids = self._tree(ts)
+            if tree is None:
+                continue
+            if not math.isfinite(radius) or np.isnan(ego_position).any():
+                candidates.update(obstacle_ids)
+                continue
+            for index in tree.query_ball_point(ego_position, radius):
+                obstacle_id = obstacle_ids[index]
+                # the query uses the largest obstacle, hence the distance is checked with the actual extent
+                if (
+                    np.linalg.norm(tree.data[index] - ego_position)
+                    <= distance + ego_radius + self._radii[obstacle_id]
+                ):
+                    candidates.add(obstacle_id)
+        candidates.update(self._always_candidates)
+        candidates.discard(ego_vehicle.obstacle_id)
+        return candidates
@@ -0,0 +1,246 @@
+__author__ = "Yuanfei Lin"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["KoSi"]
+__version__ = "0.4.0"
+__maintainer__ = "Yuanfei Lin"
+__email__ = "commonroad@lists.lrz.de"
+__status__ = "beta"
+
+import logging
+from typing import Dict, FrozenSet, List, Sequence, Tuple, Union
+
+import numpy as np
+import shapely
+from shapely import STRtree
+
+from commonroad.scenario.lanelet import LaneletNetwork
+from commonroad.scenario.obstacle import Obstacle, DynamicObstacle
+
+from commonroad_crime.data_structure.trajectory_store import (
+    TrajectoryStore,
+    StateColumn,
+)
+import commonroad_crime.utility.general as utils_gen
+
+logger = logging.getLogger(__name__)
+
+# tolerance of `LaneletNetwork.find_lanelet_by_position`
+_TOLERANCE = 1.0e-15
+
+
+class LaneletLocator:
+    """
+    Point-location index of the lanelets. The positions are located with one query of an STRtree over the lanelet
+    polygons, which yields the same lanelets in the same order as `LaneletNetwork.find_lanelet_by_position`.
+
+    In addition, the lanelets occupied by the positions of an obstacle at all its time steps are located in one query
+    the first time they are requested and stored per obstacle. The same holds for the lane corridors of the obstacles,
+    i.e., the lanelets intersecting their occupancies together with the predecessors and successors of these lanelets,
+    from which the relations between the obstacles are derived by set intersections. As for the
+    :class:`TrajectoryStore`, the obstacles are identified by object.
+    """
+
+    def __init__(self, lanelet_network: LaneletNetwork, trajectories: TrajectoryStore):
+        """
+        :param lanelet_network: lanelet network, which must not be modified afterward
+        :param trajectories: store of the obstacle states
+        """
+        self._lanelet_ids = np.array(
+            [lanelet.lanelet_id for lanelet in lanelet_network.lanelets], dtype=int
+        )
+        self._tree = STRtree(
+            [lanelet.polygon.shapely_object for lanelet in lanelet_network.lanelets]
+        )
+        self._trajectories = trajectories
+        # id of the lanelet: ids of the lanelet, its predecessors and its successors
+        self._corridor_lanelet_ids: Dict[int, Tuple[int, ...]] = {
+            lanelet.lanelet_id: (
+                lanelet.lanelet_id,
+                *lanelet.predecessor,
+                *lanelet.successor,
+            )
+            for lanelet in lanelet_network.lanelets
+        }
+        # id of the obstacle: (obstacle, time steps, lanelet ids at the time steps)
+        self._assignments: Dict[
+            int, Tuple[Obstacle, Union[np.ndarray, None], List[Tuple[int, ...]]]
+        ] = {}
+        # id of the obstacle: (obstacle, time steps, lane corridors at the time steps)
+        self._corridors: Dict[
+            int, Tuple[Obstacle, Union[np.ndarray, None], List[FrozenSet[int]]]
+        ] = {}
+
+    def __len__(self):
+        return len(self._assignments)
+
+    def find_lanelet_by_position(
+        self, positions: Union[Sequence[np.ndarray], np.ndarray]
+    ) -> List[Tuple[int, ...]]:
+        """
+        Returns the ids of the lanelets containing each of the positions. A position outside the lanelet network is
+        assigned an empty tuple.
+
+        :param positions: positions of shape (n, 2)
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        lanelet_ids = [[] for _ in range(len(positions))]
+        if len(positions) and len(self._lanelet_ids):
+            position_indices, geometry_indices = self._tree.query(
+                shapely.points(positions), predicate="dwithin", distance=_TOLERANCE
+            )
+            for position_index, lanelet_id in zip(
+                position_indices.tolist(), self._lanelet_ids[geometry_indices].tolist()
+            ):
+                lanelet_ids[position_index].append(lanelet_id)
+        return [tuple(ids) for ids in lanelet_ids]
+
+    def _assignment(
+        self, obstacle: Obstacle
+    ) -> Tuple[Union[np.ndarray, None], List[Tuple[int, ...]]]:
+        entry = self._assignments.get(id(obstacle))
+        if entry is None or entry[0] is not obstacle:
+            if isinstance(obstacle, DynamicObstacle) and obstacle.prediction:
+                time_steps, states = self._trajectories.states_in_time_interval(
+                    obstacle,
+                    obstacle.initial_state.time_step,
+                    obstacle.prediction.final_time_step,
+                )
+                positions = states[StateColumn.POSITION].T
+            else:
+                time_steps = None
+                positions = self._trajectories.position(obstacle, 0).reshape(1, 2)
+            entry = (obstacle, time_steps, self.find_lanelet_by_position(positions))
+            self._assignments[id(obstacle)] = entry
+        return entry[1], entry[2]
+
+    def lanelet_ids_at(
+        self, obstacle: Obstacle, time_step: int
+    ) -> Union[Tuple[int, ...], None]:
+        """
+        Returns the ids of the lanelets containing the position of the obstacle at the time step or None if the
+        obstacle has no state at this time step.
+
+        :param obstacle: obstacle of the scenario
+        :param time_step: time step
+        """
+        time_steps, lanelet_ids = self._assignment(obstacle)
+        if time_steps is None:
+            return lanelet_ids[0]
+        index = np.searchsorted(time_steps, time_step)
+        if index < len(time_steps) and time_steps[index] == time_step:
+            return lanelet_ids[index]
+        return None
+
+    def lanelet_ids_in_time_interval(
+        self, obstacle: Obstacle, time_begin: int, time_end: int
+    ) -> Tuple[np.ndarray, List[Tuple[int, ...]]]:
+        """
+        Returns the time steps within [time_begin, time_end] at which the obstacle has a state and the ids of the
+        lanelets containing its positions at these time steps.
+
+        :param obstacle: obstacle of the scenario
+        :param time_begin: first time step
+        :param time_end: last time step (inclusive)
+        """
+        time_steps, lanelet_ids = self._assignment(obstacle)
+        if time_steps is None:
+            time_steps = np.arange(time_begin, time_end + 1)
+            return time_steps, lanelet_ids * len(time_steps)
+        begin, end = np.searchsorted(time_steps, [time_begin, time_end + 1])
+        return time_steps[begin:end], lanelet_ids[begin:end]
+
+    def _corridor_assignment(
+        self, obstacle: Obstacle
+    ) -> Tuple[Union[np.ndarray, None], List[FrozenSet[int]]]:
+        entry = self._corridors.get(id(obstacle))
+        if entry is None or entry[0] is not obstacle:
+            time_steps, polygons = utils_gen.obtain_occupancy_polygons(obstacle)
+            corridors = [set() for _ in range(len(polygons))]
+            if len(self._lanelet_ids):
+                polygon_indices, geometry_indices = self._tree.query(
+                    polygons, predicate="intersects"
+                )
+                for polygon_index, lanelet_id in zip(
+                    polygon_indices.tolist(),
+                    self._lanelet_ids[geometry_indices].tolist(),
+                ):
+                    corridors[polygon_index].update(
+                        self._corridor_lanelet_ids[lanelet_id]
+                    )
+            entry = (obstacle, time_steps, [frozenset(ids) for ids in corridors])
+            self._corridors[id(obstacle)] = entry
+        return entry[1], entry[2]
+
+    def lane_corridor_at(self, obstacle: Obstacle, time_step: int) -> FrozenSet[int]:
+        """
+        Returns the ids of the lanelets intersecting the occupancy of the obstacle at the time step together with
+        their predecessors and successors. The lane corridor is empty if the obstacle has no occupancy at this time
+        step.
+
+        :param obstacle: obstacle of the scenario
+        :param time_step: time step
+        """
+        time_steps, corridors = self._corridor_assignment(obstacle)
+        if time_steps is None:
+            return corridors[0]
+        index = time_step - time_steps[0]
+        if 0 <= index < len(time_steps):
+            return corridors[index]
+        return frozenset()
+
+    def share_lane_corridor(
+        self, obstacle_a: Obstacle, obstacle_b: Obstacle, time_step: int
+    ) -> bool:
+        """
+        Checks whether the lane corridors of the two obstacles overlap at the time step, which is the same as
+        `utils_gen.check_in_same_lanelet`.
+
+        :param obstacle_a: first obstacle
+        :param obstacle_b: second obstacle
+        :param time_step: time step
+        """
+        return not self.lane_corridor_at(obstacle_a, time_step).isdisjoint(
+            self.lane_corridor_at(obstacle_b, time_step)
+        )
+
+    def lane_corridor_relation(
+        self, obstacles: Sequence[Obstacle], time_step: int
+    ) -> np.ndarray:
+        """
+        Returns the matrix of shape (n, n) whose entry (i, j) is True if the lane corridors of the obstacles i and j
+        overlap at the time step.
+
+        :param obstacles: obstacles of the scenario
+        :param time_step: time step
+        """
+        corridors = [
+            self.lane_corridor_at(obstacle, time_step) for obstacle in obstacles
+        ]
+        lanelet_indices = {
+            lanelet_id: index
+            for index, lanelet_id in enumerate(sorted(frozenset().union(*corridors)))
+        }
+        incidence = np.zeros((len(corridors), len(lanelet_indices)), dtype=int)
+        for row, corridor in enumerate(corridors):
+            incidence[row, [lanelet_indices[lanelet_id] for lanelet_id in corridor]] = 1
+        return incidence @ incidence.T > 0
+
+    def leader_follower_relation(
+        self,
+        obstacles: Sequence[Obstacle],
+        time_step: int,
+        longitudinal_positions: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Returns the matrix of shape (n, n) whose entry (i, j) is True if the obstacle i leads the obstacle j at the
+        time step, i.e., their lane corridors overlap and the obstacle i is ahead of the obstacle j.
+
+        :param obstacles: obstacles of the scenario
+        :param time_step: time step
+        :param longitudinal_positions: longitudinal positions of the obstacles at the time step, e.g., their
+            curvilinear coordinates in the CLCS of the ego vehicle; NaN positions do not lead or follow
+        """
+        longitudinal_positions = np.asarray(longitudinal_positions, dtype=float)
+        return self.lane_corridor_relation(obstacles, time_step) & (
+            longitudinal_positions[:, None] > longitudinal_positions[None, :]
+        )
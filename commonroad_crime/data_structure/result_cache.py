@@ -0,0 +1,140 @@
+__author__ = "Yuanfei Lin"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["KoSi"]
+__version__ = "0.4.0"
+__maintainer__ = "Yuanfei Lin"
+__email__ = "commonroad@lists.lrz.de"
+__status__ = "beta"
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List
+
+from commonroad_crime.data_structure.configuration import (
+    BaseConfig,
+    CriMeConfiguration,
+)
+
+logger = logging.getLogger(__name__)
+
+# sections of the configuration that do not influence the values of the measures
+_IRRELEVANT_SECTIONS = ["general", "debug"]
+_PRIMITIVE_TYPES = (bool, int, float, str, type(None))
+# public attribute names of the configuration classes, collected once per class
+_ATTRIBUTE_NAMES: Dict[type, List[str]] = dict()
+
+
+class ResultCache:
+    """
+    Bounded cache of measure results with least-recently-used eviction. It is used by `CriMeBase` for storing the
+    results of `compute` across evaluators once it is assigned to `CriMeBase.result_cache`, which is None by default.
+
+    Only the returned value is cached: the internal states of an evaluator, e.g., those used for the visualization,
+    are not restored for a cache hit.
+    """
+
+    MISS = object()
+
+    def __init__(self, maxsize: int = 10000):
+        """
+        :param maxsize: maximum number of stored results
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict = OrderedDict()
+
+    def __len__(self):
+        return len(self._results)
+
+    def __repr__(self):
+        return (
+            f"ResultCache(hits={self.hits}, misses={self.misses}, "
+            f"size={len(self)}, maxsize={self.maxsize})"
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of the cache hits among all lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Returns the cached result of the key or `ResultCache.MISS` if it is not contained.
+        """
+        if key in self._results:
+            self._results.move_to_end(key)
+            self.hits += 1
+            return self._results[key]
+        self.misses += 1
+        return self.MISS
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Stores the result of the key and evicts the least recently used results if the cache is full.
+        """
+        self._results[key] = value
+        self._results.move_to_end(key)
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all results and resets the counters.
+        """
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def configuration_hash(config: CriMeConfiguration) -> str:
+    """
+    Computes a stable hash of the parameters of the configuration that influence the values of the measures. The
+    general and debug sections are ignored. Parameters that are not of a primitive type, e.g., the CLCS, are derived
+    from the scenario and the ego vehicle and are thus covered by the other entries of the cache key.
+
+    :param config: configuration
+    """
+    parameters = []
+    for name in _attribute_names(config):
+        if name in _IRRELEVANT_SECTIONS:
+            continue
+        section = getattr(config, name)
+        if isinstance(section, BaseConfig):
+            _collect_parameters(section, name, parameters)
+    return hashlib.sha1(repr(parameters).encode()).hexdigest()
+
+
+def _collect_parameters(section: BaseConfig, prefix: str, parameters: list):
+    """
+    Collects the primitive parameters of the section and its sub-sections.
+    """
+    for name in _attribute_names(section):
+        value = getattr(section, name)
+        if isinstance(value, BaseConfig):
+            _collect_parameters(value, f"{prefix}.{name}", parameters)
+        elif isinstance(value, _PRIMITIVE_TYPES):
+            parameters.append((f"{prefix}.{name}", value))
+        elif isinstance(value, (list, tuple)) and all(
+            isinstance(v, _PRIMITIVE_TYPES) for v in value
+        ):
+            parameters.append((f"{prefix}.{name}", tuple(value)))
+
+
+def _attribute_names(obj: object) -> List[str]:
+    """
+    Returns the sorted public attribute names of the object except for properties and methods, which are assumed to
+    be identical for all objects of the same configuration class.
+    """
+    if type(obj) not in _ATTRIBUTE_NAMES:
+        _ATTRIBUTE_NAMES[type(obj)] = [
+            name
+            for name in sorted(dir(obj))
+            if not name.startswith("_")
+            # properties, e.g., the scenario context, are not evaluated
+            and not isinstance(getattr(type(obj), name, None), property)
+            and not callable(getattr(obj, name))
+        ]
+    return _ATTRIBUTE_NAMES[type(obj)]
@@ -0,0 +1,310 @@
+__author__ = "Yuanfei Lin"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["KoSi"]
+__version__ = "0.4.0"
+__maintainer__ = "Yuanfei Lin"
+__email__ = "commonroad@lists.lrz.de"
+__status__ = "beta"
+
+import logging
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Set, Tuple, Union
+
+from shapely import STRtree
+from shapely.geometry import Polygon as ShapelyPolygon
+
+from commonroad.scenario.intersection import Intersection, IntersectionIncomingElement
+from commonroad.scenario.lanelet import LaneletNetwork, LaneletType
+
+logger = logging.getLogger(__name__)
+
+
+class RoadTopology:
+    """
+    Topology of a lanelet network, i.e., the lanelets at intersections, the incomings of the intersections, the
+    chains of adjacent lanelets with the same direction and the chains of predecessors towards the incomings. The
+    maps are built once per lanelet network, the chains are followed once per lanelet and then stored.
+    """
+
+    def __init__(self, lanelet_network: LaneletNetwork):
+        """
+        :param lanelet_network: lanelet network, which must not be modified afterward
+        """
+        self._lanelet_network = lanelet_network
+        # lanelets of the intersections, i.e., the successors of the incomings
+        self.intersection_lanelet_ids: Set[int] = {
+            lanelet.lanelet_id
+            for lanelet in lanelet_network.lanelets
+            if LaneletType.INTERSECTION in lanelet.lanelet_type
+        }
+        # incoming lanelet id: (intersection, incoming)
+        self._incomings: Dict[int, Tuple[Intersection, IntersectionIncomingElement]] = (
+            {}
+        )
+        # lanelet id: positions (index of the intersection, index of the incoming) in which the lanelet is an incoming
+        # lanelet or a successor in the direction
+        self._incoming_positions: Dict[str, Dict[int, List[Tuple[int, int]]]] = {
+            direction: {} for direction in ("incoming", "left", "right", "straight")
+        }
+        self._incoming_elements: Dict[Tuple[int, int], IntersectionIncomingElement] = {}
+        for i, intersection in enumerate(lanelet_network.intersections):
+            for j, incoming in enumerate(intersection.incomings):
+                self._incoming_elements[(i, j)] = incoming
+                for direction, lanelet_ids in (
+                    ("incoming", incoming.incoming_lanelets),
+                    ("left", incoming.successors_left),
+                    ("right", incoming.successors_right),
+                    ("straight", incoming.successors_straight),
+                ):
+                    for lanelet_id in lanelet_ids:
+                        self._incoming_positions[direction].setdefault(
+                            lanelet_id, []
+                        ).append((i, j))
+                self.intersection_lanelet_ids.update(incoming.successors_left)
+                self.intersection_lanelet_ids.update(incoming.successors_right)
+                self.intersection_lanelet_ids.update(incoming.successors_straight)
+        # the later intersections and incomings take precedence as in `map_inc_lanelets_to_intersections`
+        for intersection in lanelet_network.intersections:
+            for lanelet_id, incoming in intersection.map_incoming_lanelets.items():
+                self._incomings[lanelet_id] = (intersection, incoming)
+        self._adjacent_left: Dict[int, Tuple[int, ...]] = {}
+        self._adjacent_right: Dict[int, Tuple[int, ...]] = {}
+        self._first_incoming_lanelets: Dict[int, Union[int, None]] = {}
+        self._conflict_areas: Union[ConflictAreaIndex, None] = None
+
+    def is_at_intersection(self, lanelet_id: int) -> bool:
+        """
+        Checks whether the lanelet is at an intersection.
+
+        :param lanelet_id: id of the lanelet
+        """
+        return lanelet_id in self.intersection_lanelet_ids
+
+    def incoming(
+        self, lanelet_id: int
+    ) -> Union[Tuple[Intersection, IntersectionIncomingElement], None]:
+        """
+        Returns the intersection and the incoming of which the lanelet is an incoming lanelet, or None.
+
+        :param lanelet_id: id of the lanelet
+        """
+        return self._incomings.get(lanelet_id)
+
+    def find_incoming(
+        self, lanelet_ids: Iterable[int], directions: Iterable[str] = ()
+    ) -> Union[IntersectionIncomingElement, None]:
+        """
+        Returns the incoming whose incoming lanelets or successors in the given directions contain one of the
+        lanelets. If several intersections match, the last one is returned; within an intersection, the first
+        matching incoming is returned.
+
+        :param lanelet_ids: ids of the lanelets
+        :param directions: directions of the successors, i.e., "left", "right" or "straight"
+        """
+        positions = []
+        for direction in ("incoming",) + tuple(directions):
+            for lanelet_id in lanelet_ids:
+                positions.extend(
+                    self._incoming_positions[direction].get(lanelet_id, [])
+                )
+        if not positions:
+            return None
+        last_intersection = max(i for i, _ in positions)
+        return self._incoming_elements[
+            min(position for position in positions if position[0] == last_intersection)
+        ]
+
+    def _adjacent_same_direction(self, lanelet_id: int, left: bool) -> Tuple[int, ...]:
+        chains = self._adjacent_left if left else self._adjacent_right
+        if lanelet_id not in chains:
+            chain = [lanelet_id]
+            lanelet = self._lanelet_network.find_lanelet_by_id(lanelet_id)
+            while (
+                lanelet.adj_left_same_direction
+                if left
+                else lanelet.adj_right_same_direction
+            ):
+                lanelet = self._lanelet_network.find_lanelet_by_id(
+                    lanelet.adj_left if left else lanelet.adj_right
+                )
+                if lanelet.lanelet_id in chain:
+                    logger.warning(
+                        f"<RoadTopology> the adjacent lanelets of lanelet {lanelet_id} form a cycle."
+                    )
+                    break
+                chain.append(lanelet.lanelet_id)
+            chains[lanelet_id] = tuple(chain)
+        return chains[lanelet_id]
+
+    def adjacent_left(self, lanelet_id: int) -> Tuple[int, ...]:
+        """
+        Returns the ids of the lanelet and its adjacent lanelets with the same direction on the left, ordered from the
+        lanelet to the leftmost one.
+
+        :param lanelet_id: id of the lanelet
+        """
+        return self._adjacent_same_direction(lanelet_id, True)
+
+    def adjacent_right(self, lanelet_id: int) -> Tuple[int, ...]:
+        """
+        Returns the ids of the lanelet and its adjacent lanelets with the same direction on the right, ordered from
+        the lanelet to the rightmost one.
+
+        :param lanelet_id: id of the lanelet
+        """
+        return self._adjacent_same_direction(lanelet_id, False)
+
+    def leftmost(self, lanelet_id: int) -> int:
+        """
+        Returns the id of the leftmost lanelet with the same direction as the lanelet.
+
+        :param lanelet_id: id of the lanelet
+        """
+        return self.adjacent_left(lanelet_id)[-1]
+
+    def rightmost(self, lanelet_id: int) -> int:
+        """
+        Returns the id of the rightmost lanelet with the same direction as the lanelet.
+
+        :param lanelet_id: id of the lanelet
+        """
+        return self.adjacent_right(lanelet_id)[-1]
+
+    def first_incoming_lanelet(self, lanelet_id: int) -> Union[int, None]:
+        """
+        Returns the id of the first lanelet that is not at an intersection when following the (first) predecessors of
+        the lanelet, or None if the chain of predecessors ends at the intersection.
+
+        :param lanelet_id: id of the lanelet
+        """
+        if lanelet_id not in self._first_incoming_lanelets:
+            chain = [lanelet_id]
+            current_id = lanelet_id
+            while self.is_at_intersection(current_id):
+                predecessor = self._lanelet_network.find_lanelet_by_id(
+                    current_id
+                ).predecessor
+                if len(predecessor) == 0 or predecessor[0] in chain:
+                    current_id = None
+                    break
+                current_id = predecessor[0]
+                if current_id in self._first_incoming_lanelets:
+                    current_id = self._first_incoming_lanelets[current_id]
+                    break
+                chain.append(current_id)
+            for chain_id in chain:
+                self._first_incoming_lanelets[chain_id] = current_id
+        return self._first_incoming_lanelets[lanelet_id]
+
+    def same_incoming(self, lanelet_id_a: int, lanelet_id_b: int) -> bool:
+        """
+        Checks whether the two lanelets originate from the same incoming of an intersection. Lanelets whose chain of
+        predecessors ends at the intersection do not originate from the same incoming, and lanelets that do not
+        originate from an incoming are considered to originate from the same one.
+
+        :param lanelet_id_a: id of the first lanelet
+        :param lanelet_id_b: id of the second lanelet
+        """
+        first_incoming_lanelet_a = self.first_incoming_lanelet(lanelet_id_a)
+        first_incoming_lanelet_b = self.first_incoming_lanelet(lanelet_id_b)
+        if first_incoming_lanelet_a is None or first_incoming_lanelet_b is None:
+            return False
+        incoming_a = self.incoming(first_incoming_lanelet_a)
+        incoming_b = self.incoming(first_incoming_lanelet_b)
+        if incoming_a is None or incoming_b is None:
+            return True
+        return incoming_a[1].incoming_id == incoming_b[1].incoming_id
+
+    @property
+    def conflict_areas(self) -> "ConflictAreaIndex":
+        """
+        Conflict areas of the crossing intersection lanelets, which are built when they are first needed.
+        """
+        if self._conflict_areas is None:
+            self._conflict_areas = ConflictAreaIndex(self._lanelet_network, self)
+        return self._conflict_areas
+
+
+class ConflictAreaIndex:
+    """
+    Conflict areas of a lanelet network, i.e., the intersections of the polygons of two lanelets. The conflict areas of
+    every pair of overlapping intersection lanelets from different incomings are computed at once; the ones of other
+    pairs, e.g., with an incoming lanelet, are computed when they are first requested. The conflict area of (a, b) is
+    the intersection of the polygon of a with the one of b and therefore the same as computed by shapely for this
+    order.
+    """
+
+    def __init__(self, lanelet_network: LaneletNetwork, road_topology: RoadTopology):
+        """
+        :param lanelet_network: lanelet network, which must not be modified afterward
+        :param road_topology: topology of the lanelet network
+        """
+        self._lanelet_network = lanelet_network
+        # (id of lanelet a, id of lanelet b): conflict area
+        self._conflict_areas: Dict[Tuple[int, int], ShapelyPolygon] = {}
+        lanelet_ids = sorted(
+            lanelet.lanelet_id
+            for lanelet in lanelet_network.lanelets
+            if road_topology.is_at_intersection(lanelet.lanelet_id)
+        )
+        if not lanelet_ids:
+            return
+        polygons = [self._polygon(lanelet_id) for lanelet_id in lanelet_ids]
+        for i, j in zip(
+            *STRtree(polygons).query(polygons, predicate="intersects").tolist()
+        ):
+            if i != j and not road_topology.same_incoming(
+                lanelet_ids[i], lanelet_ids[j]
+            ):
+                self._conflict_areas[(lanelet_ids[j], lanelet_ids[i])] = polygons[
+                    j
+                ].intersection(polygons[i])
+
+    def __len__(self):
+        return len(self._conflict_areas)
+
+    def _polygon(self, lanelet_id: int) -> ShapelyPolygon:
+        return self._lanelet_network.find_lanelet_by_id(
+            lanelet_id
+        ).polygon.shapely_object
+
+    def conflict_area(self, lanelet_id_a: int, lanelet_id_b: int) -> ShapelyPolygon:
+        """
+        Returns the conflict area of the two lanelets, which might be empty.
+
+        :param lanelet_id_a: id of the first lanelet
+        :param lanelet_id_b: id of the second lanelet
+        """
+        key = (lanelet_id_a, lanelet_id_b)
+        conflict_area = self._conflict_areas.get(key)
+        if conflict_area is None:
+            conflict_area = self._polygon(lanelet_id_a).intersection(
+                self._polygon(lanelet_id_b)
+            )
+            self._conflict_areas[key] = conflict_area
+        return conflict_area
+
+
+_road_topologies: "OrderedDict[int, Tuple[LaneletNetwork, RoadTopology]]" = (
+    OrderedDict()
+)
+ROAD_TOPOLOGY_CACHE_SIZE = 16
+
+
+def get_road_topology(lanelet_network: LaneletNetwork) -> RoadTopology:
+    """
+    Returns the topology of the lanelet network, which is built once and kept in a bounded cache with
+    least-recently-used eviction. The lanelet networks are identified by object.
+
+    :param lanelet_network: lanelet network
+    """
+    key = id(lanelet_network)
+    entry = _road_topologies.get(key)
+    if entry is None or entry[0] is not lanelet_network:
+        entry = (lanelet_network, RoadTopology(lanelet_network))
+        _road_topologies[key] = entry
+        while len(_road_topologies) > ROAD_TOPOLOGY_CACHE_SIZE:
+            _road_topologies.popitem(last=False)
+    else:
+        _road_topologies.move_to_end(key)
+    return entry[1]
@@ -0,0 +1,231 @@
+__author__ = "Yuanfei Lin"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["KoSi"]
+__version__ = "0.4.0"
+__maintainer__ = "Yuanfei Lin"
+__email__ = "commonroad@lists.lrz.de"
+__status__ = "beta"
+
+import copy
+import itertools
+import logging
+from typing import Dict, Optional, Union
+
+from commonroad.scenario.scenario import Scenario
+from commonroad.scenario.obstacle import Obstacle, DynamicObstacle
+from commonroad.prediction.prediction import TrajectoryPrediction, SetBasedPrediction
+from commonroad_dc.pycrccosy import CurvilinearCoordinateSystem
+
+from commonroad_crime.data_structure.scene import Scene
+from commonroad_crime.data_structure.trajectory_store import TrajectoryStore
+from commonroad_crime.data_structure.interaction_index import InteractionIndex
+from commonroad_crime.data_structure.curvilinear_projection import (
+    CurvilinearProjection,
+)
+from commonroad_crime.data_structure.lanelet_locator import LaneletLocator
+from commonroad_crime.data_structure.conflict_area_timing import ConflictAreaTiming
+from commonroad_crime.data_structure.collision_service import CollisionCheckerService
+from commonroad_crime.data_structure.road_topology import (
+    RoadTopology,
+    get_road_topology,
+)
+import commonroad_crime.utility.general as utils_gen
+
+logger = logging.getLogger(__name__)
+
+# unique identifiers of the contexts, e.g., for the keys of cached results
+_context_ids = itertools.count()
+
+
+class ScenarioContext:
+    """
+    Read-only snapshot of the scenario/scene shared by all measures that are built from the same configuration.
+
+    The scenario is deep-copied once. Each measure receives a lightweight view of this copy in which only the ego
+    vehicle is replaced by a normalized copy, so that constructing a measure no longer duplicates the whole scenario.
+    Measures that need to modify the scenario have to request a writable copy via :meth:`copy_scenario`.
+    """
+
+    def __init__(self, sce: Union[Scenario, Scene], float32: bool = False):
+        """
+        :param sce: scenario or scene provided by the configuration
+        :param float32: whether the trajectories are stored in single precision
+        """
+        self.source = sce
+        self.sce = copy.deepcopy(sce)
+        self.context_id = next(_context_ids)
+        self.dt = self.sce.dt
+        self._ego_views: Dict[int, Union[Scenario, Scene]] = {}
+        self._other_vehicles: Dict[int, Obstacle] = {}
+        self._ego_as_other_vehicles: Dict[int, Obstacle] = {}
+        self.float32 = float32
+        self.trajectories = TrajectoryStore(float32)
+        self._interaction_index: Optional[InteractionIndex] = None
+        self._lanelet_locator: Optional[LaneletLocator] = None
+        self._conflict_area_timing: Optional[ConflictAreaTiming] = None
+        self._collision_service: Optional[CollisionCheckerService] = None
+        self._network_fingerprint: Optional[str] = None
+        self._projections: Dict[int, CurvilinearProjection] = {}
+        # evaluators shared among the measures while they are planned by the `CriMeInterface`
+        self.shared_evaluators: Optional[Dict[type, object]] = None
+
+    @property
+    def interaction_index(self) -> InteractionIndex:
+        """
+        Spatio-temporal index of the obstacles for pruning the vehicles that do not interact with the ego vehicle.
+        """
+        if self._interaction_index is None:
+            self._interaction_index = InteractionIndex(self.sce, self.trajectories)
+        return self._interaction_index
+
+    @property
+    def lanelet_locator(self) -> LaneletLocator:
+        """
+        Point-location index of the lanelets, which also stores the lanelets occupied by the obstacles over time.
+        """
+        if self._lanelet_locator is None:
+            self._lanelet_locator = LaneletLocator(
+                self.sce.lanelet_network, self.trajectories
+            )
+        return self._lanelet_locator
+
+    @property
+    def conflict_area_timing(self) -> ConflictAreaTiming:
+        """
+        Times at which the obstacles enter and exit the conflict areas, which are stored per obstacle and conflict area.
+        """
+        if self._conflict_area_timing is None:
+            self._conflict_area_timing = ConflictAreaTiming()
+        return self._conflict_area_timing
+
+    @property
+    def collision_service(self) -> CollisionCheckerService:
+        """
+        Collision checker with the road boundary and all obstacles, which is built when it is first needed.
+        """
+        if self._collision_service is None:
+            self._collision_service = CollisionCheckerService(
+                self.sce, self.trajectories
+            )
+        return self._collision_service
+
+    @property
+    def road_topology(self) -> RoadTopology:
+        """
+        Topology of the lanelet network, e.g., the lanelets at intersections and the adjacent lanelets.
+        """
+        return get_road_topology(self.sce.lanelet_network)
+
+    @property
+    def network_fingerprint(self) -> str:
+        """
+        Fingerprint of the lanelet network, which is identical for the copies of a lanelet network.
+        """
+        if self._network_fingerprint is None:
+            self._network_fingerprint = utils_gen.lanelet_network_fingerprint(
+                self.sce.lanelet_network
+            )
+        return self._network_fingerprint
+
+    def projection(self, clcs: CurvilinearCoordinateSystem) -> CurvilinearProjection:
+        """
+        Returns the curvilinear coordinates of the obstacles in the CLCS, which are computed once per obstacle.
+
+        :param clcs: curvilinear coordinate system, e.g., the one of the ego vehicle
+        """
+        projection = self._projections.get(id(clcs))
+        if projection is None or projection.clcs is not clcs:
+            projection = CurvilinearProjection(clcs, self.trajectories)
+            self._projections[id(clcs)] = projection
+        return projection
+
+    def ego_view(self, ego_id: int) -> Union[Scenario, Scene]:
+        """
+        Returns the view of the scenario in which the ego vehicle has been normalized. The view shares all other
+        obstacles and the lanelet network with the snapshot and must not be modified.
+
+        :param ego_id: id of the ego vehicle
+        """
+        if ego_id not in self._ego_views:
+            ego_vehicle = self.sce.obstacle_by_id(ego_id)
+            if isinstance(ego_vehicle, DynamicObstacle) and not isinstance(
+                ego_vehicle.prediction, SetBasedPrediction
+            ):
+                ego_vehicle = copy.deepcopy(ego_vehicle)
+                utils_gen.check_elements_state_list(
+                    [ego_vehicle.initial_state]
+                    + ego_vehicle.prediction.trajectory.states_in_time_interval(
+                        time_begin=ego_vehicle.initial_state.time_step + 1,
+                        time_end=ego_vehicle.prediction.final_time_step,
+                    ),
+                    self.dt,
+                )
+                self._ego_views[ego_id] = _replace_dynamic_obstacle(
+                    self.sce, ego_vehicle
+                )
+            else:
+                # static or set-based ego vehicles are not normalized
+                self._ego_views[ego_id] = self.sce
+        return self._ego_views[ego_id]
+
+    def other_vehicle(self, vehicle_id: int, ego_id: int) -> Union[Obstacle, None]:
+        """
+        Returns the normalized copy of the vehicle with the given id. The copy is created once and shared by all
+        measures, hence it must not be modified.
+
+        :param vehicle_id: id of the other vehicle
+        :param ego_id: id of the ego vehicle
+        """
+        if vehicle_id == ego_id:
+            # the ego vehicle has already been normalized in its view
+            if ego_id not in self._ego_as_other_vehicles:
+                self._ego_as_other_vehicles[ego_id] = _normalize_obstacle(
+                    copy.deepcopy(self.ego_view(ego_id).obstacle_by_id(vehicle_id)),
+                    self.dt,
+                )
+            return self._ego_as_other_vehicles[ego_id]
+        if vehicle_id not in self._other_vehicles:
+            vehicle = self.sce.obstacle_by_id(vehicle_id)
+            if vehicle is None:
+                return None
+            self._other_vehicles[vehicle_id] = _normalize_obstacle(
+                copy.deepcopy(vehicle), self.dt
+            )
+        return self._other_vehicles[vehicle_id]
+
+    def copy_scenario(self) -> Union[Scenario, Scene]:
+        """
+        Returns a writable copy of the original scenario/scene for measures that need to modify it.
+        """
+        return copy.deepcopy(self.sce)
+
+
+def _replace_dynamic_obstacle(
+    sce: Union[Scenario, Scene], obstacle: DynamicObstacle
+) -> Union[Scenario, Scene]:
+    """
+    Creates a shallow copy of the scenario/scene in which the dynamic obstacle with the same id is replaced.
+    """
+    view = copy.copy(sce)
+    if isinstance(sce, Scene):
+        view._scenario = _replace_dynamic_obstacle(sce._scenario, obstacle)
+    if obstacle.obstacle_id in sce._dynamic_obstacles:
+        view._dynamic_obstacles = copy.copy(sce._dynamic_obstacles)
+        view._dynamic_obstacles[obstacle.obstacle_id] = obstacle
+    return view
+
+
+def _normalize_obstacle(obstacle: Obstacle, dt: float) -> Obstacle:
+    """
+    Completes the missing state elements of the obstacle.
+    """
+    if isinstance(obstacle, DynamicObstacle) and isinstance(
+        obstacle.prediction, TrajectoryPrediction
+    ):
+        utils_gen.check_elements_state_list(
+            [obstacle.initial_state] + obstacle.prediction.trajectory.state_list,
+            dt,
+        )
+    else:
+        utils_gen.check_elements_state(obstacle.initial_state, dt=dt)
+    return obstacle
@@ -0,0 +1,168 @@
+__author__ = "Yuanfei Lin"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["KoSi"]
+__version__ = "0.4.0"
+__maintainer__ = "Yuanfei Lin"
+__email__ = "commonroad@lists.lrz.de"
+__status__ = "beta"
+
+import logging
+from typing import Dict, Tuple, Union
+
+import numpy as np
+
+from commonroad.scenario.obstacle import Obstacle, DynamicObstacle
+
+logger = logging.getLogger(__name__)
+
+
+class StateColumn:
+    """
+    Rows of the state arrays in the :class:`TrajectoryStore`.
+    """
+
+    POSITION = slice(0, 2)
+    POSITION_X = 0
+    POSITION_Y = 1
+    VELOCITY = 2
+    VELOCITY_Y = 3
+    ACCELERATION = 4
+    ACCELERATION_Y = 5
+    ORIENTATION = 6
+    JERK = 7
+
+
+# scalar state attributes and their rows
+_SCALAR_ATTRIBUTES = [
+    ("velocity", StateColumn.VELOCITY),
+    ("velocity_y", StateColumn.VELOCITY_Y),
+    ("acceleration", StateColumn.ACCELERATION),
+    ("acceleration_y", StateColumn.ACCELERATION_Y),
+    ("orientation", StateColumn.ORIENTATION),
+    ("jerk", StateColumn.JERK),
+]
+_NUM_ROWS = 8
+
+
+class _TrajectoryBlock:
+    """
+    States of one obstacle stored column-wise, i.e., each row of `data` holds one attribute over all time steps.
+    """
+
+    __slots__ = ("obstacle", "initial_time_step", "is_static", "data", "valid")
+
+    def __init__(self, obstacle: Obstacle, dtype: np.dtype):
+        self.obstacle = obstacle
+        self.initial_time_step = obstacle.initial_state.time_step
+        self.is_static = not isinstance(obstacle, DynamicObstacle)
+        if self.is_static or obstacle.prediction is None:
+            # the time step of static obstacles might not be set
+            num_steps = 1
+        else:
+            num_steps = obstacle.prediction.final_time_step - self.initial_time_step + 1
+        self.data = np.full((_NUM_ROWS, num_steps), np.nan, dtype=dtype)
+        self.valid = np.zeros(num_steps, dtype=bool)
+        for index in range(num_steps):
+            # the states are read once via the obstacle to keep the semantics of `state_at_time`
+            if self.is_static:
+                state = obstacle.initial_state
+            else:
+                state = obstacle.state_at_time(self.initial_time_step + index)
+            if state is None:
+                continue
+            self.valid[index] = True
+            position = getattr(state, "position", None)
+            if isinstance(position, np.ndarray):
+                self.data[StateColumn.POSITION, index] = position
+            for attribute, row in _SCALAR_ATTRIBUTES:
+                value = getattr(state, attribute, None)
+                if isinstance(value, (int, float, np.number)):
+                    self.data[row, index] = value
+
+    def index(self, time_step: int) -> Union[int, None]:
+        if self.is_static:
+            return 0
+        index = time_step - self.initial_time_step
+        if 0 <= index < len(self.valid) and self.valid[index]:
+            return index
+        return None
+
+
+class TrajectoryStore:
+    """
+    Columnar storage of the states of the obstacles in a scenario. The states of an obstacle are converted into
+    contiguous arrays (position, velocity, velocity_y, acceleration, acceleration_y, orientation, and jerk) the first
+    time they are requested, so that the measures can read them by slicing instead of querying the states of
+    commonroad-io repeatedly.
+
+    The obstacles are identified by object and not by id since, e.g., the normalized ego vehicle and its copy as
+    other vehicle might differ. Hence, the store should only be used for the long-lived obstacles of the
+    :class:`ScenarioContext`. Missing attributes are stored as NaN.
+    """
+
+    def __init__(self, float32: bool = False):
+        """
+        :param float32: whether the states are stored in single precision, which halves the memory at the cost of
+            accuracy
+        """
+        self.dtype = np.dtype(np.float32 if float32 else np.float64)
+        self._blocks: Dict[int, _TrajectoryBlock] = {}
+
+    def __len__(self):
+        return len(self._blocks)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory occupied by the stored states."""
+        return sum(block.data.nbytes for block in self._blocks.values())
+
+    def _block(self, obstacle: Obstacle) -> _TrajectoryBlock:
+        block = self._blocks.get(id(obstacle))
+        if block is None or block.obstacle is not obstacle:
+            block = _TrajectoryBlock(obstacle, self.dtype)
+            self._blocks[id(obstacle)] = block
+        return block
+
+    def state(self, obstacle: Obstacle, time_step: int) -> Union[np.ndarray, None]:
+        """
+        Returns the state of the obstacle at the given time step as an array indexed by :class:`StateColumn` or None
+        if the obstacle has no state at this time step.
+
+        :param obstacle: obstacle of the scenario
+        :param time_step: time step
+        """
+        block = self._block(obstacle)
+        index = block.index(time_step)
+        if index is None:
+            return None
+        return block.data[:, index]
+
+    def position(self, obstacle: Obstacle, time_step: int) -> Union[np.ndarray, None]:
+        """
+        Returns the position of the obstacle at the given time step or None if the obstacle has no state.
+        """
+        state = self.state(obstacle, time_step)
+        return None if state is None else state[StateColumn.POSITION]
+
+    def states_in_time_interval(
+        self, obstacle: Obstacle, time_begin: int, time_end: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the time steps within [time_begin, time_end] at which the obstacle has a state and the corresponding
+        states as an array of shape (8, n) indexed by :class:`StateColumn`.
+
+        :param obstacle: obstacle of the scenario
+        :param time_begin: first time step
+        :param time_end: last time step (inclusive)
+        """
+        block = self._block(obstacle)
+        if block.is_static:
+            time_steps = np.arange(time_begin, time_end + 1)
+            return time_steps, np.repeat(block.data, len(time_steps), axis=1)
+        begin = max(time_begin - block.initial_time_step, 0)
+        end = max(min(time_end - block.initial_time_step + 1, len(block.valid)), begin)
+        valid = block.valid[begin:end]
+        time_steps = np.arange(begin, end)[valid] + block.initial_time_step
+        if valid.all():
+            return time_steps, block.data[:, begin:end]
+        return time_steps, block.data[:, begin:end][:, valid]
@@ -1,47 +1,123 @@
-from .time.ttb import *
-from .time.ttr import *
-from .time.tts import *
-from .time.ttm import *
-from .time.ttc_star import *
-from .time.ttc import *
-from .time.tet import *
-from .time.tit import *
-from .time.thw import *
-from .time.ttk import *
-from .time.ttz import *
-from .time.wttc import *
-from .time.ags import *
-from .time.et import *
-from .time.pttc import *
-from .time.pet import *
-from .time.tc import *
-from .time.tv import *
-from .time.ttce import *
-from .time.wttr import *
-from .distance.hw import *
-from .distance.dce import *
-from .distance.psd import *
-from .distance.msd import *
-from .acceleration.a_lat_req import *
-from .acceleration.a_long_req import *
-from .acceleration.dst import *
-from .acceleration.a_req import *
-from .index.btn import *
-from .index.stn import *
-from .index.tci import *
-from .index.aci import *
-from .index.ci import *
-from .index.cpi import *
-from .index.pri import *
-from .index.rss import *
-from .index.soi import *
-from .jerk.lat_j import *
-from .jerk.long_j import *
-from .potential.pf import *
-from .potential.sp import *
-from .probability.p_mc import *
-from .probability.p_smh import *
-from .probability.p_srs import *
-from .velocity.delta_v import *
-from .velocity.cs import *
-from .reachable_set.drivable_area import *
+"""
+Registry of the criticality measures. A measure module is only imported when the measure is accessed for the first
+time, e.g., via `from commonroad_crime.measure import TTC`, such that the dependencies of unused measures (e.g.,
+casadi for TCI or commonroad-reach for DA) are not loaded.
+"""
+
+__author__ = "Yuanfei Lin"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["KoSi"]
+__version__ = "0.4.0"
+__maintainer__ = "Yuanfei Lin"
+__email__ = "commonroad@lists.lrz.de"
+__status__ = "beta"
+
+import importlib
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Tuple, Type
+
+from commonroad_crime.data_structure.type import (
+    TypeAcceleration,
+    TypeDistance,
+    TypeIndex,
+    TypeJerk,
+    TypePotential,
+    TypeProbability,
+    TypeReachableSet,
+    TypeTime,
+    TypeVelocity,
+)
+
+if TYPE_CHECKING:
+    from commonroad_crime.data_structure.base import CriMeBase
+
+# class name of each measure: (type of the measure, module relative to this package)
+_MEASURES: Dict[str, Tuple[Enum, str]] = {
+    "TTB": (TypeTime.TTB, ".time.ttb"),
+    "TTR": (TypeTime.TTR, ".time.ttr"),
+    "TTS": (TypeTime.TTS, ".time.tts"),
+    "TTM": (TypeTime.TTM, ".time.ttm"),
+    "TTCStar": (TypeTime.TTCStar, ".time.ttc_star"),
+    "TTC": (TypeTime.TTC, ".time.ttc"),
+    "TET": (TypeTime.TET, ".time.tet"),
+    "TIT": (TypeTime.TIT, ".time.tit"),
+    "THW": (TypeTime.THW, ".time.thw"),
+    "TTK": (TypeTime.TTK, ".time.ttk"),
+    "TTZ": (TypeTime.TTZ, ".time.ttz"),
+    "WTTC": (TypeTime.WTTC, ".time.wttc"),
+    "AGS": (TypeTime.AGS, ".time.ags"),
+    "ET": (TypeTime.ET, ".time.et"),
+    "PTTC": (TypeTime.PTTC, ".time.pttc"),
+    "PET": (TypeTime.PET, ".time.pet"),
+    "TC": (TypeTime.TC, ".time.tc"),
+    "TV": (TypeTime.TV, ".time.tv"),
+    "TTCE": (TypeTime.TTCE, ".time.ttce"),
+    "WTTR": (TypeTime.WTTR, ".time.wttr"),
+    "HW": (TypeDistance.HW, ".distance.hw"),
+    "DCE": (TypeDistance.DCE, ".distance.dce"),
+    "PSD": (TypeDistance.PSD, ".distance.psd"),
+    "MSD": (TypeDistance.MSD, ".distance.msd"),
+    "ALatReq": (TypeAcceleration.ALatReq, ".acceleration.a_lat_req"),
+    "ALongReq": (TypeAcceleration.ALongReq, ".acceleration.a_long_req"),
+    "DST": (TypeAcceleration.DST, ".acceleration.dst"),
+    "AReq": (TypeAcceleration.AReq, ".acceleration.a_req"),
+    "BTN": (TypeIndex.BTN, ".index.btn"),
+    "STN": (TypeIndex.STN, ".index.stn"),
+    "TCI": (TypeIndex.TCI, ".index.tci"),
+    "ACI": (TypeIndex.ACI, ".index.aci"),
+    "CI": (TypeIndex.CI, ".index.ci"),
+    "CPI": (TypeIndex.CPI, ".index.cpi"),
+    "PRI": (TypeIndex.PRI, ".index.pri"),
+    "RSS": (TypeIndex.RSS, ".index.rss"),
+    "SOI": (TypeIndex.SOI, ".index.soi"),
+    "LatJ": (TypeJerk.LatJ, ".jerk.lat_j"),
+    "LongJ": (TypeJerk.LongJ, ".jerk.long_j"),
+    "PF": (TypePotential.PF, ".potential.pf"),
+    "SP": (TypePotential.SP, ".potential.sp"),
+    "P_MC": (TypeProbability.P_MC, ".probability.p_mc"),
+    "P_SMH": (TypeProbability.P_SMH, ".probability.p_smh"),
+    "P_SRS": (TypeProbability.P_SRS, ".probability.p_srs"),
+    "DeltaV": (TypeVelocity.Delta_V, ".velocity.delta_v"),
+    "CS": (TypeVelocity.CS, ".velocity.cs"),
+    "DA": (TypeReachableSet.DA, ".reachable_set.drivable_area"),
+}
+# since the types are string enums, the types and their values share the same keys
+_MEASURES_BY_TYPE: Dict[str, str] = {
+    measure_type: name for name, (measure_type, _) in _MEASURES.items()
+}
+
+__all__ = list(_MEASURES) + ["get_measure", "measure_names"]
+
+
+def __getattr__(name: str):
+    if name in _MEASURES:
+        module = importlib.import_module(_MEASURES[name][1], __name__)
+        measure = getattr(module, name)
+        globals()[name] = measure
+        return measure
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def measure_names() -> List[str]:
+    """
+    Returns the class names of all registered measures without importing them.
+    """
+    return list(_MEASURES)
+
+
+def get_measure(measure: str) -> Type["CriMeBase"]:
+    """
+    Returns the class of the measure and imports its module if needed.
+
+    :param measure: class name (e.g., "TTC"), type (e.g., `TypeTime.TTC`), or name (e.g., "time-to-collision") of
+        the measure
+    """
+    if measure in _MEASURES:
+        return __getattr__(measure)
+    if measure in _MEASURES_BY_TYPE:
+        return __getattr__(_MEASURES_BY_TYPE[measure])
+    raise KeyError(f"<CriMe>: measure {measure} is not registered")
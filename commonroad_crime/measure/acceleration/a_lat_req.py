@@ -13,6 +13,7 @@ import numpy as np
 from commonroad.geometry.shape import Circle
 
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
+from commonroad_crime.data_structure.trajectory_store import StateColumn
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.type import TypeAcceleration, TypeMonotone
 from commonroad_crime.measure.time.ttc import TTC
@@ -34,10 +35,12 @@ class ALatReq(CriMeBase):
 
     measure_name = TypeAcceleration.ALatReq
     monotone = TypeMonotone.POS
+    pairwise_interaction = True
+    dependencies = [TTC]
 
     def __init__(self, config: CriMeConfiguration):
         super(ALatReq, self).__init__(config)
-        self._ttc_object = TTC(config)
+        self._ttc_object = self.get_dependency(TTC)
 
     def _compute_a_lat(
         self,
@@ -82,18 +85,18 @@ class ALatReq(CriMeBase):
             # no negative acceleration is needed for avoiding a collision
             return self.value
 
-        lanelet_id = self.sce.lanelet_network.find_lanelet_by_position(
-            [self.ego_vehicle.state_at_time(time_step).position]
-        )[0]
+        ego_state = self.trajectories.state(self.ego_vehicle, time_step)
+        other_state = self.trajectories.state(self.other_vehicle, time_step)
+        lanelet_id = self.lanelet_locator.lanelet_ids_at(self.ego_vehicle, time_step)
         # orientation of the ego vehicle and the other vehicle
         ego_orientation = utils_sol.compute_lanelet_width_orientation(
             self.sce.lanelet_network.find_lanelet_by_id(lanelet_id[0]),
-            self.ego_vehicle.state_at_time(time_step).position,
+            ego_state[StateColumn.POSITION],
         )[1]
         try:
             other_orientation = utils_sol.compute_lanelet_width_orientation(
                 self.sce.lanelet_network.find_lanelet_by_id(lanelet_id[0]),
-                self.other_vehicle.state_at_time(time_step).position,
+                other_state[StateColumn.POSITION],
             )[1]
         except ValueError as e:
             utils_log.print_and_log_warning(
@@ -114,25 +117,25 @@ class ALatReq(CriMeBase):
                 self.value = 0.0
                 return self.value
             a_obj_lat = math.sqrt(
-                self.other_vehicle.state_at_time(time_step).acceleration_y ** 2
-                + self.other_vehicle.state_at_time(time_step).acceleration ** 2
+                other_state[StateColumn.ACCELERATION_Y] ** 2
+                + other_state[StateColumn.ACCELERATION] ** 2
             ) * math.sin(other_orientation)
 
             # compute the headway distance
             d_rel_lat = utils_sol.compute_clcs_distance(
                 self.clcs,
-                self.ego_vehicle.state_at_time(time_step).position,
-                self.ego_vehicle.state_at_time(time_step).position,
+                ego_state[StateColumn.POSITION],
+                ego_state[StateColumn.POSITION],
             )[1]
             v_rel_lat = (
                 math.sqrt(
-                    self.other_vehicle.state_at_time(time_step).velocity ** 2
-                    + self.other_vehicle.state_at_time(time_step).velocity_y ** 2
+                    other_state[StateColumn.VELOCITY] ** 2
+                    + other_state[StateColumn.VELOCITY_Y] ** 2
                 )
                 * math.sin(other_orientation)
                 - math.sqrt(
-                    self.ego_vehicle.state_at_time(time_step).velocity ** 2
-                    + self.ego_vehicle.state_at_time(time_step).velocity_y ** 2
+                    ego_state[StateColumn.VELOCITY] ** 2
+                    + ego_state[StateColumn.VELOCITY_Y] ** 2
                 )
             ) * math.sin(ego_orientation)
             self.value = min(
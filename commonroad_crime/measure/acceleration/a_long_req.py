@@ -11,6 +11,7 @@ import numpy as np
 import logging
 
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
+from commonroad_crime.data_structure.trajectory_store import StateColumn
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.type import TypeAcceleration, TypeMonotone
 from commonroad_crime.measure.distance.hw import HW
@@ -32,10 +33,12 @@ class ALongReq(CriMeBase):
 
     measure_name = TypeAcceleration.ALongReq
     monotone = TypeMonotone.NEG
+    pairwise_interaction = True
+    dependencies = [HW]
 
     def __init__(self, config: CriMeConfiguration):
         super(ALongReq, self).__init__(config)
-        self._hw_object = HW(config)
+        self._hw_object = self.get_dependency(HW)
 
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
@@ -46,18 +49,18 @@ class ALongReq(CriMeBase):
                 logger, f"*\t\t {self.measure_name} = {self.value}", verbose
             )
             return self.value
-        lanelet_id = self.sce.lanelet_network.find_lanelet_by_position(
-            [self.ego_vehicle.state_at_time(time_step).position]
-        )[0]
+        ego_state = self.trajectories.state(self.ego_vehicle, time_step)
+        other_state = self.trajectories.state(self.other_vehicle, time_step)
+        lanelet_id = self.lanelet_locator.lanelet_ids_at(self.ego_vehicle, time_step)
         # orientation of the ego vehicle and the other vehicle
         ego_orientation = utils_sol.compute_lanelet_width_orientation(
             self.sce.lanelet_network.find_lanelet_by_id(lanelet_id[0]),
-            self.ego_vehicle.state_at_time(time_step).position,
+            ego_state[StateColumn.POSITION],
         )[1]
         try:
             other_orientation = utils_sol.compute_lanelet_width_orientation(
                 self.sce.lanelet_network.find_lanelet_by_id(lanelet_id[0]),
-                self.other_vehicle.state_at_time(time_step).position,
+                other_state[StateColumn.POSITION],
             )[1]
         except ValueError as e:
             utils_log.print_and_log_warning(
@@ -71,19 +74,19 @@ class ALongReq(CriMeBase):
         else:
             # acceleration of the other vehicle along the lanelet
             a_obj = math.sqrt(
-                self.other_vehicle.state_at_time(time_step).acceleration ** 2
-                + self.other_vehicle.state_at_time(time_step).acceleration_y ** 2
+                other_state[StateColumn.ACCELERATION] ** 2
+                + other_state[StateColumn.ACCELERATION_Y] ** 2
             ) * math.cos(other_orientation)
             # compute the headway (relative distance) along the lanelet
             x_rel = self._hw_object.compute(vehicle_id, time_step, verbose=verbose)
             # compute the vehicles' velocity along the lanelet direction
             v_ego_long = math.sqrt(
-                self.ego_vehicle.state_at_time(time_step).velocity ** 2
-                + self.ego_vehicle.state_at_time(time_step).velocity_y ** 2
+                ego_state[StateColumn.VELOCITY] ** 2
+                + ego_state[StateColumn.VELOCITY_Y] ** 2
             ) * math.cos(ego_orientation)
             v_other_long = math.sqrt(
-                self.other_vehicle.state_at_time(time_step).velocity ** 2
-                + self.other_vehicle.state_at_time(time_step).velocity_y ** 2
+                other_state[StateColumn.VELOCITY] ** 2
+                + other_state[StateColumn.VELOCITY_Y] ** 2
             ) * math.cos(other_orientation)
             if self.configuration.acceleration.acceleration_mode == 1:
                 # constant acceleration using (8) in "Using extreme value theory for vehicle level safety validation and
@@ -106,5 +109,9 @@ class ALongReq(CriMeBase):
         )
         return self.value
 
+    def neutral_value(self) -> float:
+        # no deceleration is required
+        return 0.0
+
     def visualize(self):
         pass
@@ -31,11 +31,13 @@ class AReq(CriMeBase):
 
     measure_name = TypeAcceleration.AReq
     monotone = TypeMonotone.POS
+    pairwise_interaction = True
+    dependencies = [ALongReq, ALatReq]
 
     def __init__(self, config: CriMeConfiguration):
         super(AReq, self).__init__(config)
-        self._a_long_object = ALongReq(config)
-        self._a_lat_object = ALatReq(config)
+        self._a_long_object = self.get_dependency(ALongReq)
+        self._a_lat_object = self.get_dependency(ALatReq)
 
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
@@ -8,17 +8,18 @@ __status__ = "beta"
 
 import math
 import numpy as np
-import matplotlib.pyplot as plt
 import logging
 
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.type import TypeAcceleration, TypeMonotone
 from commonroad_crime.measure.distance.hw import HW
-import commonroad_crime.utility.visualization as utils_vis
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.logger as utils_log
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,10 +32,12 @@ class DST(CriMeBase):
 
     measure_name = TypeAcceleration.DST
     monotone = TypeMonotone.POS
+    pairwise_interaction = True
+    dependencies = [HW]
 
     def __init__(self, config: CriMeConfiguration):
         super(DST, self).__init__(config)
-        self._hw_solver = HW(config)
+        self._hw_solver = self.get_dependency(HW)
 
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
@@ -7,7 +7,6 @@ __email__ = "commonroad@lists.lrz.de"
 __status__ = "Pre-alpha"
 
 import math
-import matplotlib.pyplot as plt
 import logging
 import numpy as np
 
@@ -16,11 +15,12 @@ from commonroad.geometry.shape import ShapeGroup
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeDistance, TypeMonotone
 from commonroad_crime.data_structure.base import CriMeBase
-import commonroad_crime.utility.visualization as utils_vis
-from commonroad_crime.utility.visualization import TUMcolor
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.logger as utils_log
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +32,9 @@ class DCE(CriMeBase):
 
     measure_name = TypeDistance.DCE
     monotone = TypeMonotone.NEG
+    pairwise_interaction = True
+    # the time of the DCE stored in the evaluator is used by TTCE
+    cache_results = False
 
     def __init__(self, config: CriMeConfiguration):
         super(DCE, self).__init__(config)
@@ -96,17 +99,17 @@ class DCE(CriMeBase):
         utils_vis.draw_state_list(
             self.rnd,
             self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-            color=TUMcolor.TUMblue,
+            color=utils_vis.TUMcolor.TUMblue,
             linewidth=5,
         )
 
         utils_vis.draw_state(
             self.rnd,
             self.ego_vehicle.state_at_time(self.time_dce),
-            color=TUMcolor.TUMblue,
+            color=utils_vis.TUMcolor.TUMblue,
         )
         utils_vis.draw_dyn_vehicle_shape(
-            self.rnd, self.other_vehicle, self.time_dce, color=TUMcolor.TUMred
+            self.rnd, self.other_vehicle, self.time_dce, color=utils_vis.TUMcolor.TUMred
         )
 
         plt.title(f"{self.measure_name} of {self.value} m")
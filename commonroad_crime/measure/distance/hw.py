@@ -6,7 +6,6 @@ __maintainer__ = "Yuanfei Lin"
 __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
-import matplotlib.pyplot as plt
 import logging
 import math
 
@@ -15,13 +14,14 @@ import numpy as np
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeDistance, TypeMonotone
 from commonroad_crime.measure.time.thw import THW
-import commonroad_crime.utility.visualization as utils_vis
-import commonroad_crime.utility.solver as utils_sol
 import commonroad_crime.utility.logger as utils_log
-from commonroad_crime.utility.visualization import TUMcolor
+import commonroad_crime.utility.general as utils_gen
 
 from commonroad.geometry.shape import Polygon, Circle
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,29 +40,26 @@ class HW(THW):
 
     def cal_headway(self, verbose=True):
         if isinstance(self.other_vehicle.obstacle_shape, Polygon):
-            other_position = self.other_vehicle.state_at_time(self.time_step).position
+            other_offset = 0.0
+        elif isinstance(self.other_vehicle.obstacle_shape, Circle):
+            other_offset = -self.other_vehicle.obstacle_shape.radius
         else:
-            if isinstance(self.other_vehicle.obstacle_shape, Circle):
-                other_position = (
-                    self.other_vehicle.state_at_time(self.time_step).position
-                    - self.other_vehicle.obstacle_shape.radius
-                )
-            else:
-                other_position = (
-                    self.other_vehicle.state_at_time(self.time_step).position
-                    - self.other_vehicle.obstacle_shape.length / 2
-                )
-        ego_position = (
-            self.ego_vehicle.state_at_time(self.time_step).position
-            + self.ego_vehicle.obstacle_shape.length / 2
+            other_offset = -self.other_vehicle.obstacle_shape.length / 2
+        projection = self.curvilinear_projection
+        ego_coordinates = projection.coordinates_at(
+            self.ego_vehicle,
+            self.time_step,
+            self.ego_vehicle.obstacle_shape.length / 2,
+        )
+        other_coordinates = projection.coordinates_at(
+            self.other_vehicle, self.time_step, other_offset
         )
-        try:
-            headway = utils_sol.compute_clcs_distance(
-                self.clcs, ego_position, other_position
-            )[0]
-        except ValueError as e:
+        headway = other_coordinates[0] - ego_coordinates[0]
+        if np.isnan(headway):
             utils_log.print_and_log_warning(
-                logger, f"<HW> During the projection of the other vehicle: {e}", verbose
+                logger,
+                "<HW> During the projection of the other vehicle: outside of projection domain",
+                verbose,
             )
             headway = math.inf
         if headway < 0:
@@ -86,16 +83,19 @@ class HW(THW):
         utils_vis.draw_state_list(
             self.rnd,
             self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-            color=TUMcolor.TUMblue,
+            color=utils_vis.TUMcolor.TUMblue,
             linewidth=5,
         )
         utils_vis.draw_state(
             self.rnd,
             self.ego_vehicle.state_at_time(self.time_step),
-            color=TUMcolor.TUMblue,
+            color=utils_vis.TUMcolor.TUMblue,
         )
         utils_vis.draw_dyn_vehicle_shape(
-            self.rnd, self.other_vehicle, self.time_step, color=TUMcolor.TUMred
+            self.rnd,
+            self.other_vehicle,
+            self.time_step,
+            color=utils_vis.TUMcolor.TUMred,
         )
         plt.title(f"{self.measure_name} of {self.value} m")
         if self.configuration.debug.draw_visualization:
@@ -7,7 +7,6 @@ __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
 import math
-import matplotlib.pyplot as plt
 import logging
 
 import numpy as np
@@ -18,9 +17,9 @@ from commonroad_crime.data_structure.type import TypeDistance, TypeMonotone
 import commonroad_crime.utility.logger as utils_log
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.solver as utils_sol
-import commonroad_crime.utility.visualization as utils_vis
-from commonroad_crime.utility.visualization import TUMcolor
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +32,7 @@ class MSD(CriMeBase):
 
     measure_name = TypeDistance.MSD
     monotone = TypeMonotone.POS
+    pairwise_interaction = True
 
     def __init__(self, config: CriMeConfiguration):
         super(MSD, self).__init__(config)
@@ -41,9 +41,7 @@ class MSD(CriMeBase):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
             return np.nan
         state = self.ego_vehicle.state_at_time(time_step)
-        lanelet_id = self.sce.lanelet_network.find_lanelet_by_position(
-            [self.ego_vehicle.state_at_time(time_step).position]
-        )[0]
+        lanelet_id = self.lanelet_locator.lanelet_ids_at(self.ego_vehicle, time_step)
 
         # compute the orientation of ego-vehicle
         ego_orientation = utils_sol.compute_lanelet_width_orientation(
@@ -97,16 +95,18 @@ class MSD(CriMeBase):
         utils_vis.draw_state_list(
             self.rnd,
             self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-            color=TUMcolor.TUMblue,
+            color=utils_vis.TUMcolor.TUMblue,
             linewidth=1,
         )
         utils_vis.draw_dyn_vehicle_shape(
             self.rnd,
             self.ego_vehicle,
             time_step=self.time_step,
-            color=TUMcolor.TUMgreen,
+            color=utils_vis.TUMcolor.TUMgreen,
+        )
+        utils_vis.draw_circle(
+            self.rnd, msd_location, 0.5, 1, color=utils_vis.TUMcolor.TUMred
         )
-        utils_vis.draw_circle(self.rnd, msd_location, 0.5, 1, color=TUMcolor.TUMred)
         plt.title(f"{self.measure_name} of {self.time_step} time steps")
 
         if self.configuration.debug.draw_visualization:
@@ -12,18 +12,17 @@ from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeDistance, TypeMonotone
 import commonroad_crime.utility.logger as utils_log
-import commonroad_crime.utility.visualization as utils_vis
-import matplotlib.pyplot as plt
 import logging
 import numpy as np
 import commonroad_crime.utility.general as utils_gen
-from commonroad_crime.utility.visualization import TUMcolor
 from commonroad_crime.measure.distance.msd import MSD
 from commonroad_crime.measure.time.et import ET
 from commonroad.geometry.polyline_util import (
     compute_total_polyline_length,
 )
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -36,11 +35,13 @@ class PSD(CriMeBase):
 
     measure_name = TypeDistance.PSD
     monotone = TypeMonotone.NEG
+    pairwise_interaction = True
+    dependencies = [MSD, ET]
 
     def __init__(self, config: CriMeConfiguration):
         super(PSD, self).__init__(config)
-        self._msd_object = MSD(config)
-        self._et_object = ET(config)
+        self._msd_object = self.get_dependency(MSD)
+        self._et_object = self.get_dependency(ET)
 
     def compute(self, vehicle_id: int = None, time_step: int = 0, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
@@ -122,25 +123,27 @@ class PSD(CriMeBase):
             utils_vis.draw_state_list(
                 self.rnd,
                 self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-                color=TUMcolor.TUMblue,
+                color=utils_vis.TUMcolor.TUMblue,
                 linewidth=1,
             )
             utils_vis.draw_state_list(
                 self.rnd,
                 self.other_vehicle.prediction.trajectory.state_list[self.time_step :],
-                color=TUMcolor.TUMlightgray,
+                color=utils_vis.TUMcolor.TUMlightgray,
                 linewidth=1,
             )
             utils_vis.draw_dyn_vehicle_shape(
                 self.rnd,
                 self.ego_vehicle,
                 time_step=self.time_step,
-                color=TUMcolor.TUMgreen,
+                color=utils_vis.TUMcolor.TUMgreen,
             )
             msd_location = self._msd_object.compute_msd_location_time_step(
                 self._msd_object.value
             )
-            utils_vis.draw_circle(self.rnd, msd_location, 0.5, 1, color=TUMcolor.TUMred)
+            utils_vis.draw_circle(
+                self.rnd, msd_location, 0.5, 1, color=utils_vis.TUMcolor.TUMred
+            )
 
             _, enter_time, _ = self._et_object.get_ca_time_info(
                 self.ego_vehicle, self.time_step, self._et_object.ca
@@ -149,17 +152,17 @@ class PSD(CriMeBase):
                 self.rnd,
                 self.ego_vehicle,
                 time_step=enter_time,
-                color=TUMcolor.TUMgreen,
+                color=utils_vis.TUMcolor.TUMgreen,
             )
             utils_vis.draw_dyn_vehicle_shape(
                 self.rnd,
                 self.other_vehicle,
                 time_step=self.time_step,
-                color=TUMcolor.TUMdarkred,
+                color=utils_vis.TUMcolor.TUMdarkred,
             )
             x_i, y_i = self._et_object.ca.exterior.xy
-            plt.plot(x_i, y_i, color=TUMcolor.TUMblack, zorder=1001)
-            plt.fill(x_i, y_i, color=TUMcolor.TUMred, zorder=1001)
+            plt.plot(x_i, y_i, color=utils_vis.TUMcolor.TUMblack, zorder=1001)
+            plt.fill(x_i, y_i, color=utils_vis.TUMcolor.TUMred, zorder=1001)
 
             plt.title(f"{self.measure_name} of {self.time_step} time steps")
 
@@ -30,10 +30,12 @@ class BTN(CriMeBase):
 
     measure_name = TypeIndex.BTN
     monotone = TypeMonotone.POS
+    pairwise_interaction = True
+    dependencies = [ALongReq]
 
     def __init__(self, config: CriMeConfiguration):
         super(BTN, self).__init__(config)
-        self._a_long_req_object = ALongReq(config)
+        self._a_long_req_object = self.get_dependency(ALongReq)
 
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
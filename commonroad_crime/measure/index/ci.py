@@ -7,7 +7,6 @@ __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
 import logging
-import matplotlib.pyplot as plt
 import math
 import numpy as np
 
@@ -20,8 +19,9 @@ import commonroad_crime.utility.logger as utils_log
 from commonroad_crime.measure.time.pet import PET
 from commonroad.scenario.obstacle import DynamicObstacle
 import commonroad_crime.utility.general as utils_gen
-import commonroad_crime.utility.visualization as utils_vis
-from commonroad_crime.utility.visualization import TUMcolor
+
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +34,12 @@ class CI(CriMeBase):
 
     measure_name = TypeIndex.CI
     monotone = TypeMonotone.POS
+    pairwise_interaction = True
+    dependencies = [PET]
 
     def __init__(self, config: CriMeConfiguration):
         super(CI, self).__init__(config)
-        self._pet_object = PET(config)
+        self._pet_object = self.get_dependency(PET)
         self.ci_config = config.index.ci
 
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
@@ -150,14 +152,14 @@ class CI(CriMeBase):
         utils_vis.draw_state_list(
             self.rnd,
             self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-            color=TUMcolor.TUMlightgray,
+            color=utils_vis.TUMcolor.TUMlightgray,
             linewidth=1,
             start_time_step=0,
         )
         utils_vis.draw_state_list(
             self.rnd,
             self.other_vehicle.prediction.trajectory.state_list[self.time_step :],
-            color=TUMcolor.TUMlightgray,
+            color=utils_vis.TUMcolor.TUMlightgray,
             linewidth=1,
             start_time_step=0,
         )
@@ -165,20 +167,20 @@ class CI(CriMeBase):
             self.rnd,
             self.ego_vehicle,
             time_step=self.time_step,
-            color=TUMcolor.TUMblack,
+            color=utils_vis.TUMcolor.TUMblack,
         )
         utils_vis.draw_dyn_vehicle_shape(
             self.rnd,
             self.other_vehicle,
             time_step=self.time_step,
-            color=TUMcolor.TUMgreen,
+            color=utils_vis.TUMcolor.TUMgreen,
         )
 
         plt.title(f"{self.measure_name} of {self.value} time steps")
 
         x_i, y_i = self._pet_object.ca.exterior.xy
-        plt.plot(x_i, y_i, color=TUMcolor.TUMblack, zorder=1001)
-        plt.fill(x_i, y_i, color=TUMcolor.TUMred, zorder=1001)
+        plt.plot(x_i, y_i, color=utils_vis.TUMcolor.TUMblack, zorder=1001)
+        plt.fill(x_i, y_i, color=utils_vis.TUMcolor.TUMred, zorder=1001)
 
         state_ego = self.ego_vehicle.state_at_time(
             self._pet_object.ego_vehicle_enter_time
@@ -191,14 +193,14 @@ class CI(CriMeBase):
             self.rnd,
             self.ego_vehicle,
             time_step=self._pet_object.ego_vehicle_enter_time,
-            color=TUMcolor.TUMblack,
+            color=utils_vis.TUMcolor.TUMblack,
             alpha=0.5,
         )
         utils_vis.draw_dyn_vehicle_shape(
             self.rnd,
             self.other_vehicle,
             time_step=self._pet_object.other_vehicle_enter_time,
-            color=TUMcolor.TUMgreen,
+            color=utils_vis.TUMcolor.TUMgreen,
             alpha=0.5,
         )
         plt.arrow(
@@ -208,7 +210,7 @@ class CI(CriMeBase):
             dy=state_ego.velocity_y,
             head_width=0.4,
             width=0.1,
-            ec=TUMcolor.TUMblack,
+            ec=utils_vis.TUMcolor.TUMblack,
             zorder=1002,
         )
         plt.arrow(
@@ -218,7 +220,7 @@ class CI(CriMeBase):
             dy=state_other.velocity_y,
             head_width=0.4,
             width=0.1,
-            ec=TUMcolor.TUMgreen,
+            ec=utils_vis.TUMcolor.TUMgreen,
             zorder=1002,
         )
         if self.configuration.debug.draw_visualization:
@@ -11,15 +11,17 @@ import math
 
 import numpy as np
 from scipy.stats import truncnorm
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
 
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeIndex, TypeMonotone
 from commonroad_crime.measure.acceleration.a_long_req import ALongReq
-import commonroad_crime.utility.visualization as utils_vis
 import commonroad_crime.utility.logger as utils_log
+import commonroad_crime.utility.general as utils_gen
+
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+cm = utils_gen.lazy_import("matplotlib.cm")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -35,10 +37,12 @@ class CPI(CriMeBase):
 
     measure_name = TypeIndex.CPI
     monotone = TypeMonotone.POS
+    pairwise_interaction = True
+    dependencies = [ALongReq]
 
     def __init__(self, config: CriMeConfiguration):
         super(CPI, self).__init__(config)
-        self._a_lon_req_object = ALongReq(config)
+        self._a_lon_req_object = self.get_dependency(ALongReq)
         # TODO Add interface for different a_lon_min.
         # We assume the MADR (aka. Maximum Available Deceleration Rate)
         # is normally distributed.
@@ -11,7 +11,6 @@ import math
 import numpy as np
 
 from commonroad.scenario.obstacle import DynamicObstacle
-from matplotlib import pyplot as plt
 
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
@@ -19,8 +18,9 @@ from commonroad_crime.data_structure.type import TypeIndex, TypeMonotone
 import commonroad_crime.utility.solver as utils_sol
 import commonroad_crime.utility.logger as utils_log
 import commonroad_crime.utility.general as utils_gen
-import commonroad_crime.utility.visualization as utils_vis
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -66,8 +66,9 @@ class SOI(CriMeBase):
             dict.fromkeys(
                 [
                     lanelet
-                    for sublist in self.sce.lanelet_network.find_lanelet_by_position(
-                        list(minimum_space.exterior.coords) + [minimum_space.centroid]
+                    for sublist in self.lanelet_locator.find_lanelet_by_position(
+                        list(minimum_space.exterior.coords)
+                        + [minimum_space.centroid.coords[0]]
                     )
                     for lanelet in sublist
                 ]
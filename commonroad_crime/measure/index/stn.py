@@ -30,10 +30,12 @@ class STN(CriMeBase):
 
     measure_name = TypeIndex.STN
     monotone = TypeMonotone.POS
+    pairwise_interaction = True
+    dependencies = [ALatReq]
 
     def __init__(self, config: CriMeConfiguration):
         super(STN, self).__init__(config)
-        self._a_lat_req_object = ALatReq(config)
+        self._a_lat_req_object = self.get_dependency(ALatReq)
 
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
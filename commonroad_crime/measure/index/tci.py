@@ -8,7 +8,6 @@ __status__ = "beta"
 
 import logging
 import numpy as np
-import matplotlib.pyplot as plt
 
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
@@ -16,8 +15,9 @@ from commonroad_crime.data_structure.type import TypeIndex
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.logger as utils_log
 import commonroad_crime.utility.optimization as utils_opt
-import commonroad_crime.utility.visualization as utils_vis
-from commonroad_crime.utility.visualization import TUMcolor
+
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +62,7 @@ class TCI(CriMeBase):
         utils_vis.draw_state_list(
             self.rnd,
             traj.state_list[self.time_step :],
-            color=TUMcolor.TUMblue,
+            color=utils_vis.TUMcolor.TUMblue,
             linewidth=5,
         )
         plt.title(f"{self.measure_name} at time step {self.time_step}")
@@ -35,9 +35,7 @@ class LongJ(LatJ):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
             return np.nan
         evaluated_state = self.ego_vehicle.state_at_time(self.time_step)
-        lanelet_id = self.sce.lanelet_network.find_lanelet_by_position(
-            [self.ego_vehicle.state_at_time(time_step).position]
-        )[0]
+        lanelet_id = self.lanelet_locator.lanelet_ids_at(self.ego_vehicle, time_step)
         # orientation of the ego vehicle and the other vehicle
         ego_orientation = utils_sol.compute_lanelet_width_orientation(
             self.sce.lanelet_network.find_lanelet_by_id(lanelet_id[0]),
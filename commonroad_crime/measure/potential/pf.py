@@ -10,7 +10,6 @@ import logging
 
 from shapely.geometry import Polygon, Point, LineString
 import numpy as np
-import matplotlib.pyplot as plt
 
 from commonroad.scenario.state import State
 from commonroad.scenario.obstacle import StaticObstacle, DynamicObstacle
@@ -21,7 +20,9 @@ from commonroad_crime.data_structure.type import TypePotential, TypeMonotone
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.logger as utils_log
 import commonroad_crime.utility.solver as utils_sol
-import commonroad_crime.utility.visualization as utils_vis
+
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -44,13 +45,15 @@ class PF(CriMeBase):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
             return np.nan
         evaluated_state = self.ego_vehicle.state_at_time(self.time_step)
-        try:
-            self._s_ego, self._d_ego = self.clcs.convert_to_curvilinear_coords(
-                evaluated_state.position[0], evaluated_state.position[1]
+        ego_coordinates = self.curvilinear_projection.coordinates_at(
+            self.ego_vehicle, self.time_step
+        )
+        if np.isnan(ego_coordinates).any():
+            utils_log.print_and_log_error(
+                logger, "x and/or y coordinate outside of projection domain"
             )
-        except ValueError as err:
-            utils_log.print_and_log_error(logger, err)
             return None
+        self._s_ego, self._d_ego = ego_coordinates
         self.value = self.calc_total_potential(
             evaluated_state, self._s_ego, self._d_ego, verbose
         )
@@ -87,36 +90,34 @@ class PF(CriMeBase):
 
         # we assume that the lanelet are straight after converting to the curvilinear coordinate system
         # the lanelet that the vehicle is currently occupying
-        left_adj_lanelet = right_adj_lanelet = veh_lanelet = (
-            self.sce.lanelet_network.find_lanelet_by_id(
-                self.sce.lanelet_network.find_lanelet_by_position([veh_state.position])[
-                    0
-                ][0]
-            )
+        veh_lanelet = self.sce.lanelet_network.find_lanelet_by_id(
+            self.lanelet_locator.find_lanelet_by_position([veh_state.position])[0][0]
         )
         # assme that all the lanelets have the same width
         ll_width = utils_sol.compute_lanelet_width_orientation(
             veh_lanelet, veh_state.position
         )[0]
 
-        vertices_list = []
-        if left_adj_lanelet.adj_left_same_direction:
-            vertices_list.append(left_adj_lanelet.left_vertices)
-        if right_adj_lanelet.adj_right_same_direction:
-            vertices_list.append(right_adj_lanelet.right_vertices)
-        # collects all the lanelets
-        while left_adj_lanelet.adj_left_same_direction:
-            left_adj_lanelet = self.sce.lanelet_network.find_lanelet_by_id(
-                left_adj_lanelet.adj_left
-            )
-            if left_adj_lanelet.adj_left_same_direction:
-                vertices_list.append(left_adj_lanelet.left_vertices)
-        while right_adj_lanelet.adj_right_same_direction:
-            right_adj_lanelet = self.sce.lanelet_network.find_lanelet_by_id(
-                right_adj_lanelet.adj_right
-            )
-            if right_adj_lanelet.adj_right_same_direction:
-                vertices_list.append(right_adj_lanelet.right_vertices)
+        # collects the lane markings between the lanelets with the same direction
+        left_vertices = [
+            self.sce.lanelet_network.find_lanelet_by_id(lanelet_id).left_vertices
+            for lanelet_id in self.road_topology.adjacent_left(veh_lanelet.lanelet_id)[
+                :-1
+            ]
+        ]
+        right_vertices = [
+            self.sce.lanelet_network.find_lanelet_by_id(lanelet_id).right_vertices
+            for lanelet_id in self.road_topology.adjacent_right(veh_lanelet.lanelet_id)[
+                :-1
+            ]
+        ]
+        # the lane markings of the occupied lanelet come first
+        vertices_list = (
+            left_vertices[:1]
+            + right_vertices[:1]
+            + left_vertices[1:]
+            + right_vertices[1:]
+        )
 
         # compute the lane potential
         u_lane = 0.0
@@ -7,7 +7,6 @@ __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
 import numpy as np
-import matplotlib.pyplot as plt
 import logging
 
 from commonroad.scenario.obstacle import StaticObstacle, DynamicObstacle
@@ -22,10 +21,11 @@ from commonroad_crime.utility.simulation import (
 from commonroad_crime.measure.time.ttc_star import TTCStar
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeProbability, TypeMonotone
-import commonroad_crime.utility.visualization as utils_vis
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.logger as utils_log
-from commonroad_crime.utility.visualization import TUMcolor
+
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +41,9 @@ class P_MC(CriMeBase):
 
     measure_name = TypeProbability.P_MC
     monotone = TypeMonotone.POS
+    dependencies = [TTCStar]
+    # the result depends on the random samples
+    cache_results = False
 
     def __init__(self, config: CriMeConfiguration):
         super(P_MC, self).__init__(config)
@@ -70,7 +73,7 @@ class P_MC(CriMeBase):
         self.ego_state_list_set_cf = []  # collision-free
         self.ego_state_list_set_wc = []  # with collisions
         self.sim_time_steps = int(config_mc.prediction_horizon / self.sce.dt)
-        self.ttc_object = TTCStar(self.configuration)
+        self.ttc_object = self.get_dependency(TTCStar)
 
     def compute(self, time_step: int = 0, vehicle_id=None, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
@@ -163,9 +166,9 @@ class P_MC(CriMeBase):
         self._initialize_vis(figsize=figsize, plot_limit=plot_limits)
         self.rnd.render()
         for sl in self.ego_state_list_set_wc:
-            utils_vis.draw_state_list(self.rnd, sl, color=TUMcolor.TUMred)
+            utils_vis.draw_state_list(self.rnd, sl, color=utils_vis.TUMcolor.TUMred)
         for sl in self.ego_state_list_set_cf:
-            utils_vis.draw_state_list(self.rnd, sl, color=TUMcolor.TUMblue)
+            utils_vis.draw_state_list(self.rnd, sl, color=utils_vis.TUMcolor.TUMblue)
         plt.title(f"{self.measure_name} at time step {self.time_step} is {self.value}")
         if self.configuration.debug.save_plots:
             utils_vis.save_fig(
@@ -7,7 +7,6 @@ __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
 import math
-import matplotlib.pyplot as plt
 import logging
 import numpy as np
 from typing import Union
@@ -21,9 +20,10 @@ from commonroad_crime.data_structure.base import CriMeBase, TypeMonotone
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeTime
 import commonroad_crime.utility.logger as utils_log
-import commonroad_crime.utility.visualization as utils_vis
 import commonroad_crime.utility.general as utils_gen
-from commonroad_crime.utility.visualization import TUMcolor
+
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +37,9 @@ class ET(CriMeBase):
 
     measure_name = TypeTime.ET
     monotone = TypeMonotone.NEG
+    pairwise_interaction = True
+    # the conflict area and the enter and exit times of the evaluator are read by PSD
+    cache_results = False
 
     def __init__(self, config: CriMeConfiguration):
         super(ET, self).__init__(config)
@@ -46,6 +49,12 @@ class ET(CriMeBase):
         self.enter_time: Union[int, float] = math.inf
         self.exit_time: Union[int, float] = math.inf
 
+    def reset(self):
+        super(ET, self).reset()
+        self.ca = None
+        self.enter_time = math.inf
+        self.exit_time = math.inf
+
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
             return np.nan
@@ -117,13 +126,16 @@ class ET(CriMeBase):
             time_step, self.ego_vehicle
         )
         ca = None
-        for i in range(time_step, len(other_vehicle.prediction.trajectory.state_list)):
-            other_vehicle_state = other_vehicle.state_at_time(i)
-            other_vehicle_lanelet_id = (
-                self.sce.lanelet_network.find_lanelet_by_position(
-                    [other_vehicle_state.position]
-                )[0]
+        time_steps, other_vehicle_lanelet_ids = (
+            self.lanelet_locator.lanelet_ids_in_time_interval(
+                other_vehicle,
+                time_step,
+                len(other_vehicle.prediction.trajectory.state_list) - 1,
             )
+        )
+        for i, other_vehicle_lanelet_id in zip(
+            time_steps.tolist(), other_vehicle_lanelet_ids
+        ):
             intersected_ids = set(ref_path_lanelets_ego).intersection(
                 set(other_vehicle_lanelet_id)
             )
@@ -163,6 +175,8 @@ class ET(CriMeBase):
             )
 
         save_sce = self.sce
+        # the shared scenario must not be modified, hence a writable copy is used for the rendering
+        self.sce = self._context.copy_scenario()
         self.sce.remove_obstacle(self.ego_vehicle)
         self.sce.remove_obstacle(self.other_vehicle)
         self._initialize_vis(figsize=figsize, plot_limit=plot_limits)
@@ -171,14 +185,14 @@ class ET(CriMeBase):
         utils_vis.draw_state_list(
             self.rnd,
             self.ego_vehicle.prediction.trajectory.state_list[self.time_step :: 5],
-            color=TUMcolor.TUMlightgray,
+            color=utils_vis.TUMcolor.TUMlightgray,
             linewidth=1,
             start_time_step=0,
         )
         utils_vis.draw_state_list(
             self.rnd,
             self.other_vehicle.prediction.trajectory.state_list[self.time_step :: 5],
-            color=TUMcolor.TUMgreen,
+            color=utils_vis.TUMcolor.TUMgreen,
             linewidth=1,
             start_time_step=0,
         )
@@ -186,14 +200,14 @@ class ET(CriMeBase):
             self.rnd,
             self.ego_vehicle,
             time_step=self.time_step,
-            color=TUMcolor.TUMblack,
+            color=utils_vis.TUMcolor.TUMblack,
             alpha=1,
         )
         utils_vis.draw_dyn_vehicle_shape(
             self.rnd,
             self.other_vehicle,
             time_step=self.time_step,
-            color=TUMcolor.TUMgreen,
+            color=utils_vis.TUMcolor.TUMgreen,
             alpha=1,
         )
         if self.exit_time is not math.inf:
@@ -201,20 +215,20 @@ class ET(CriMeBase):
                 self.rnd,
                 self.ego_vehicle,
                 time_step=self.exit_time,
-                color=TUMcolor.TUMblack,
+                color=utils_vis.TUMcolor.TUMblack,
             )
         if self.enter_time is not math.inf:
             utils_vis.draw_dyn_vehicle_shape(
                 self.rnd,
                 self.ego_vehicle,
                 time_step=self.enter_time,
-                color=TUMcolor.TUMblack,
+                color=utils_vis.TUMcolor.TUMblack,
             )
         plt.title(f"{self.measure_name} at time step {self.time_step}")
         if self.ca is not None:
             x_i, y_i = self.ca.exterior.xy
-            plt.plot(x_i, y_i, color=TUMcolor.TUMblack, zorder=1001)
-            plt.fill(x_i, y_i, color=TUMcolor.TUMred, zorder=1001)
+            plt.plot(x_i, y_i, color=utils_vis.TUMcolor.TUMblack, zorder=1001)
+            plt.fill(x_i, y_i, color=utils_vis.TUMcolor.TUMred, zorder=1001)
 
         if self.configuration.debug.draw_visualization:
             if self.configuration.debug.save_plots:
@@ -231,16 +245,12 @@ class ET(CriMeBase):
         By querying the trajectory of the vehicle, the occupied lanelets based on the driving direction of the vehicle(
         dir_lanlet) can be obtained.
         """
-        init_lanelets = self.sce.lanelet_network.find_lanelet_by_position(
-            [vehicle.state_at_time(time_step).position]
-        )[0]
-        init_lanelets_set = set(init_lanelets)
-        for i in range(time_step, len(vehicle.prediction.trajectory.state_list)):
-            current_lanelets_set = set(
-                self.sce.lanelet_network.find_lanelet_by_position(
-                    [vehicle.state_at_time(i).position]
-                )[0]
-            )
+        _, lanelet_ids = self.lanelet_locator.lanelet_ids_in_time_interval(
+            vehicle, time_step, len(vehicle.prediction.trajectory.state_list) - 1
+        )
+        init_lanelets_set = set(lanelet_ids[0])
+        for current_lanelets in lanelet_ids:
+            current_lanelets_set = set(current_lanelets)
             lanelets_not_in_init = current_lanelets_set - init_lanelets_set
             # Find the moment when the vehicle just occupies new lanelets,
             # the predecessor of the newly occupied lanelets is the desired dir_lanelet.
@@ -263,84 +273,25 @@ class ET(CriMeBase):
         self, lanelet_id_a: Union[int, None], lanelet_id_b: Union[int, None]
     ):
         """
-        Using shapely to obtain the conflict area from the given lanelets
+        Obtain the conflict area of the given lanelets from the conflict areas of the lanelet network
         """
         if (lanelet_id_a is None) or (lanelet_id_b is None):
             return None
-        lanelet_a = self.sce.lanelet_network.find_lanelet_by_id(lanelet_id_a)
-        lanelet_b = self.sce.lanelet_network.find_lanelet_by_id(lanelet_id_b)
-        lanelet_a_polygon: Polygon = lanelet_a.polygon.shapely_object
-        lanelet_b_polygon: Polygon = lanelet_b.polygon.shapely_object
-        ca = lanelet_a_polygon.intersection(lanelet_b_polygon)
-        return ca
+        return self.road_topology.conflict_areas.conflict_area(
+            lanelet_id_a, lanelet_id_b
+        )
 
     def same_income(self, lanelet_id_a, lanelet_id_b):
         """
         Determine if the two lanelets originate from the same incoming at an intersection.
         """
-        lanelet_a = self.sce.lanelet_network.find_lanelet_by_id(lanelet_id_a)
-        lanelet_b = self.sce.lanelet_network.find_lanelet_by_id(lanelet_id_b)
-        first_incoming_lanelet_a = lanelet_a
-        first_incoming_lanelet_b = lanelet_b
-        while self.is_at_intersection(first_incoming_lanelet_a):
-            predecessor = first_incoming_lanelet_a.predecessor
-            if len(predecessor) >= 1:
-                first_incoming_lanelet_a = self.sce.lanelet_network.find_lanelet_by_id(
-                    predecessor[0]
-                )
-            else:
-                return False
-
-        while self.is_at_intersection(first_incoming_lanelet_b):
-            predecessor = first_incoming_lanelet_b.predecessor
-            if len(predecessor) >= 1:
-                first_incoming_lanelet_b = self.sce.lanelet_network.find_lanelet_by_id(
-                    predecessor[0]
-                )
-            else:
-                return False
-        if (
-            first_incoming_lanelet_a.lanelet_id
-            not in self.sce.lanelet_network.map_inc_lanelets_to_intersections.keys()
-        ):
-            return True
-        if (
-            first_incoming_lanelet_b.lanelet_id
-            not in self.sce.lanelet_network.map_inc_lanelets_to_intersections.keys()
-        ):
-            return True
-        intersection = self.sce.lanelet_network.map_inc_lanelets_to_intersections[
-            first_incoming_lanelet_a.lanelet_id
-        ]
-        incoming_a = intersection.map_incoming_lanelets[
-            first_incoming_lanelet_a.lanelet_id
-        ]
-        incoming_b = intersection.map_incoming_lanelets[
-            first_incoming_lanelet_b.lanelet_id
-        ]
-        return incoming_a.incoming_id == incoming_b.incoming_id
+        return self.road_topology.same_incoming(lanelet_id_a, lanelet_id_b)
 
     def is_at_intersection(self, lanelet_x: Lanelet):
         """
         Check whether the lanelet is at intersection.
         """
-        if LaneletType.INTERSECTION in lanelet_x.lanelet_type:
-            return True
-        at_intersection = False
-        for intersection in self.sce.lanelet_network.intersections:
-            for incoming in intersection.incomings:
-                successors_left = [successor for successor in incoming.successors_left]
-                successors_right = [
-                    successor for successor in incoming.successors_right
-                ]
-                successors_straight = [
-                    successor for successor in incoming.successors_straight
-                ]
-                if lanelet_x.lanelet_id in set(
-                    successors_straight + successors_left + successors_right
-                ):
-                    at_intersection = True
-        return at_intersection
+        return self.road_topology.is_at_intersection(lanelet_x.lanelet_id)
 
     def get_ref_path_lanelets_id(self, time_step: int, vehicle: DynamicObstacle):
         """
@@ -348,10 +299,9 @@ class ET(CriMeBase):
         """
         state_list = vehicle.prediction.trajectory.state_list
         ref_path_lanelets_id = set()
-        for i in range(time_step, len(state_list)):
-            lanelet_id = self.sce.lanelet_network.find_lanelet_by_position(
-                [vehicle.state_at_time(i).position]
-            )[0]
+        for lanelet_id in self.lanelet_locator.lanelet_ids_in_time_interval(
+            vehicle, time_step, len(state_list) - 1
+        )[1]:
             ref_path_lanelets_id.update(lanelet_id)
         return list(ref_path_lanelets_id)
 
@@ -360,20 +310,4 @@ class ET(CriMeBase):
         Compute the duration of the vehicle within the conflict area as well as its enter and exit time.
         """
         # In case conflict area does not exist, ET will be set to inf.
-        if ca is None:
-            return math.inf, math.inf, math.inf
-        already_in = False
-        enter_time = math.inf
-        for i in range(time_step, len(vehicle.prediction.trajectory.state_list)):
-            v_poly = vehicle.occupancy_at_time(i).shape.shapely_object
-            if v_poly.intersects(ca) and already_in is False:
-                # if the vehicle is already within the conflict area, then the enter time is set to 0
-                enter_time = max(i - 1, 0)
-                already_in = True
-            if not v_poly.intersects(ca) and already_in is True:
-                exit_time = i
-                return exit_time - enter_time, enter_time, exit_time
-        if enter_time is math.inf:
-            return math.inf, math.inf, math.inf
-        else:
-            return math.inf, enter_time, math.inf
+        return self.conflict_area_timing.time_info(vehicle, time_step, ca)
@@ -6,7 +6,6 @@ __maintainer__ = "Yuanfei Lin"
 __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
-import matplotlib.pyplot as plt
 import numpy as np
 import logging
 from typing import Union
@@ -16,12 +15,13 @@ from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeTime, TypeMonotone
 from commonroad_crime.measure.time.et import ET
 import commonroad_crime.utility.logger as utils_log
-import commonroad_crime.utility.visualization as utils_vis
-from commonroad_crime.utility.visualization import TUMcolor
 import commonroad_crime.utility.general as utils_gen
 from commonroad.scenario.scenario import Tag
 from commonroad.scenario.obstacle import DynamicObstacle
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +34,8 @@ class PET(ET):
 
     measure_name = TypeTime.PET
     monotone = TypeMonotone.NEG
+    # the enter and exit times of the evaluator are used by CI
+    cache_results = False
 
     def __init__(self, config: CriMeConfiguration):
         super(PET, self).__init__(config)
@@ -44,6 +46,15 @@ class PET(ET):
         self.ego_vehicle_enter_time: Union[float, int] = math.inf
         self.case_one: bool = False
 
+    def reset(self):
+        super(PET, self).reset()
+        self.ca = None
+        self.other_vehicle_exit_time = math.inf
+        self.other_vehicle_enter_time = math.inf
+        self.ego_vehicle_exit_time = math.inf
+        self.ego_vehicle_enter_time = math.inf
+        self.case_one = False
+
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
             return np.nan
@@ -148,14 +159,14 @@ class PET(ET):
         utils_vis.draw_state_list(
             self.rnd,
             self.ego_vehicle.prediction.trajectory.state_list[self.time_step :: 5],
-            color=TUMcolor.TUMlightgray,
+            color=utils_vis.TUMcolor.TUMlightgray,
             linewidth=1,
             start_time_step=0,
         )
         utils_vis.draw_state_list(
             self.rnd,
             self.other_vehicle.prediction.trajectory.state_list[self.time_step :: 5],
-            color=TUMcolor.TUMgreen,
+            color=utils_vis.TUMcolor.TUMgreen,
             linewidth=1,
             start_time_step=0,
         )
@@ -163,14 +174,14 @@ class PET(ET):
             self.rnd,
             self.ego_vehicle,
             time_step=self.time_step,
-            color=TUMcolor.TUMblack,
+            color=utils_vis.TUMcolor.TUMblack,
             alpha=1,
         )
         utils_vis.draw_dyn_vehicle_shape(
             self.rnd,
             self.other_vehicle,
             time_step=self.time_step,
-            color=TUMcolor.TUMgreen,
+            color=utils_vis.TUMcolor.TUMgreen,
             alpha=1,
         )
         if self.case_one is True:
@@ -179,14 +190,14 @@ class PET(ET):
                     self.rnd,
                     self.ego_vehicle,
                     time_step=self.ego_vehicle_exit_time,
-                    color=TUMcolor.TUMblack,
+                    color=utils_vis.TUMcolor.TUMblack,
                 )
             if self.other_vehicle_enter_time is not math.inf:
                 utils_vis.draw_dyn_vehicle_shape(
                     self.rnd,
                     self.other_vehicle,
                     time_step=self.other_vehicle_enter_time,
-                    color=TUMcolor.TUMgreen,
+                    color=utils_vis.TUMcolor.TUMgreen,
                 )
         elif self.case_one is False:
             if self.other_vehicle_exit_time is not math.inf:
@@ -194,21 +205,21 @@ class PET(ET):
                     self.rnd,
                     self.other_vehicle,
                     time_step=self.other_vehicle_exit_time,
-                    color=TUMcolor.TUMgreen,
+                    color=utils_vis.TUMcolor.TUMgreen,
                 )
             if self.ego_vehicle_enter_time is not math.inf:
                 utils_vis.draw_dyn_vehicle_shape(
                     self.rnd,
                     self.ego_vehicle,
                     time_step=self.ego_vehicle_enter_time,
-                    color=TUMcolor.TUMblack,
+                    color=utils_vis.TUMcolor.TUMblack,
                 )
 
         plt.title(f"{self.measure_name} at time step {self.time_step}")
         if self.ca is not None:
             x_i, y_i = self.ca.exterior.xy
-            plt.plot(x_i, y_i, color=TUMcolor.TUMblack, zorder=1001)
-            plt.fill(x_i, y_i, color=TUMcolor.TUMred, zorder=1001)
+            plt.plot(x_i, y_i, color=utils_vis.TUMcolor.TUMblack, zorder=1001)
+            plt.fill(x_i, y_i, color=utils_vis.TUMcolor.TUMred, zorder=1001)
 
         if self.configuration.debug.draw_visualization:
             if self.configuration.debug.save_plots:
@@ -221,6 +232,8 @@ class PET(ET):
                 plt.show()
 
     def sce_without_ego_and_other(self):
+        # the shared scenario must not be modified, hence a writable copy is used
+        self.sce = self._context.copy_scenario()
         self.sce.remove_obstacle(self.ego_vehicle)
         self.sce.remove_obstacle(self.other_vehicle)
 
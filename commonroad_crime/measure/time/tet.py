@@ -37,15 +37,7 @@ class TET(TIT):
         """
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
             return np.nan
-        tau = self.configuration.time.tau
-        state_list = self.ego_vehicle.prediction.trajectory.state_list
-
-        self.value = 0
-        for i in range(time_step, len(state_list)):
-            ttc_result = self.ttc_object.compute(vehicle_id, i, verbose=verbose)
-            self._ttc_cache[i] = ttc_result
-            if ttc_result <= tau:
-                self.value += self.dt
+        self.value, _ = self._compute_exposure(vehicle_id, self.time_step, verbose)
         self.value = utils_gen.int_round(self.value, 4)
         utils_log.print_and_log_info(
             logger, f"*\t\t {self.measure_name} = {self.value}", verbose
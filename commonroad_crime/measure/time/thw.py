@@ -6,7 +6,6 @@ __maintainer__ = "Yuanfei Lin"
 __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
-import matplotlib.pyplot as plt
 import logging
 import math
 import numpy as np
@@ -17,10 +16,11 @@ from commonroad.scenario.obstacle import Obstacle
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeTime, TypeMonotone
-import commonroad_crime.utility.visualization as utils_vis
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.logger as utils_log
-from commonroad_crime.utility.visualization import TUMcolor
+
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +32,7 @@ class THW(CriMeBase):
 
     measure_name = TypeTime.THW
     monotone = TypeMonotone.NEG
+    pairwise_interaction = True
 
     def __init__(self, config: CriMeConfiguration):
         super(THW, self).__init__(config)
@@ -48,55 +49,57 @@ class THW(CriMeBase):
         return add_on
 
     def cal_headway(self, verbose=True):
-        try:
-            other_position = self.other_vehicle.state_at_time(self.time_step).position
-            other_s, _ = self.clcs.convert_to_curvilinear_coords(
-                other_position[0], other_position[1]
-            )
-        except ValueError as e:
+        projection = self.curvilinear_projection
+        other_coordinates = projection.coordinates_at(
+            self.other_vehicle, self.time_step
+        )
+        if np.isnan(other_coordinates).any():
             utils_log.print_and_log_warning(
                 logger,
                 f"* <THW> During the projection of the vehicle {self.other_vehicle.obstacle_id} "
-                f"at time step {self.time_step}: {e}",
+                f"at time step {self.time_step}: outside of projection domain",
                 verbose,
             )
             # out of projection domain: the other vehicle is far away
             return math.inf
-        try:
-            ego_position = self.ego_vehicle.state_at_time(self.time_step).position
-            ego_s, _ = self.clcs.convert_to_curvilinear_coords(
-                ego_position[0], ego_position[1]
-            )
-        except ValueError as e:
+        ego_coordinates = projection.coordinates_at(self.ego_vehicle, self.time_step)
+        if np.isnan(ego_coordinates).any():
             utils_log.print_and_log_warning(
                 logger,
                 f"* <THW> During the projection of the ego vehicle with id {self.ego_vehicle.obstacle_id} "
-                f"at time step {self.time_step}: {e}",
+                f"at time step {self.time_step}: outside of projection domain",
                 verbose,
             )
             # out of projection domain: the ref path should be problematic
             return math.nan
 
         # additional position for the vehicles
-        ego_s += self._compute_vehicle_add_on(self.ego_vehicle)
-        other_s -= self._compute_vehicle_add_on(self.other_vehicle)
+        ego_add_on = self._compute_vehicle_add_on(self.ego_vehicle)
+        ego_s = ego_coordinates[0] + ego_add_on
+        other_s = other_coordinates[0] - self._compute_vehicle_add_on(
+            self.other_vehicle
+        )
 
         if ego_s > other_s:
             return math.inf
         # another option is (other_s-ego_s)/self.ego_vehicle.state_at_time(self.time_step).velocity
         # here since the predicted trajectory is given, we use it to make the result more accurate
-        for ts in range(
-            self.time_step + 1, self.ego_vehicle.prediction.final_time_step + 1
-        ):
-            ego_position = self.ego_vehicle.state_at_time(ts).position
-            ego_s, _ = self.clcs.convert_to_curvilinear_coords(
-                ego_position[0], ego_position[1]
+        time_steps, ego_coordinates = projection.coordinates_in_time_interval(
+            self.ego_vehicle,
+            self.time_step + 1,
+            self.ego_vehicle.prediction.final_time_step,
+        )
+        # first time step at which the ego vehicle has passed the other vehicle: the running maximum of the
+        # longitudinal positions is sorted, positions outside the projection domain are skipped
+        ego_s = np.maximum.accumulate(
+            np.where(np.isnan(ego_coordinates[0]), -np.inf, ego_coordinates[0])
+        )
+        index = np.searchsorted(ego_s + ego_add_on, other_s, side="right")
+        if index < len(time_steps):
+            return utils_gen.int_round(
+                (time_steps[index] - self.time_step) * self.dt,
+                str(self.dt)[::-1].find("."),
             )
-            ego_s += self._compute_vehicle_add_on(self.ego_vehicle)
-            if ego_s > other_s:
-                return utils_gen.int_round(
-                    (ts - self.time_step) * self.dt, str(self.dt)[::-1].find(".")
-                )
         return math.inf
 
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
@@ -131,7 +134,7 @@ class THW(CriMeBase):
         utils_vis.draw_state_list(
             self.rnd,
             self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-            color=TUMcolor.TUMblue,
+            color=utils_vis.TUMcolor.TUMblue,
             linewidth=5,
         )
         if self.value > 0 and self.value is not math.inf:
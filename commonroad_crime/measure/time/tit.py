@@ -6,19 +6,21 @@ __maintainer__ = "Yuanfei Lin"
 __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
-import matplotlib.pyplot as plt
 import numpy as np
 import logging
+from typing import Dict, Tuple
 
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
+from commonroad_crime.data_structure.result_cache import configuration_hash
 from commonroad_crime.data_structure.type import TypeTime, TypeMonotone
 from commonroad_crime.measure.time.ttc import TTC
-import commonroad_crime.utility.visualization as utils_vis
-from commonroad_crime.utility.visualization import TUMcolor
 import commonroad_crime.utility.logger as utils_log
 import commonroad_crime.utility.general as utils_gen
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,11 +32,79 @@ class TIT(CriMeBase):
 
     measure_name = TypeTime.TIT
     monotone = TypeMonotone.POS
+    pairwise_interaction = True
+    dependencies = [TTC]
 
     def __init__(self, config: CriMeConfiguration):
         super(TIT, self).__init__(config)
-        self.ttc_object = TTC(config)
-        self._ttc_cache = dict()
+        self.ttc_object = self.get_dependency(TTC)
+        # TTC series w.r.t. each vehicle: {vehicle_id: {time_step: ttc}}, reused for all time steps
+        self._ttc_cache: Dict[int, Dict[int, float]] = dict()
+        # suffix sums of the exposure of each vehicle: {vehicle_id: (first time step, TET, TIT)}
+        self._exposure_cache: Dict[int, Tuple[int, np.ndarray, np.ndarray]] = dict()
+        self._ttc_cache_config = None
+
+    def compute_ttc_series(
+        self, vehicle_id: int, time_step: int = 0, verbose: bool = False
+    ) -> Dict[int, float]:
+        """
+        Returns the TTC w.r.t. the vehicle from the given time step to the end of the trajectory of the ego vehicle.
+        The series is stored per vehicle, so that only the time steps that have not been evaluated before are
+        computed.
+
+        :param vehicle_id: id of the other vehicle
+        :param time_step: first time step
+        :param verbose: whether to print the logs
+        """
+        config_hash = (
+            self._context.context_id,
+            self.ego_vehicle.obstacle_id,
+            configuration_hash(self.configuration),
+        )
+        if config_hash != self._ttc_cache_config:
+            # e.g., the scenario or tau has been changed
+            self._ttc_cache.clear()
+            self._exposure_cache.clear()
+            self._ttc_cache_config = config_hash
+        ttc_series = self._ttc_cache.setdefault(vehicle_id, dict())
+        state_list = self.ego_vehicle.prediction.trajectory.state_list
+        time_steps = [
+            ts for ts in range(time_step, len(state_list)) if ts not in ttc_series
+        ]
+        if time_steps:
+            ttc_results = self.ttc_object.compute_matrix(
+                [vehicle_id], time_steps, verbose=verbose
+            )[0].tolist()
+            ttc_series.update(zip(time_steps, ttc_results))
+            self._exposure_cache.pop(vehicle_id, None)
+        return ttc_series
+
+    def _compute_exposure(
+        self, vehicle_id: int, time_step: int, verbose: bool
+    ) -> Tuple[float, float]:
+        """
+        Computes the time exposed and the time integrated TTC w.r.t. the vehicle from the given time step using the
+        suffix sums over the TTC series.
+        """
+        ttc_series = self.compute_ttc_series(vehicle_id, time_step, verbose)
+        if vehicle_id not in self._exposure_cache:
+            tau = self.configuration.time.tau
+            time_steps = sorted(ttc_series)
+            ttc_results = np.array([ttc_series[ts] for ts in time_steps], dtype=float)
+            with np.errstate(invalid="ignore"):
+                exposed = ttc_results <= tau
+            exposed_time = np.where(exposed, self.dt, 0.0)
+            integrated_time = np.where(exposed, (tau - ttc_results) * self.dt, 0.0)
+            self._exposure_cache[vehicle_id] = (
+                time_steps[0] if time_steps else time_step,
+                np.cumsum(exposed_time[::-1])[::-1],
+                np.cumsum(integrated_time[::-1])[::-1],
+            )
+        first_time_step, tet_sums, tit_sums = self._exposure_cache[vehicle_id]
+        index = time_step - first_time_step
+        if index >= len(tet_sums):
+            return 0.0, 0.0
+        return float(tet_sums[index]), float(tit_sums[index])
 
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
         """
@@ -44,16 +114,7 @@ class TIT(CriMeBase):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
             return np.nan
 
-        tau = self.configuration.time.tau
-        state_list = self.ego_vehicle.prediction.trajectory.state_list
-        self._ttc_cache.clear()
-
-        self.value = 0
-        for i in range(self.time_step, len(state_list)):
-            ttc_result = self.ttc_object.compute(vehicle_id, i, verbose=verbose)
-            self._ttc_cache[i] = ttc_result
-            if ttc_result <= tau:
-                self.value += (tau - ttc_result) * self.dt
+        _, self.value = self._compute_exposure(vehicle_id, self.time_step, verbose)
         self.value = utils_gen.int_round(self.value, 4)
         utils_log.print_and_log_info(
             logger, f"*\t\t {self.measure_name} = {self.value}", verbose
@@ -68,8 +129,9 @@ class TIT(CriMeBase):
         plt.ylabel("TTC")
 
         # Extract the time_step and ttc_result from the cache dictionary
-        time_step_list = list(self._ttc_cache.keys())
-        ttc_result_list = [val for val in self._ttc_cache.values()]
+        ttc_series = self._ttc_cache.get(self.other_vehicle.obstacle_id, dict())
+        time_step_list = sorted(ts for ts in ttc_series if ts >= self.time_step)
+        ttc_result_list = [ttc_series[ts] for ts in time_step_list]
 
         # Find the indices where ttc_result_list < tau
         below_tau_indices = np.where(np.array(ttc_result_list) < tau)[0]
@@ -78,7 +140,7 @@ class TIT(CriMeBase):
         plt.plot(time_step_list, ttc_result_list, label="TTC curve")
 
         # Plot the tau curve as a horizontal line
-        plt.axhline(y=tau, color=TUMcolor.TUMred, linestyle="--", label="Tau")
+        plt.axhline(y=tau, color=utils_vis.TUMcolor.TUMred, linestyle="--", label="Tau")
 
         # Fill the region where ttc_result < tau with the predefined color
         for i in range(1, len(below_tau_indices)):
@@ -88,7 +150,7 @@ class TIT(CriMeBase):
                 time_step_list[idx1 : idx2 + 1],
                 ttc_result_list[idx1 : idx2 + 1],
                 tau,
-                color=TUMcolor.TUMred,
+                color=utils_vis.TUMcolor.TUMred,
                 alpha=0.5,
             )
 
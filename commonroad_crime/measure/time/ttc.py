@@ -8,22 +8,25 @@ __status__ = "beta"
 
 import logging
 import math
+from typing import List, Tuple, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 from commonroad.scenario.obstacle import DynamicObstacle
 
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
+from commonroad_crime.data_structure.result_cache import ResultCache
+from commonroad_crime.data_structure.trajectory_store import StateColumn
 from commonroad_crime.data_structure.type import TypeTime, TypeMonotone
 import commonroad_crime.utility.logger as utils_log
 import commonroad_crime.utility.solver as utils_sol
 import commonroad_crime.utility.general as utils_gen
-import commonroad_crime.utility.visualization as utils_vis
-from commonroad_crime.utility.visualization import TUMcolor
 
 from commonroad_crime.measure.distance.hw import HW
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,100 +38,162 @@ class TTC(CriMeBase):
 
     measure_name = TypeTime.TTC
     monotone = TypeMonotone.NEG
+    pairwise_interaction = True
+    dependencies = [HW]
 
     def __init__(self, config: CriMeConfiguration):
         super(TTC, self).__init__(config)
-        self._hw_object = HW(config)
+        self._hw_object = self.get_dependency(HW)
 
-    def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
-        if not self.validate_update_states_log(vehicle_id, time_step, verbose):
-            return np.nan
-        state = self.ego_vehicle.state_at_time(time_step)
-        state_other = self.other_vehicle.state_at_time(time_step)
-        lanelet_id = self.sce.lanelet_network.find_lanelet_by_position(
-            [self.ego_vehicle.state_at_time(time_step).position]
-        )[0]
+    def _compute_relative_motion(
+        self, vehicle_id: int, time_step: int, verbose: bool
+    ) -> Union[Tuple[float, float, float], None]:
         """
-        Using https://www.diva-portal.org/smash/get/diva2:617438/FULLTEXT01.pdf 
-        "Collision Avoidance Theory with Application to Automotive Collision Mitigation" formula 5.26
+        Computes the distance along the lanelet and the velocity and the acceleration of the other vehicle relative
+        to the ego vehicle. If the TTC is already determined, e.g., since the other vehicle is not ahead, it is stored
+        in `self.value` and None is returned.
         """
+        state = self.trajectories.state(self.ego_vehicle, time_step)
+        state_other = self.trajectories.state(self.other_vehicle, time_step)
+        lanelet_id = self.lanelet_locator.lanelet_ids_at(self.ego_vehicle, time_step)
 
         # distance along the lanelet
         delta_d = self._hw_object.compute(vehicle_id, time_step, verbose)
 
         if delta_d == math.inf:
             self.value = math.inf
+            return None
+        # orientation of the ego vehicle and the other vehicle
+        try:
+            ego_orientation = utils_sol.compute_lanelet_width_orientation(
+                self.sce.lanelet_network.find_lanelet_by_id(lanelet_id[0]),
+                state[StateColumn.POSITION],
+            )[1]
+        except ValueError as e:
+            utils_log.print_and_log_warning(
+                logger,
+                f"* <TTC> During the projection of the ego vehicle {self.ego_vehicle.obstacle_id} "
+                f"at time step {self.time_step}: {e}",
+            )
+            self.value = math.nan
+            return None
+        try:
+            other_orientation = utils_sol.compute_lanelet_width_orientation(
+                self.sce.lanelet_network.find_lanelet_by_id(lanelet_id[0]),
+                state_other[StateColumn.POSITION],
+            )[1]
+        except ValueError as e:
+            utils_log.print_and_log_warning(
+                logger,
+                f"* <TTC> During the projection of the vehicle {self.other_vehicle.obstacle_id} "
+                f"at time step {self.time_step}: {e}",
+            )
+            # out of projection domain: the other vehicle is far away
+            self.value = math.inf
+            return None
+        # actual velocity and acceleration of both vehicles along the lanelet
+        v_ego = (
+            np.sign(state[StateColumn.VELOCITY])
+            * math.sqrt(
+                state[StateColumn.VELOCITY] ** 2 + state[StateColumn.VELOCITY_Y] ** 2
+            )
+            * math.cos(ego_orientation)
+        )
+        # include the directions
+        a_ego = (
+            np.sign(state[StateColumn.ACCELERATION])
+            * math.sqrt(
+                state[StateColumn.ACCELERATION] ** 2
+                + state[StateColumn.ACCELERATION_Y] ** 2
+            )
+            * math.cos(ego_orientation)
+        )
+        if isinstance(self.other_vehicle, DynamicObstacle):
+            v_other = math.sqrt(
+                state_other[StateColumn.VELOCITY] ** 2
+                + state_other[StateColumn.VELOCITY_Y] ** 2
+            ) * math.cos(other_orientation)
+            a_other = math.sqrt(
+                state_other[StateColumn.ACCELERATION] ** 2
+                + state_other[StateColumn.ACCELERATION_Y] ** 2
+            ) * math.cos(other_orientation)
         else:
-            # orientation of the ego vehicle and the other vehicle
-
-            try:
-                ego_orientation = utils_sol.compute_lanelet_width_orientation(
-                    self.sce.lanelet_network.find_lanelet_by_id(lanelet_id[0]),
-                    self.ego_vehicle.state_at_time(time_step).position,
-                )[1]
-            except ValueError as e:
-                utils_log.print_and_log_warning(
-                    logger,
-                    f"* <TTC> During the projection of the ego vehicle {self.ego_vehicle.obstacle_id} "
-                    f"at time step {self.time_step}: {e}",
-                )
-                self.value = math.nan
-            else:
-                try:
-                    other_orientation = utils_sol.compute_lanelet_width_orientation(
-                        self.sce.lanelet_network.find_lanelet_by_id(lanelet_id[0]),
-                        self.other_vehicle.state_at_time(time_step).position,
-                    )[1]
-                except ValueError as e:
-                    utils_log.print_and_log_warning(
-                        logger,
-                        f"* <TTC> During the projection of the vehicle {self.other_vehicle.obstacle_id} "
-                        f"at time step {self.time_step}: {e}",
-                    )
-                    # out of projection domain: the other vehicle is far away
-                    self.value = math.inf
-                else:
-                    # actual velocity and acceleration of both vehicles along the lanelet
-                    v_ego = (
-                        np.sign(state.velocity)
-                        * math.sqrt(state.velocity**2 + state.velocity_y**2)
-                        * math.cos(ego_orientation)
-                    )
-                    # include the directions
-                    a_ego = (
-                        np.sign(state.acceleration)
-                        * math.sqrt(state.acceleration**2 + state.acceleration_y**2)
-                        * math.cos(ego_orientation)
-                    )
-                    if isinstance(self.other_vehicle, DynamicObstacle):
-                        v_other = math.sqrt(
-                            state_other.velocity**2 + state_other.velocity_y**2
-                        ) * math.cos(other_orientation)
-                        a_other = math.sqrt(
-                            state_other.acceleration**2 + state_other.acceleration_y**2
-                        ) * math.cos(other_orientation)
-                    else:
-                        v_other = 0.0
-                        a_other = 0.0
-                    delta_v = v_other - v_ego
-                    delta_a = a_other - a_ego
-
-                    if delta_v < 0 and abs(delta_a) <= 0.1:
-                        self.value = utils_gen.int_round(-(delta_d / delta_v), 2)
-                    elif delta_v**2 - 2 * delta_d * delta_a < 0:
-                        self.value = math.inf
-                    elif (delta_v < 0 and delta_a != 0) or (delta_v >= 0 > delta_a):
-                        first = -(delta_v / delta_a)
-                        second = np.sqrt(delta_v**2 - 2 * delta_d * delta_a) / delta_a
-                        self.value = utils_gen.int_round(first - second, 2)
-                    else:  # delta_v >= 0 and delta_a >= 0
-                        self.value = math.inf
+            v_other = 0.0
+            a_other = 0.0
+        return delta_d, v_other - v_ego, a_other - a_ego
+
+    def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
+        if not self.validate_update_states_log(vehicle_id, time_step, verbose):
+            return np.nan
+        """
+        Using https://www.diva-portal.org/smash/get/diva2:617438/FULLTEXT01.pdf 
+        "Collision Avoidance Theory with Application to Automotive Collision Mitigation" formula 5.26
+        """
+        relative_motion = self._compute_relative_motion(vehicle_id, time_step, verbose)
+        if relative_motion is not None:
+            # the scalar computation is the reference for `utils_sol.compute_ttc_batch`
+            delta_d, delta_v, delta_a = relative_motion
+            if delta_v < 0 and abs(delta_a) <= 0.1:
+                self.value = utils_gen.int_round(-(delta_d / delta_v), 2)
+            elif delta_v**2 - 2 * delta_d * delta_a < 0:
+                self.value = math.inf
+            elif (delta_v < 0 and delta_a != 0) or (delta_v >= 0 > delta_a):
+                first = -(delta_v / delta_a)
+                second = np.sqrt(delta_v**2 - 2 * delta_d * delta_a) / delta_a
+                self.value = utils_gen.int_round(first - second, 2)
+            else:  # delta_v >= 0 and delta_a >= 0
+                self.value = math.inf
 
         utils_log.print_and_log_info(
             logger, f"*\t\t {self.measure_name} = {self.value}", verbose
         )
         return self.value
 
+    def compute_matrix(
+        self, vehicle_ids: List[int], time_steps: List[int], verbose: bool = False
+    ) -> np.ndarray:
+        """
+        Computes the TTC with respect to several vehicles over several time steps, e.g., for TET and TIT. The relative
+        motions are collected per vehicle and time step, and the closed-form TTC is evaluated for all of them at once
+        using `utils_sol.compute_ttc_batch`. Results in the `result_cache` are reused and new results are stored.
+
+        :param vehicle_ids: ids of the other vehicles
+        :param time_steps: time steps
+        :return: TTC of shape (len(vehicle_ids), len(time_steps)); NaN if a vehicle has no state at a time step
+        """
+        result_cache = CriMeBase.result_cache if self.cache_results else None
+        shape = (len(vehicle_ids), len(time_steps))
+        ttc_matrix = np.full(shape, np.nan)
+        relative_motion = np.full((3,) + shape, np.nan)
+        in_batch = np.zeros(shape, dtype=bool)
+        missing_keys = dict()
+        for i, vehicle_id in enumerate(vehicle_ids):
+            for j, time_step in enumerate(time_steps):
+                if result_cache is not None:
+                    # same key as for `compute`
+                    cache_key = self._result_cache_key(
+                        (("vehicle_id", vehicle_id), ("time_step", time_step))
+                    )
+                    value = result_cache.get(cache_key)
+                    if value is not ResultCache.MISS:
+                        ttc_matrix[i, j] = value
+                        continue
+                    missing_keys[(i, j)] = cache_key
+                if not self.validate_update_states_log(vehicle_id, time_step, verbose):
+                    continue
+                motion = self._compute_relative_motion(vehicle_id, time_step, verbose)
+                if motion is None:
+                    ttc_matrix[i, j] = self.value
+                else:
+                    relative_motion[:, i, j] = motion
+                    in_batch[i, j] = True
+        ttc_matrix[in_batch] = utils_sol.compute_ttc_batch(
+            *relative_motion[:, in_batch]
+        )
+        for (i, j), cache_key in missing_keys.items():
+            result_cache.put(cache_key, float(ttc_matrix[i, j]))
+        return ttc_matrix
+
     def visualize(self):
         if self.configuration.debug.plot_limits:
             plot_limits = self.configuration.debug.plot_limits
@@ -141,7 +206,7 @@ class TTC(CriMeBase):
         self._initialize_vis(plot_limit=plot_limits)
         self.rnd.draw_params.time_begin = self.time_step
         self.rnd.draw_params.dynamic_obstacle.occupancy.shape.facecolor = (
-            TUMcolor.TUMred
+            utils_vis.TUMcolor.TUMred
         )
         self.other_vehicle.draw(self.rnd)
         self.rnd.render()
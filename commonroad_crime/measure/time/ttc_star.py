@@ -9,29 +9,30 @@ __status__ = "beta"
 import copy
 import math
 import logging
-from typing import List
+from typing import TYPE_CHECKING, List, Union
 import numpy as np
-import matplotlib.pyplot as plt
 
-from commonroad.visualization.mp_renderer import MPRenderer
 from commonroad.scenario.state import CustomState, State
 from commonroad.scenario.scenario import TrajectoryPrediction
 from commonroad.scenario.trajectory import Trajectory
 
-import commonroad_dc.boundary.boundary as boundary
 import commonroad_dc.pycrcc as pycrcc
 from commonroad_dc.collision.collision_detection.pycrcc_collision_dispatch import (
-    create_collision_checker,
     create_collision_object,
 )
 
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
+from commonroad_crime.data_structure.trajectory_store import StateColumn
 from commonroad_crime.data_structure.type import TypeTime, TypeMonotone
-import commonroad_crime.utility.visualization as utils_vis
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.logger as utils_log
-from commonroad_crime.utility.visualization import TUMcolor
+
+if TYPE_CHECKING:
+    from commonroad.visualization.mp_renderer import MPRenderer
+
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -47,17 +48,17 @@ class TTCStar(CriMeBase):
 
     def __init__(self, config: CriMeConfiguration):
         super(TTCStar, self).__init__(config)
-        self.sce.remove_obstacle(self.ego_vehicle)
+        # the shared collision checker is built when it is first needed
+        self.collision_service
 
-        # creat collision checker
-        road_boundary_obstacle, _ = boundary.create_road_boundary_obstacle(
-            self.sce, method="aligned_triangulation", axis=2
+    @property
+    def collision_checker(self) -> pycrcc.CollisionChecker:
+        """
+        Collision checker with all obstacles except the ego vehicle and the road boundary.
+        """
+        return self.collision_service.collision_checker_without(
+            self.ego_vehicle.obstacle_id
         )
-        self.sce.add_objects(road_boundary_obstacle)
-        self.collision_checker = create_collision_checker(self.sce)
-        # remove the added objects from the scenario
-        self.sce.remove_obstacle(road_boundary_obstacle)
-        self.sce.add_objects(self.ego_vehicle)
 
     def detect_collision(self, state_list: List[State]) -> bool:
         """
@@ -85,14 +86,46 @@ class TTCStar(CriMeBase):
         updated_ego_vehicle.prediction = dynamic_obstacle_prediction
         co = create_collision_object(updated_ego_vehicle)
 
-        return self.collision_checker.collide(co)
+        return self.collision_service.collide(co, self.ego_vehicle.obstacle_id)
 
-    def draw_collision_checker(self, rnd: MPRenderer):
+    def _collide_time_variant(self, time_step: int, obbs: List[pycrcc.RectOBB]) -> bool:
+        """
+        Checks whether the occupancies of the ego vehicle starting at the time step collide.
+        """
+        ego = pycrcc.TimeVariantCollisionObject(time_step)
+        for obb in obbs:
+            ego.append_obstacle(obb)
+        return self.collision_service.collide(ego, self.ego_vehicle.obstacle_id)
+
+    def first_collision_index(
+        self, time_step: int, obbs: List[pycrcc.RectOBB]
+    ) -> Union[int, None]:
+        """
+        Returns the index of the first occupancy of the ego vehicle that collides, or None if none collides. The
+        whole trajectory is checked with one query, and the first colliding occupancy is then located by bisection
+        over the windows that are not yet known to be collision-free.
+
+        :param time_step: time step of the first occupancy
+        :param obbs: occupancies of the ego vehicle at consecutive time steps
+        """
+        if not obbs or not self._collide_time_variant(time_step, obbs):
+            return None
+        # the occupancies before `low` are collision-free and the ones up to `high` collide
+        low, high = 0, len(obbs) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self._collide_time_variant(time_step + low, obbs[low : middle + 1]):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def draw_collision_checker(self, rnd: "MPRenderer"):
         """
         Plots the collision checker.
         """
-        rnd.draw_params.shape.facecolor = TUMcolor.TUMgray
-        rnd.draw_params.shape.edgecolor = TUMcolor.TUMdarkgray
+        rnd.draw_params.shape.facecolor = utils_vis.TUMcolor.TUMgray
+        rnd.draw_params.shape.edgecolor = utils_vis.TUMcolor.TUMdarkgray
         rnd.draw_params.shape.draw_mesh = False
         self.collision_checker.draw(rnd)
 
@@ -104,7 +137,9 @@ class TTCStar(CriMeBase):
             tstc = int(utils_gen.int_round(self.value / self.dt, 0)) + self.time_step
             utils_vis.draw_dyn_vehicle_shape(self.rnd, self.ego_vehicle, tstc)
             utils_vis.draw_state(
-                self.rnd, self.ego_vehicle.state_at_time(tstc), TUMcolor.TUMred
+                self.rnd,
+                self.ego_vehicle.state_at_time(tstc),
+                utils_vis.TUMcolor.TUMred,
             )
             if (
                 self.time_step == 0
@@ -115,7 +150,9 @@ class TTCStar(CriMeBase):
                 ] + self.ego_vehicle.prediction.trajectory.state_list
             else:
                 sl = self.ego_vehicle.prediction.trajectory.state_list[self.time_step :]
-            utils_vis.draw_state_list(self.rnd, sl, self.time_step, TUMcolor.TUMblue)
+            utils_vis.draw_state_list(
+                self.rnd, sl, self.time_step, utils_vis.TUMcolor.TUMblue
+            )
         else:
             tstc = self.value
         plt.title(f"{self.measure_name} at time step {self.time_step} is {self.value}")
@@ -128,37 +165,55 @@ class TTCStar(CriMeBase):
 
     def compute(self, time_step: int = 0, vehicle_id: int = None, verbose: bool = True):
         """
-        Detects the collision time given the trajectory of ego_vehicle using a for loop over
-        the state list.
+        Detects the collision time given the trajectory of ego_vehicle by checking the whole state list at once and
+        bisecting for the first colliding time step.
         """
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
             return np.nan
 
         state_list = self.ego_vehicle.prediction.trajectory.state_list
         self.value = math.inf
-        for i in range(time_step, len(state_list)):
-            # i-th time step
-            pos1 = self.ego_vehicle.state_at_time(i).position[0]
-            pos2 = self.ego_vehicle.state_at_time(i).position[1]
-            theta = self.ego_vehicle.state_at_time(i).orientation
-            # i: time_start_idx
-            ego = pycrcc.TimeVariantCollisionObject(i)
-            ego.append_obstacle(
-                pycrcc.RectOBB(
-                    0.5 * self.ego_vehicle.obstacle_shape.length,
-                    0.5 * self.ego_vehicle.obstacle_shape.width,
-                    theta,
-                    pos1,
-                    pos2,
-                )
+        if self.trajectories.dtype == np.float64:
+            time_steps, states = self.trajectories.states_in_time_interval(
+                self.ego_vehicle, time_step, len(state_list) - 1
             )
-            flag_collide = self.collision_checker.collide(ego)
-            if flag_collide:
-                self.value = utils_gen.int_round(
-                    (i - time_step) * self.dt, str(self.dt)[::-1].find(".")
+            time_steps = time_steps.tolist()
+            poses = zip(
+                states[StateColumn.POSITION_X].tolist(),
+                states[StateColumn.POSITION_Y].tolist(),
+                states[StateColumn.ORIENTATION].tolist(),
+            )
+        else:
+            # the poses of a reduced-precision store would shift the detected collisions
+            time_steps = [
+                ts
+                for ts in range(time_step, len(state_list))
+                if self.ego_vehicle.state_at_time(ts) is not None
+            ]
+            poses = [
+                (
+                    *self.ego_vehicle.state_at_time(ts).position,
+                    self.ego_vehicle.state_at_time(ts).orientation,
                 )
-                # once collides, loop ends -> the first colliding timestep as the ttc
-                break
+                for ts in time_steps
+            ]
+        obbs = [
+            pycrcc.RectOBB(
+                0.5 * self.ego_vehicle.obstacle_shape.length,
+                0.5 * self.ego_vehicle.obstacle_shape.width,
+                theta,
+                pos1,
+                pos2,
+            )
+            for pos1, pos2, theta in poses
+        ]
+        index = self.first_collision_index(time_step, obbs)
+        if index is not None:
+            # the first colliding time step as the ttc
+            self.value = utils_gen.int_round(
+                (time_steps[index] - time_step) * self.dt,
+                str(self.dt)[::-1].find("."),
+            )
         utils_log.print_and_log_info(
             logger, f"*\t\t {self.measure_name} = {self.value}", verbose
         )
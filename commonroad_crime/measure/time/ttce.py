@@ -6,7 +6,6 @@ __maintainer__ = "beta"
 __email__ = "commonroad@lists.lrz.de"
 __status__ = "Pre-alpha"
 
-import matplotlib.pyplot as plt
 import numpy as np
 import logging
 import math
@@ -17,8 +16,9 @@ from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeTime, TypeMonotone
 import commonroad_crime.utility.logger as utils_log
 import commonroad_crime.utility.general as utils_gen
-import commonroad_crime.utility.visualization as utils_vis
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +32,12 @@ class TTCE(CriMeBase):
 
     measure_name = TypeTime.TTCE
     monotone = TypeMonotone.NEG
+    pairwise_interaction = True
+    dependencies = [DCE]
 
     def __init__(self, config: CriMeConfiguration):
         super(TTCE, self).__init__(config)
-        self._dce_object = DCE(config)
+        self._dce_object = self.get_dependency(DCE)
 
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
         """
@@ -7,22 +7,22 @@ __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
 import math
-import matplotlib.pyplot as plt
-from typing import Union
+from typing import Dict, List, Tuple, Union
 import logging
 import numpy as np
 
-from commonroad.scenario.state import CustomState
+from commonroad.scenario.state import CustomState, State
 
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.utility.simulation import SimulationLong, SimulationLat, Maneuver
 from commonroad_crime.measure.time.ttc_star import TTCStar
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeTime
-import commonroad_crime.utility.visualization as utils_vis
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.logger as utils_log
-from commonroad_crime.utility.visualization import TUMcolor
+
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +35,9 @@ class TTM(CriMeBase):
     """
 
     measure_name = TypeTime.TTM
+    dependencies = [TTCStar]
+    # the selected state lists and the maneuvers of the evaluators are read by TTS and TTR
+    cache_results = False
 
     def __init__(self, config: CriMeConfiguration, maneuver: Union[Maneuver, None]):
         super(TTM, self).__init__(config)
@@ -45,7 +48,19 @@ class TTM(CriMeBase):
             self.simulator = SimulationLat(maneuver, self.ego_vehicle, config)
         else:
             self.simulator = None
-        self.ttc_object = TTCStar(config)
+        self.ttc_object = self.get_dependency(TTCStar)
+        self.ttc = None
+        self.selected_state_list = None
+        self.state_list_set = []
+        # start time step of the maneuver: (simulated state list, whether the maneuver is feasible and collision-free)
+        self._maneuver_results: Dict[int, Tuple[List[State], bool]] = {}
+
+    def _result_cache_key(self, key: tuple) -> tuple:
+        # evaluators of the same type differ by their maneuvers, e.g., for steering to the left and to the right
+        return super(TTM, self)._result_cache_key(key) + (self._maneuver,)
+
+    def reset(self):
+        super(TTM, self).reset()
         self.ttc = None
         self.selected_state_list = None
         self.state_list_set = []
@@ -81,14 +96,14 @@ class TTM(CriMeBase):
                 self.rnd,
                 [self.ego_vehicle.initial_state]
                 + self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-                color=TUMcolor.TUMblue,
+                color=utils_vis.TUMcolor.TUMblue,
                 linewidth=5,
             )
         else:
             utils_vis.draw_state_list(
                 self.rnd,
                 self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-                color=TUMcolor.TUMblue,
+                color=utils_vis.TUMcolor.TUMblue,
                 linewidth=5,
             )
         for sl in self.state_list_set:
@@ -96,14 +111,18 @@ class TTM(CriMeBase):
         if self.value not in [math.inf, -math.inf] and self.ttc:
             tstm = int(utils_gen.int_round(self.value / self.dt, 0)) + self.time_step
             utils_vis.draw_state(
-                self.rnd, self.ego_vehicle.state_at_time(tstm), TUMcolor.TUMgreen
+                self.rnd,
+                self.ego_vehicle.state_at_time(tstm),
+                utils_vis.TUMcolor.TUMgreen,
             )
             tstc = (
                 int(utils_gen.int_round(self.ttc_object.value / self.dt, 0))
                 + self.time_step
             )
             utils_vis.draw_state(
-                self.rnd, self.ego_vehicle.state_at_time(tstc), TUMcolor.TUMred
+                self.rnd,
+                self.ego_vehicle.state_at_time(tstc),
+                utils_vis.TUMcolor.TUMred,
             )
 
             tstc = int(utils_gen.int_round(self.ttc / self.dt, 0)) + self.time_step
@@ -111,7 +130,7 @@ class TTM(CriMeBase):
             utils_vis.draw_state_list(
                 self.rnd,
                 self.selected_state_list[tstm:],
-                color=TUMcolor.TUMgreen,
+                color=utils_vis.TUMcolor.TUMgreen,
                 linewidth=5,
             )
         else:
@@ -159,9 +178,31 @@ class TTM(CriMeBase):
         )
         return self.value
 
+    def maneuver_result(self, start_time_step: int) -> Tuple[List[State], bool]:
+        """
+        Returns the state list of the ego vehicle executing the maneuver from the start time step on and whether it is
+        feasible until the final time step and collision-free. The results only depend on the start time step and
+        are kept over the time steps, except for the start time steps that have passed.
+
+        :param start_time_step: time step at which the maneuver starts
+        """
+        result = self._maneuver_results.get(start_time_step)
+        if result is None:
+            state_list = self.simulator.simulate_state_list(start_time_step)
+            # flag for successful simulation, 0: False, 1: True
+            flag_succ = (
+                state_list[-1].time_step == self.ego_vehicle.prediction.final_time_step
+            )
+            # flag for collision, 0: False, 1: True
+            flag_coll = flag_succ and self.ttc_object.detect_collision(state_list)
+            result = (state_list, flag_succ and not flag_coll)
+            self._maneuver_results[start_time_step] = result
+        return result
+
     def binary_search(self, initial_step: int) -> float:
         """
-        Binary search to find the last time to execute the maneuver.
+        Binary search to find the last time to execute the maneuver. The maneuvers are only simulated for the start
+        time steps that have not been checked at a previous time step, which are mostly the ones around the result.
         """
         ttm = -math.inf
         low = initial_step
@@ -170,24 +211,19 @@ class TTM(CriMeBase):
                 self.ttc / self.dt + self.time_step, str(self.dt)[::-1].find(".")
             )
         )
+        # the maneuvers starting before the time step are not needed anymore
+        for start_time_step in [ts for ts in self._maneuver_results if ts < low]:
+            del self._maneuver_results[start_time_step]
         while low < high:
             mid = int((low + high) / 2)
-            state_list = self.simulator.simulate_state_list(mid)
-            # flag for successful simulation, 0: False, 1: True
-            flag_succ = (
-                state_list[-1].time_step == self.ego_vehicle.prediction.final_time_step
-            )
-            if not flag_succ:
-                high = mid
-                continue
-            self.state_list_set.append(state_list[mid:])
-            # flag for collision, 0: False, 1: True
-            flag_coll = self.ttc_object.detect_collision(state_list)
-            if not flag_coll:
+            state_list, flag_safe = self.maneuver_result(mid)
+            if state_list[-1].time_step == self.ego_vehicle.prediction.final_time_step:
+                self.state_list_set.append(state_list[mid:])
+            if flag_safe:
                 low = mid + 1
-                self.selected_state_list = state_list
             else:
                 high = mid
         if low != initial_step:
+            self.selected_state_list = self.maneuver_result(low - 1)[0]
             ttm = (low - initial_step - 1) * self.dt
         return ttm
@@ -31,20 +31,24 @@ class TTR(TTM):
     """
 
     measure_name = TypeTime.TTR
+    dependencies = TTM.dependencies + [TTB, TTK, TTS]
 
     def __init__(self, config: CriMeConfiguration):
         super(TTR, self).__init__(config, Maneuver.NONE)
-        self._evaluator = None
+        self._evaluator = [
+            self.get_dependency(TTB),
+            self.get_dependency(TTK),
+            self.get_dependency(TTS),
+        ]
 
     def initialize_evaluator(self, time_step: int, verbose: bool):
         """
         Initializes the evaluators for underestimating the ttr.
         """
-        self._evaluator = [
-            TTB(self.configuration),
-            TTK(self.configuration),
-            TTS(self.configuration),
-        ]
+        for evl in self._evaluator:
+            # shared evaluators are reset by the `CriMeInterface` once per time step
+            if not evl._shared:
+                evl.reset()
         self.time_step = time_step
         self.state_list_set = []
         self.ttc = self.ttc_object.compute(time_step, verbose=verbose)
@@ -13,6 +13,7 @@ from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.type import TypeTime
 from commonroad_crime.measure.time.ttm import TTM
+from commonroad_crime.measure.time.ttc_star import TTCStar
 from commonroad_crime.utility.simulation import Maneuver
 import commonroad_crime.utility.logger as utils_log
 
@@ -25,6 +26,10 @@ class TTS(CriMeBase):
     """
 
     measure_name = TypeTime.TTS
+    # used by the evaluators of steering to the left/right
+    dependencies = [TTCStar]
+    # the selected state list and the maneuver of the evaluator are read by TTR
+    cache_results = False
 
     def __init__(self, config: CriMeConfiguration):
         super(TTS, self).__init__(config)
@@ -38,6 +43,14 @@ class TTS(CriMeBase):
         self.selected_state_list = None
         self.state_list_set = []
 
+    def reset(self):
+        super(TTS, self).reset()
+        self._left_evaluator.reset()
+        self._right_evaluator.reset()
+        self.maneuver = Maneuver.NONE
+        self.selected_state_list = None
+        self.state_list_set = []
+
     def compute(
         self,
         time_step: int = 0,
@@ -6,11 +6,10 @@ __maintainer__ = "Yuanfei Lin"
 __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
+import copy
 import logging
 import math
 from shapely.geometry import Point
-import matplotlib.pyplot as plt
-import matplotlib.transforms as mtransforms
 import numpy as np
 
 from commonroad.scenario.obstacle import StaticObstacle, ObstacleType
@@ -22,10 +21,12 @@ from commonroad_crime.data_structure.configuration import CriMeConfiguration
 from commonroad_crime.data_structure.type import TypeTime
 import commonroad_crime.utility.logger as utils_log
 import commonroad_crime.utility.general as utils_gen
-import commonroad_crime.utility.visualization as utils_vis
-from commonroad_crime.utility.visualization import TUMcolor
 from commonroad_crime.measure.time.ttc import TTC
 
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+mtransforms = utils_gen.lazy_import("matplotlib.transforms")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,48 +40,59 @@ class TTZ(CriMeBase):
     def __init__(self, config: CriMeConfiguration):
         super(TTZ, self).__init__(config)
         self._zebra_list = []
+        self._ttc_object = None
+        self._zebra_initialized = False
+
+    def _initialize_zebra_obstacles(self):
+        """
+        Models the zebras/crosswalks as static obstacles in a copy of the scenario and sets up the TTC evaluator on
+        it. The scenario in the configuration is shared with other measures, hence it is not modified.
+        """
+        self._zebra_initialized = True
+        zebra_lanelets = [
+            ll
+            for ll in self.sce.lanelet_network.lanelets
+            if LaneletType.CROSSWALK in ll.lanelet_type
+        ]
+        if not zebra_lanelets:
+            return
+        zebra_sce = self._context.copy_scenario()
+        for ll in zebra_lanelets:
+            init_state = InitialState(
+                **{
+                    "position": ll.polygon.center,
+                    "orientation": np.arctan(
+                        (ll.center_vertices[1][1] - ll.center_vertices[0][1])
+                        / (ll.center_vertices[1][0] - ll.center_vertices[0][0])
+                    ),
+                    "velocity": 0.0,
+                }
+            )
+            obstacle_center_shape = ll.polygon.translate_rotate(
+                translation=-ll.polygon.center, angle=0.0
+            )
+            zebra_obs = StaticObstacle(
+                zebra_sce.generate_object_id(),
+                ObstacleType.CONSTRUCTION_ZONE,
+                obstacle_center_shape,
+                init_state,
+            )
+            self._zebra_list.append(zebra_obs)
+            zebra_sce.add_objects(zebra_obs)
+        zebra_config = copy.copy(self.configuration)
+        zebra_config.update(sce=zebra_sce)
+        self._ttc_object = TTC(zebra_config)
 
     def compute(self, time_step: int = 0, vehicle_id: int = None, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
             return np.nan
-        zebra_list = []
-        for ll in self.sce.lanelet_network.lanelets:
-            if LaneletType.CROSSWALK in ll.lanelet_type:
-                zebra_list.append(ll)
-        if zebra_list:
+        if not self._zebra_initialized:
+            self._initialize_zebra_obstacles()
+        if self._zebra_list:
             ttz_list = []
-            for zebra in zebra_list:
-                init_state = InitialState(
-                    **{
-                        "position": zebra.polygon.center,
-                        "orientation": np.arctan(
-                            (zebra.center_vertices[1][1] - zebra.center_vertices[0][1])
-                            / (
-                                zebra.center_vertices[1][0]
-                                - zebra.center_vertices[0][0]
-                            )
-                        ),
-                        "velocity": 0.0,
-                    }
-                )
-                obstacle_center_shape = zebra.polygon.translate_rotate(
-                    translation=-zebra.polygon.center, angle=0.0
-                )
-                zebra_obs = StaticObstacle(
-                    self.sce.generate_object_id(),
-                    ObstacleType.CONSTRUCTION_ZONE,
-                    obstacle_center_shape,
-                    init_state,
-                )
-
-                self._zebra_list.append(zebra_obs)
-                if self.configuration.scenario:
-                    self.configuration.scenario.add_objects(zebra_obs)
-                else:
-                    self.configuration.scene.add_objects(zebra_obs)
-                ttc_object = TTC(self.configuration)
+            for zebra_obs in self._zebra_list:
                 ttz_list.append(
-                    ttc_object.compute(zebra_obs.obstacle_id, self.time_step)
+                    self._ttc_object.compute(zebra_obs.obstacle_id, self.time_step)
                 )
             if min(ttz_list) is not math.inf:
                 self.value = utils_gen.int_round(min(ttz_list), 2)
@@ -162,7 +174,7 @@ class TTZ(CriMeBase):
         utils_vis.draw_state_list(
             self.rnd,
             self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-            color=TUMcolor.TUMblue,
+            color=utils_vis.TUMcolor.TUMblue,
             linewidth=5,
         )
         plt.title(f"{self.measure_name} at time step {self.time_step}")
@@ -7,8 +7,8 @@ __email__ = "commonroad@lists.lrz.de"
 __status__ = "beta"
 
 import numpy as np
-import matplotlib.pyplot as plt
 import logging
+from typing import Dict, Tuple, Union
 
 from commonroad.scenario.obstacle import StaticObstacle
 from commonroad_crime.data_structure.base import CriMeBase
@@ -16,9 +16,10 @@ from commonroad_crime.data_structure.type import TypeTime, TypeMonotone
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
 import commonroad_crime.utility.solver as utils_sol
 import commonroad_crime.utility.general as utils_gen
-import commonroad_crime.utility.visualization as utils_vis
 import commonroad_crime.utility.logger as utils_log
-from commonroad_crime.utility.visualization import TUMcolor
+
+plt = utils_gen.lazy_import("matplotlib.pyplot")
+utils_vis = utils_gen.lazy_import("commonroad_crime.utility.visualization")
 
 logger = logging.getLogger(__name__)
 
@@ -32,23 +33,57 @@ class WTTC(CriMeBase):
 
     measure_name = TypeTime.WTTC
     monotone = TypeMonotone.NEG
+    pairwise_interaction = True
 
     def __init__(self, config: CriMeConfiguration):
         super(WTTC, self).__init__(config)
+        # (time step, maximum acceleration): worst-time-to-collision w.r.t. the other vehicles at this time step
+        self._wttc_batch: Union[Tuple[Tuple[int, float], Dict[int, float]], None] = None
+
+    def _wttc_at_time_step(self, time_step: int) -> Dict[int, float]:
+        """
+        Returns the worst-time-to-collision w.r.t. all other vehicles at the time step, which are computed at once.
+        """
+        a_max = self.configuration.vehicle.params.longitudinal.a_max
+        key = (time_step, a_max)
+        if self._wttc_batch is None or self._wttc_batch[0] != key:
+            vehicle_ids = self.get_other_vehicle_ids(time_step)
+            wttc = utils_sol.solver_wttc_batch(
+                self.ego_vehicle,
+                [
+                    self._context.other_vehicle(
+                        vehicle_id, self.ego_vehicle.obstacle_id
+                    )
+                    for vehicle_id in vehicle_ids
+                ],
+                time_step,
+                a_max,
+                self.trajectories,
+            )
+            self._wttc_batch = (key, dict(zip(vehicle_ids, wttc.tolist())))
+        return self._wttc_batch[1]
 
     def compute(self, vehicle_id: int, time_step: int = 0, verbose: bool = True):
         if not self.validate_update_states_log(vehicle_id, time_step, verbose):
             return np.nan
-        wttc_list = utils_sol.solver_wttc(
-            self.ego_vehicle,
-            self.other_vehicle,
-            time_step,
-            self.configuration.vehicle.params.longitudinal.a_max,
-        )
-        self.value = max(
-            [np.real(x) for x in wttc_list if np.isreal(x) and x > 0][0], 0.0
-        )
-        self.value = utils_gen.int_round(self.value, str(self.dt)[::-1].find("."))
+        wttc = self._wttc_at_time_step(self.time_step).get(vehicle_id)
+        if wttc is None:
+            wttc = utils_sol.solver_wttc_batch(
+                self.ego_vehicle,
+                [self.other_vehicle],
+                self.time_step,
+                self.configuration.vehicle.params.longitudinal.a_max,
+                self.trajectories,
+            )[0]
+        if np.isnan(wttc):
+            utils_log.print_and_log_warning(
+                logger,
+                f"* <{self.measure_name}>: No time of collision with vehicle {vehicle_id} is found",
+                verbose,
+            )
+            self.value = np.nan
+            return self.value
+        self.value = utils_gen.int_round(wttc, str(self.dt)[::-1].find("."))
         utils_log.print_and_log_info(
             logger, f"*\t\t {self.measure_name} = {self.value}", verbose
         )
@@ -72,14 +107,14 @@ class WTTC(CriMeBase):
                 self.rnd,
                 [self.ego_vehicle.initial_state]
                 + self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-                color=TUMcolor.TUMblue,
+                color=utils_vis.TUMcolor.TUMblue,
                 linewidth=5,
             )
         else:
             utils_vis.draw_state_list(
                 self.rnd,
                 self.ego_vehicle.prediction.trajectory.state_list[self.time_step :],
-                color=TUMcolor.TUMblue,
+                color=utils_vis.TUMcolor.TUMblue,
                 linewidth=5,
             )
         r_1 = r_2 = (
@@ -114,19 +149,28 @@ class WTTC(CriMeBase):
         )
         utils_vis.draw_dyn_vehicle_shape(self.rnd, self.ego_vehicle, self.time_step)
         utils_vis.draw_circle(
-            self.rnd, np.array([new_x_1, new_y_1]), r_v1 + r_1, color=TUMcolor.TUMblue
+            self.rnd,
+            np.array([new_x_1, new_y_1]),
+            r_v1 + r_1,
+            color=utils_vis.TUMcolor.TUMblue,
         )
         utils_vis.draw_circle(
-            self.rnd, np.array([new_x_1, new_y_1]), r_v1, color=TUMcolor.TUMdarkblue
+            self.rnd,
+            np.array([new_x_1, new_y_1]),
+            r_v1,
+            color=utils_vis.TUMcolor.TUMdarkblue,
         )
         utils_vis.draw_circle(
             self.rnd,
             np.array([new_x_2, new_y_2]),
             r_v2 + r_2,
-            color=TUMcolor.TUMlightgray,
+            color=utils_vis.TUMcolor.TUMlightgray,
         )
         utils_vis.draw_circle(
-            self.rnd, np.array([new_x_2, new_y_2]), r_v2, color=TUMcolor.TUMdarkgray
+            self.rnd,
+            np.array([new_x_2, new_y_2]),
+            r_v2,
+            color=utils_vis.TUMcolor.TUMdarkgray,
         )
         plt.title(f"{self.measure_name} at time step {self.time_step}")
         if self.configuration.debug.save_plots:
@@ -9,6 +9,8 @@ __status__ = "beta"
 import math
 import copy
 import logging
+from typing import Dict
+
 import numpy as np
 
 from commonroad.scenario.state import State
@@ -35,10 +37,11 @@ class WTTR(CriMeBase):
     """
 
     measure_name = TypeTime.WTTR
+    dependencies = [TTCStar]
 
     def __init__(self, config: CriMeConfiguration):
         super(WTTR, self).__init__(config)
-        self.ttc_object = TTCStar(config)
+        self.ttc_object = self.get_dependency(TTCStar)
         self.ttc = None
         self.reach_config = ConfigurationBuilder().build_configuration(
             config.general.name_scenario
@@ -64,6 +67,8 @@ class WTTR(CriMeBase):
         # self.reach_config.planning.coordinate_system = "CART"
         self.reach_config.update()
         self.reach_interface = ReachableSetInterface(self.reach_config)
+        # start time step: whether the final time step is reachable when reacting at the start time step
+        self._reachability_results: Dict[int, bool] = {}
 
     def _update_initial_state(self, target_state: State):
         self.reach_config.planning_problem.initial_state.position = (
@@ -100,9 +105,39 @@ class WTTR(CriMeBase):
         )
         return self.value
 
+    def final_step_reachable(self, start_time_step: int, verbose=False) -> bool:
+        """
+        Returns whether the final time step of the ego vehicle is reachable when reacting at the start time step. The
+        result only depends on the start time step and is kept over the time steps, except for the start time steps
+        that have passed.
+
+        :param start_time_step: time step from which the reachable sets are computed
+        """
+        if start_time_step in self._reachability_results:
+            return self._reachability_results[start_time_step]
+        time_end = self.ego_vehicle.prediction.final_time_step
+        mid_state = copy.deepcopy(self.ego_vehicle.state_at_time(start_time_step))
+        self._update_initial_state(mid_state)
+
+        # update configurations
+        self.reach_config.update(planning_problem=self.reach_config.planning_problem)
+        self.reach_config.planning.steps_computation = time_end - mid_state.time_step
+        self.reach_config.scenario.remove_obstacle(
+            self.reach_config.scenario.obstacle_by_id(self.ego_vehicle.obstacle_id)
+        )
+        self.reach_config.debug.save_config = verbose
+
+        # reset the interface and compute the reachable sets
+        self.reach_interface.reset(self.reach_config)
+        self.reach_interface.compute_reachable_sets(verbose=verbose)
+        reachable = bool(self.reach_interface.reachable_set_at_step(time_end))
+        self._reachability_results[start_time_step] = reachable
+        return reachable
+
     def binary_search(self, initial_step: int, verbose=False):
         """
-        Binary search to find the last time to execute the maneuver.
+        Binary search to find the last time to execute the maneuver. The reachable sets are only computed for the
+        start time steps that have not been checked at a previous time step.
         """
         wttr = -math.inf
         low = initial_step
@@ -112,28 +147,12 @@ class WTTR(CriMeBase):
             )
         )
         high = tstc + initial_step
-        time_end = self.ego_vehicle.prediction.final_time_step
+        # the reactions starting before the time step are not needed anymore
+        for start_time_step in [ts for ts in self._reachability_results if ts < low]:
+            del self._reachability_results[start_time_step]
         while low < high:
             mid = int((low + high) / 2)
-            mid_state = copy.deepcopy(self.ego_vehicle.state_at_time(mid))
-            self._update_initial_state(mid_state)
-
-            # update configurations
-            self.reach_config.update(
-                planning_problem=self.reach_config.planning_problem
-            )
-            self.reach_config.planning.steps_computation = (
-                time_end - mid_state.time_step
-            )
-            self.reach_config.scenario.remove_obstacle(
-                self.reach_config.scenario.obstacle_by_id(self.ego_vehicle.obstacle_id)
-            )
-            self.reach_config.debug.save_config = verbose
-
-            # reset the interface and compute the reachable sets
-            self.reach_interface.reset(self.reach_config)
-            self.reach_interface.compute_reachable_sets(verbose=verbose)
-            if self.reach_interface.reachable_set_at_step(time_end):
+            if self.final_step_reachable(mid, verbose=verbose):
                 # the final step is still reachable without causing the collision
                 low = mid + 1
             else:
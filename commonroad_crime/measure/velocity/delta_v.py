@@ -12,6 +12,7 @@ import logging
 
 from commonroad_crime.data_structure.base import CriMeBase
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
+from commonroad_crime.data_structure.trajectory_store import StateColumn
 from commonroad_crime.data_structure.type import TypeVelocity, TypeMonotone
 import commonroad_crime.utility.general as utils_gen
 import commonroad_crime.utility.logger as utils_log
@@ -29,6 +30,7 @@ class DeltaV(CriMeBase):
 
     measure_name = TypeVelocity.Delta_V
     monotone = TypeMonotone.POS
+    pairwise_interaction = True
 
     def __init__(self, config: CriMeConfiguration):
         super(DeltaV, self).__init__(config)
@@ -44,16 +46,16 @@ class DeltaV(CriMeBase):
         else:
             # assume that the vehicle b has the same mass as the ego vehicle
             m_b = m_ego
-        if self.ego_vehicle.state_at_time(
-            self.time_step
-        ) and self.other_vehicle.state_at_time(self.time_step):
+        ego_state = self.trajectories.state(self.ego_vehicle, self.time_step)
+        other_state = self.trajectories.state(self.other_vehicle, self.time_step)
+        if ego_state is not None and other_state is not None:
             v_ego = np.sqrt(
-                self.ego_vehicle.state_at_time(self.time_step).velocity ** 2
-                + self.ego_vehicle.state_at_time(self.time_step).velocity_y ** 2
+                ego_state[StateColumn.VELOCITY] ** 2
+                + ego_state[StateColumn.VELOCITY_Y] ** 2
             )
             v_b = np.sqrt(
-                self.other_vehicle.state_at_time(self.time_step).velocity ** 2
-                + self.other_vehicle.state_at_time(self.time_step).velocity_y ** 2
+                other_state[StateColumn.VELOCITY] ** 2
+                + other_state[StateColumn.VELOCITY_Y] ** 2
             )
             delta_v = (
                 m_b
@@ -61,8 +63,8 @@ class DeltaV(CriMeBase):
                     v_ego
                     + v_b
                     * np.cos(
-                        self.ego_vehicle.state_at_time(self.time_step).orientation
-                        - self.other_vehicle.state_at_time(self.time_step).orientation
+                        ego_state[StateColumn.ORIENTATION]
+                        - other_state[StateColumn.ORIENTATION]
                     )
                 )
                 / (m_b + m_ego)
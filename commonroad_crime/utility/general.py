@@ -26,13 +26,44 @@ import commonroad_crime.utility.solver as utils_sol
 import numpy as np
 import math
 import logging
-from typing import List, Union
+import hashlib
+import importlib
+import types
+from typing import List, Tuple, Union
 import functools
 from scipy.interpolate import splprep, splev
 
 logger = logging.getLogger(__name__)
 
 
+class _LazyModule(types.ModuleType):
+    """
+    Placeholder of a module that is imported when one of its attributes is accessed for the first time.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._module = None
+
+    def __getattr__(self, attribute: str):
+        if attribute == "_module":
+            raise AttributeError(attribute)
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return getattr(self._module, attribute)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Returns the module with the given name, which is only imported when it is used for the first time. It keeps
+    expensive dependencies that are not needed for computing the measures, e.g., the visualization, off the import
+    path.
+
+    :param name: absolute name of the module
+    """
+    return _LazyModule(name)
+
+
 def load_scenario(config) -> Scenario:
     """
     Loads a scenario from the configuration.
@@ -46,6 +77,36 @@ def load_scenario(config) -> Scenario:
     return scenario
 
 
+def lanelet_network_fingerprint(lanelet_network: LaneletNetwork) -> str:
+    """
+    Computes a hash of the geometry and the topology of the lanelets in the lanelet network.
+
+    :param lanelet_network: lanelet network
+    """
+    fingerprint = hashlib.sha1()
+    for lanelet in sorted(lanelet_network.lanelets, key=lambda ll: ll.lanelet_id):
+        fingerprint.update(
+            repr(
+                (
+                    lanelet.lanelet_id,
+                    lanelet.predecessor,
+                    lanelet.successor,
+                    lanelet.adj_left,
+                    lanelet.adj_right,
+                    lanelet.adj_left_same_direction,
+                    lanelet.adj_right_same_direction,
+                )
+            ).encode()
+        )
+        for vertices in (
+            lanelet.center_vertices,
+            lanelet.left_vertices,
+            lanelet.right_vertices,
+        ):
+            fingerprint.update(np.ascontiguousarray(vertices, dtype=float).tobytes())
+    return fingerprint.hexdigest()
+
+
 def generate_reference_path(
     lanelet_id: int, lanelet_network: LaneletNetwork, flag_resampling=True
 ):
@@ -127,6 +188,35 @@ def check_in_same_lanelet(
     return not lanelets_1.isdisjoint(lanelets_2)
 
 
+def obtain_occupancy_polygons(
+    obstacle: Union[DynamicObstacle, StaticObstacle],
+) -> Tuple[Union[np.ndarray, None], np.ndarray]:
+    """
+    Returns the time steps and the shapely polygons of the occupancies of the obstacle at all its time steps. The
+    time steps are None if the occupancy is the same at every time step, e.g., for static obstacles.
+
+    :param obstacle: obstacle of the scenario
+    """
+    if not isinstance(obstacle, DynamicObstacle):
+        return None, np.array(
+            [obstacle.occupancy_at_time(0).shape.shapely_object], dtype=object
+        )
+    initial_time_step = obstacle.initial_state.time_step
+    polygons = [obstacle.occupancy_at_time(initial_time_step).shape.shapely_object]
+    final_time_step = initial_time_step
+    if obstacle.prediction is not None:
+        # the occupancy set is created anew on every access, so it is only requested once
+        occupancy_set = {}
+        for occupancy in obstacle.prediction.occupancy_set:
+            occupancy_set.setdefault(occupancy.time_step, occupancy)
+        final_time_step = obstacle.prediction.final_time_step
+        for time_step in range(initial_time_step + 1, final_time_step + 1):
+            polygons.append(occupancy_set[time_step].shape.shapely_object)
+    return np.arange(initial_time_step, final_time_step + 1), np.array(
+        polygons, dtype=object
+    )
+
+
 def check_elements_state_list(
     state_list: List[
         Union[LongitudinalState, KSState, CustomState, PMState, State, None]
@@ -203,32 +203,38 @@ class TCIOptimizer(OptimizerBase):
         r_y = vehicle.state_at_time(time_step).position[1]
         d_x = None
         d_y = None
-        for k in range(time_step, time_step + self.tci_config.N + 1):
-            if vehicle.state_at_time(k):
-                dis_bound = utils_sol.compute_veh_dis_to_boundary(
-                    vehicle.state_at_time(k), self.sce.lanelet_network
-                )
-                d_y = max(dis_bound)
-                boundary_limit_list.append(
-                    [
-                        vehicle.state_at_time(k).position[1] - dis_bound[0],
-                        vehicle.state_at_time(k).position[1] + dis_bound[1],
-                    ]
-                )
-                for obs in self.sce.obstacles:
-                    if obs is not vehicle:
-                        if obs.state_at_time(k):
-                            dis_other = abs(
-                                vehicle.state_at_time(k).position[1]
-                                - obs.state_at_time(k).position[1]
+        time_steps = [
+            k
+            for k in range(time_step, time_step + self.tci_config.N + 1)
+            if vehicle.state_at_time(k)
+        ]
+        # the distances to the road boundary over the horizon are queried at once
+        dis_right, dis_left, _, _ = utils_sol.compute_veh_dis_to_boundary_batch(
+            np.array([vehicle.state_at_time(k).position for k in time_steps]),
+            self.sce.lanelet_network,
+        )
+        for k, dis_bound in zip(time_steps, zip(dis_right, dis_left)):
+            d_y = max(dis_bound)
+            boundary_limit_list.append(
+                [
+                    vehicle.state_at_time(k).position[1] - dis_bound[0],
+                    vehicle.state_at_time(k).position[1] + dis_bound[1],
+                ]
+            )
+            for obs in self.sce.obstacles:
+                if obs is not vehicle:
+                    if obs.state_at_time(k):
+                        dis_other = abs(
+                            vehicle.state_at_time(k).position[1]
+                            - obs.state_at_time(k).position[1]
+                        )
+                        if dis_other > d_y:
+                            d_y = dis_other
+                            d_x = abs(
+                                vehicle.state_at_time(k).position[0]
+                                - obs.state_at_time(k).position[0]
                             )
-                            if dis_other > d_y:
-                                d_y = dis_other
-                                d_x = abs(
-                                    vehicle.state_at_time(k).position[0]
-                                    - obs.state_at_time(k).position[0]
-                                )
-                                r_y = vehicle.state_at_time(k).position[1]
+                            r_y = vehicle.state_at_time(k).position[1]
         return r_y, d_y, d_x, boundary_limit_list
 
     def optimize(
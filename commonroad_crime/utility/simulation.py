@@ -20,6 +20,7 @@ from commonroad.scenario.scenario import Tag
 from commonroad.scenario.state import PMInputState, PMState, KSState
 
 from commonroad_crime.data_structure.configuration import CriMeConfiguration
+from commonroad_crime.data_structure.road_topology import get_road_topology
 from commonroad_crime.utility.general import (
     check_elements_state,
     compute_curvature_from_polyline_start_end,
@@ -539,36 +540,20 @@ class SimulationLat(SimulationBase):
             [checked_state.position]
         )[0]
         # store selected incoming and turning lanelet
+        is_turn_left = self.maneuver in Maneuver.TURNLEFT
+        is_turn_right = self.maneuver in Maneuver.TURNRIGHT
+        # the current lanelet is either an incoming lanelet or a successor in the turning direction
+        self.incoming = get_road_topology(self._scenario.lanelet_network).find_incoming(
+            current_lanelet_ids,
+            ("left",) if is_turn_left else ("right",) if is_turn_right else (),
+        )
         self.turning_lanelet_id = None
-        self.incoming = None
-        for intersection in self._scenario.lanelet_network.intersections:
-            for incoming in intersection.incomings:
-                is_turn_left = self.maneuver in Maneuver.TURNLEFT
-                is_turn_right = self.maneuver in Maneuver.TURNRIGHT
-
-                # Check if the current_lanelet_id is in the correct incoming or successor lanelets based on the maneuver
-                if (
-                    set(current_lanelet_ids).intersection(incoming.incoming_lanelets)
-                    or (
-                        is_turn_left
-                        and set(current_lanelet_ids).intersection(
-                            incoming.successors_left
-                        )
-                    )
-                    or (
-                        is_turn_right
-                        and set(current_lanelet_ids).intersection(
-                            incoming.successors_right
-                        )
-                    )
-                ):
-                    self.turning_lanelet_id = (
-                        incoming.successors_left
-                        if is_turn_left
-                        else incoming.successors_right
-                    )
-                    self.incoming = incoming
-                    break
+        if self.incoming is not None:
+            self.turning_lanelet_id = (
+                self.incoming.successors_left
+                if is_turn_left
+                else self.incoming.successors_right
+            )
 
         if self.turning_lanelet_id:
             turning_lanelet = self._scenario.lanelet_network.find_lanelet_by_id(
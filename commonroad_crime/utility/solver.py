@@ -6,13 +6,15 @@ __maintainer__ = "Yuanfei Lin"
 __email__ = "commonroad@lists.lrz.de"
 __status__ = "Pre-alpha"
 
-from typing import Tuple, Union
+from typing import Sequence, Tuple, Union
 import numpy as np
 import logging
 import math
+import hashlib
+from collections import OrderedDict
 from functools import lru_cache
 from shapely.geometry import Polygon
-from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
 
 from commonroad.geometry.shape import Circle, Rectangle
 
@@ -33,19 +35,27 @@ from commonroad_dc.geometry.util import (
 )
 import commonroad_dc.pycrccosy as pycrccosy
 
+from commonroad_crime.data_structure.trajectory_store import (
+    TrajectoryStore,
+    StateColumn,
+)
+from commonroad_crime.data_structure.road_topology import get_road_topology
+
 from scipy.interpolate import splprep, splev
 
 logger = logging.getLogger(__name__)
 
 
-def solver_wttc(
+def _wttc_coefficients(
     veh_1: Obstacle,
     veh_2: Obstacle,
     time_step: int,
     a_max: float,
-):
+    trajectories: TrajectoryStore,
+) -> Union[np.ndarray, None]:
     """
-    Analytical solution of the worst-time-to-collision.
+    Coefficients of the quartic polynomial of the worst-time-to-collision, ordered from the highest degree, or None
+    if a vehicle has no state at the time step.
     """
     if veh_1.obstacle_type == ObstacleType.PEDESTRIAN:
         r_v1 = veh_1.obstacle_shape.radius
@@ -59,16 +69,14 @@ def solver_wttc(
         r_v2, _ = compute_disc_radius_and_distance(
             veh_2.obstacle_shape.length, veh_2.obstacle_shape.width
         )
-    x_10, y_10 = veh_1.state_at_time(time_step).position
-    x_20, y_20 = veh_2.state_at_time(time_step).position
-    v_1x0, v_1y0 = (
-        veh_1.state_at_time(time_step).velocity,
-        veh_1.state_at_time(time_step).velocity_y,
-    )
-    v_2x0, v_2y0 = (
-        veh_2.state_at_time(time_step).velocity,
-        veh_2.state_at_time(time_step).velocity_y,
-    )
+    state_1 = trajectories.state(veh_1, time_step)
+    state_2 = trajectories.state(veh_2, time_step)
+    if state_1 is None or state_2 is None:
+        return None
+    x_10, y_10 = state_1[StateColumn.POSITION]
+    x_20, y_20 = state_2[StateColumn.POSITION]
+    v_1x0, v_1y0 = state_1[StateColumn.VELOCITY], state_1[StateColumn.VELOCITY_Y]
+    v_2x0, v_2y0 = state_2[StateColumn.VELOCITY], state_2[StateColumn.VELOCITY_Y]
     a_10 = a_20 = a_max
     if isinstance(veh_2, StaticObstacle):
         a_20 = 0
@@ -78,7 +86,85 @@ def solver_wttc(
     C = -(a_20 + a_10) * (r_v1 + r_v2) + (v_2x0 - v_1x0) ** 2 + (v_2y0 - v_1y0) ** 2
     D = 2 * (v_2x0 - v_1x0) * (x_20 - x_10) + 2 * (v_2y0 - v_1y0) * (y_20 - y_10)
     E = (x_20 - x_10) ** 2 + (y_20 - y_10) ** 2 - (r_v1 + r_v2) ** 2
-    return np.roots(np.array([A, B, C, D, E]))
+    return np.array([A, B, C, D, E], dtype=float)
+
+
+def solver_wttc(
+    veh_1: Obstacle,
+    veh_2: Obstacle,
+    time_step: int,
+    a_max: float,
+    trajectories: TrajectoryStore = None,
+):
+    """
+    Analytical solution of the worst-time-to-collision.
+
+    :param trajectories: store of the states of both vehicles; if not given, the states are obtained from the vehicles
+    """
+    if trajectories is None:
+        trajectories = TrajectoryStore()
+    return np.roots(_wttc_coefficients(veh_1, veh_2, time_step, a_max, trajectories))
+
+
+def solve_quartics(coefficients: np.ndarray) -> np.ndarray:
+    """
+    Computes the roots of many quartic polynomials at once as the eigenvalues of their stacked companion matrices,
+    which are the same as the ones of `np.roots`.
+
+    :param coefficients: coefficients of shape (n, 5) ordered from the highest degree, whose first column must not
+        contain zeros
+    :return: complex roots of shape (n, 4)
+    """
+    coefficients = np.asarray(coefficients, dtype=float).reshape(-1, 5)
+    companion = np.zeros((len(coefficients), 4, 4))
+    companion[:, 0, :] = -coefficients[:, 1:] / coefficients[:, :1]
+    companion[:, [1, 2, 3], [0, 1, 2]] = 1.0
+    return np.linalg.eigvals(companion).astype(complex)
+
+
+def solver_wttc_batch(
+    veh_1: Obstacle,
+    vehicles_2: Sequence[Obstacle],
+    time_step: int,
+    a_max: float,
+    trajectories: TrajectoryStore = None,
+) -> np.ndarray:
+    """
+    Worst-time-to-collision of the first vehicle w.r.t. each of the other vehicles. The quartics of all pairs are
+    solved at once and the earliest time at which the vehicles might collide is selected, i.e., 0 if their discs
+    already overlap and the smallest positive real root otherwise.
+
+    :param veh_1: first vehicle, e.g., the ego vehicle
+    :param vehicles_2: other vehicles
+    :param time_step: time step
+    :param a_max: maximum acceleration of the vehicles
+    :param trajectories: store of the states of the vehicles; if not given, the states are obtained from the vehicles
+    :return: worst-time-to-collision of each pair, which is NaN if a vehicle has no state or none is found
+    """
+    if trajectories is None:
+        trajectories = TrajectoryStore()
+    coefficients = np.full((len(vehicles_2), 5), np.nan)
+    for index, veh_2 in enumerate(vehicles_2):
+        coefficients_pair = _wttc_coefficients(
+            veh_1, veh_2, time_step, a_max, trajectories
+        )
+        if coefficients_pair is not None:
+            coefficients[index] = coefficients_pair
+    roots = np.full((len(vehicles_2), 4), np.nan, dtype=complex)
+    valid = np.all(np.isfinite(coefficients), axis=1)
+    quartic = valid & (coefficients[:, 0] != 0)
+    if np.any(quartic):
+        roots[quartic] = solve_quartics(coefficients[quartic])
+    # polynomials of lower degree, e.g., without acceleration
+    for index in np.flatnonzero(valid & ~quartic):
+        roots_pair = np.roots(coefficients[index])
+        roots[index, : len(roots_pair)] = roots_pair
+    positive_roots = np.where(
+        (roots.imag == 0) & (roots.real > 0), roots.real, np.inf
+    ).min(axis=1, initial=np.inf)
+    wttc = np.where(np.isfinite(positive_roots), positive_roots, np.nan)
+    wttc[valid & (coefficients[:, 4] <= 0)] = 0.0
+    return wttc
 
 
 def obtain_road_boundary(
@@ -90,18 +176,27 @@ def obtain_road_boundary(
     :return: (left boundary, right boundary)
     """
     veh_lanelet_id = lanelet_network.find_lanelet_by_position([state.position])[0]
-    lanelet_leftmost = lanelet_rightmost = lanelet_network.find_lanelet_by_id(
-        veh_lanelet_id[0]
+    left_bounds, right_bounds = _get_road_boundary(lanelet_network, veh_lanelet_id[0])
+    return left_bounds.vertices, right_bounds.vertices
+
+
+def _get_road_boundary(
+    lanelet_network: LaneletNetwork, lanelet_id: int
+) -> Tuple["PolylineIndex", "PolylineIndex"]:
+    """
+    Returns the indices of the left and right road boundaries of the road section containing the lanelet, i.e., of
+    the outermost lanelets with the same direction.
+    """
+    road_topology = get_road_topology(lanelet_network)
+    lanelet_leftmost = lanelet_network.find_lanelet_by_id(
+        road_topology.leftmost(lanelet_id)
+    )
+    lanelet_rightmost = lanelet_network.find_lanelet_by_id(
+        road_topology.rightmost(lanelet_id)
+    )
+    return get_polyline_index(lanelet_leftmost.left_vertices), get_polyline_index(
+        lanelet_rightmost.right_vertices
     )
-    while lanelet_leftmost.adj_left_same_direction:
-        lanelet_leftmost = lanelet_network.find_lanelet_by_id(lanelet_leftmost.adj_left)
-    while lanelet_rightmost.adj_right_same_direction:
-        lanelet_rightmost = lanelet_network.find_lanelet_by_id(
-            lanelet_rightmost.adj_right
-        )
-    left_bounds = resample_polyline(lanelet_leftmost.left_vertices)
-    right_bounds = resample_polyline(lanelet_rightmost.right_vertices)
-    return left_bounds, right_bounds
 
 
 def compute_veh_dis_to_boundary(
@@ -113,18 +208,50 @@ def compute_veh_dis_to_boundary(
     :return: (distance to the right boundary,
              distance to the left boundary)
     """
-    left_b, right_b = obtain_road_boundary(state, lanelet_network)
-    return np.min(cdist(np.array([state.position]), right_b, "euclidean")), np.min(
-        cdist(np.array([state.position]), left_b, "euclidean")
+    dis_right, dis_left, _, _ = compute_veh_dis_to_boundary_batch(
+        np.array([state.position]), lanelet_network
     )
+    return dis_right[0], dis_left[0]
+
+
+def compute_veh_dis_to_boundary_batch(
+    positions: np.ndarray, lanelet_network: LaneletNetwork
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the distances between the positions and the road boundaries of the road sections containing them. The
+    positions on the same road section are queried at once.
+
+    :param positions: positions of shape (n, 2)
+    :param lanelet_network: lanelet network
+
+    :return: (distances to the right boundary, distances to the left boundary,
+             closest points on the right boundary, closest points on the left boundary)
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+    dis_right = np.empty(len(positions))
+    dis_left = np.empty(len(positions))
+    closest_right = np.empty((len(positions), 2))
+    closest_left = np.empty((len(positions), 2))
+    # the road sections are identified by the lanelets containing the positions
+    sections = {}
+    for i, lanelet_ids in enumerate(
+        lanelet_network.find_lanelet_by_position(list(positions))
+    ):
+        sections.setdefault(lanelet_ids[0], []).append(i)
+    for lanelet_id, indices in sections.items():
+        left_bounds, right_bounds = _get_road_boundary(lanelet_network, lanelet_id)
+        dis_right[indices], closest_right[indices] = right_bounds.query(
+            positions[indices]
+        )
+        dis_left[indices], closest_left[indices] = left_bounds.query(positions[indices])
+    return dis_right, dis_left, closest_right, closest_left
 
 
 def compute_closest_coordinate_from_list_of_points(state: State, vertices: np.ndarray):
     """
     Computes the closest coordinate from a list of points
     """
-    vertices = resample_polyline(vertices)
-    return vertices[np.argmin(cdist(np.array([state.position]), vertices, "euclidean"))]
+    return get_polyline_index(vertices).query(np.array([state.position]))[1][0]
 
 
 @lru_cache(maxsize=None)
@@ -180,6 +307,36 @@ def compute_clcs_distance(
     return front_s - rear_s, front_d - rear_d
 
 
+def convert_to_curvilinear_coords_batch(
+    clcs: CurvilinearCoordinateSystem, points: np.ndarray
+) -> np.ndarray:
+    """
+    Converts the points into the curvilinear coordinate system in one call.
+
+    :param clcs: curvi-linear coordinate system
+    :param points: points of shape (n, 2) in Cartesian coordinates
+
+    :return the curvilinear coordinates of shape (n, 2), which are NaN for the points outside the projection domain
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    coordinates = np.full(points.shape, np.nan)
+    valid = ~np.isnan(points).any(axis=1)
+    if not valid.any():
+        return coordinates
+    converted = clcs.convert_list_of_points_to_curvilinear_coords(points[valid], 1)
+    if len(converted) != np.count_nonzero(valid):
+        # the points outside the projection domain are skipped by the conversion
+        valid[valid] = [
+            clcs.cartesian_point_inside_projection_domain(x, y)
+            for x, y in points[valid]
+        ]
+        if not valid.any():
+            return coordinates
+        converted = clcs.convert_list_of_points_to_curvilinear_coords(points[valid], 1)
+    coordinates[valid] = np.array(converted)
+    return coordinates
+
+
 def compute_jerk(
     current_acceleration: float, next_acceleration: float, dt: float
 ) -> float:
@@ -208,6 +365,179 @@ def compute_acceleration(current_velocity: float, next_velocity: float, dt: floa
     return acceleration
 
 
+def compute_ttc_batch(
+    delta_d: np.ndarray, delta_v: np.ndarray, delta_a: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized closed-form time-to-collision with constant accelerations using (5.26) in "Collision Avoidance Theory
+    with Application to Automotive Collision Mitigation". The branches and the rounding follow `TTC.compute`, which
+    is the scalar reference; a NaN distance results in NaN.
+
+    :param delta_d: distances along the lanelet, e.g., of shape (N_others, T)
+    :param delta_v: velocities of the other vehicles relative to the ego vehicle
+    :param delta_a: accelerations of the other vehicles relative to the ego vehicle
+    :return: time-to-collision of the broadcast shape of the inputs
+    """
+    delta_d, delta_v, delta_a = np.broadcast_arrays(
+        np.asarray(delta_d, dtype=float),
+        np.asarray(delta_v, dtype=float),
+        np.asarray(delta_a, dtype=float),
+    )
+    ttc = np.full(delta_d.shape, np.inf)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        discriminant = delta_v**2 - 2 * delta_d * delta_a
+        constant_velocity = (delta_v < 0) & (np.abs(delta_a) <= 0.1)
+        closing = ~constant_velocity & ~(discriminant < 0)
+        closing &= ((delta_v < 0) & (delta_a != 0)) | ((delta_v >= 0) & (delta_a < 0))
+        ttc[constant_velocity] = -(
+            delta_d[constant_velocity] / delta_v[constant_velocity]
+        )
+        ttc[closing] = (
+            -(delta_v[closing] / delta_a[closing])
+            - np.sqrt(discriminant[closing]) / delta_a[closing]
+        )
+    # same rounding as `utils_gen.int_round` with two decimals
+    rounded = np.isfinite(ttc)
+    ttc[rounded] = (
+        np.trunc(ttc[rounded] * 100.0 + np.where(ttc[rounded] < 0, -0.5, 0.5)) / 100.0
+    )
+    ttc[delta_d == np.inf] = np.inf
+    ttc[np.isnan(delta_d)] = np.nan
+    return ttc
+
+
+class LaneletGeometry:
+    """
+    Smoothed geometry of a lanelet, i.e., its polylines, the width and orientation profiles along the arc length of
+    the center line, and the curvilinear coordinate system of the center line.
+    """
+
+    def __init__(self, lanelet: Lanelet):
+        """
+        :param lanelet: a lanelet
+        """
+        # smooth the vertices first:
+        try:
+            self.center_vertices = smoothing_reference_path(
+                lanelet.center_vertices, 5, 15
+            )
+            self.left_vertices = smoothing_reference_path(lanelet.left_vertices, 5, 15)
+            self.right_vertices = smoothing_reference_path(
+                lanelet.right_vertices, 5, 15
+            )
+        except (
+            TypeError,
+            ValueError,
+        ) as e:  # Replace with the specific exceptions you expect
+            logging.error(f"Error smoothing vertices: {e}")
+            self.center_vertices = lanelet.center_vertices
+            self.left_vertices = lanelet.left_vertices
+            self.right_vertices = lanelet.right_vertices
+
+        self.width = _compute_width_from_lanalet_boundary(
+            self.left_vertices, self.right_vertices
+        )
+        self.orientation = [
+            convert_to_0_2pi(orient)
+            for orient in compute_orientation_from_polyline(self.center_vertices)
+        ]
+        self.path_length = compute_pathlength_from_polyline(self.center_vertices)
+        self.clcs = CurvilinearCoordinateSystem(self.center_vertices)
+
+    def width_orientation(self, position: np.ndarray) -> Tuple[float, float]:
+        """
+        Computes the width and the orientation of the lanelet at the given position.
+
+        :param position: position in Cartesian coordinates
+        """
+        position_s, _ = self.clcs.convert_to_curvilinear_coords(
+            position[0], position[1]
+        )
+        return np.interp(
+            position_s, self.path_length, self.width
+        ), get_orientation_point(position_s, self.path_length, self.orientation)
+
+
+# geometries of the lanelets identified by their vertices, such that the copies of a lanelet network share them
+_lanelet_geometries: "OrderedDict[bytes, LaneletGeometry]" = OrderedDict()
+LANELET_GEOMETRY_CACHE_SIZE = 2048
+
+
+def get_lanelet_geometry(lanelet: Lanelet) -> LaneletGeometry:
+    """
+    Returns the smoothed geometry of the lanelet, which is computed once and kept in a bounded cache with
+    least-recently-used eviction.
+
+    :param lanelet: a lanelet
+    """
+    key = hashlib.sha1(
+        b"".join(
+            np.ascontiguousarray(vertices, dtype=float).tobytes()
+            for vertices in (
+                lanelet.center_vertices,
+                lanelet.left_vertices,
+                lanelet.right_vertices,
+            )
+        )
+    ).digest()
+    geometry = _lanelet_geometries.get(key)
+    if geometry is None:
+        geometry = LaneletGeometry(lanelet)
+        _lanelet_geometries[key] = geometry
+        while len(_lanelet_geometries) > LANELET_GEOMETRY_CACHE_SIZE:
+            _lanelet_geometries.popitem(last=False)
+    else:
+        _lanelet_geometries.move_to_end(key)
+    return geometry
+
+
+class PolylineIndex:
+    """
+    Resampled polyline, e.g., a road boundary, with a KD-tree over its vertices for the queries of the closest
+    vertices.
+    """
+
+    def __init__(self, vertices: np.ndarray):
+        """
+        :param vertices: vertices of the polyline
+        """
+        self.vertices = resample_polyline(vertices)
+        self.tree = cKDTree(self.vertices)
+
+    def query(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the distances between the positions and the polyline and the closest (resampled) vertices.
+
+        :param positions: positions of shape (n, 2)
+        """
+        distances, indices = self.tree.query(positions)
+        return distances, self.vertices[indices]
+
+
+# resampled polylines identified by their vertices
+_polyline_indices: "OrderedDict[bytes, PolylineIndex]" = OrderedDict()
+POLYLINE_INDEX_CACHE_SIZE = 2048
+
+
+def get_polyline_index(vertices: np.ndarray) -> PolylineIndex:
+    """
+    Returns the index of the polyline, which is built once and kept in a bounded cache with least-recently-used
+    eviction.
+
+    :param vertices: vertices of the polyline
+    """
+    key = hashlib.sha1(np.ascontiguousarray(vertices, dtype=float).tobytes()).digest()
+    index = _polyline_indices.get(key)
+    if index is None:
+        index = PolylineIndex(vertices)
+        _polyline_indices[key] = index
+        while len(_polyline_indices) > POLYLINE_INDEX_CACHE_SIZE:
+            _polyline_indices.popitem(last=False)
+    else:
+        _polyline_indices.move_to_end(key)
+    return index
+
+
 def compute_lanelet_width_orientation(
     lanelet: Lanelet, position: np.ndarray
 ) -> Tuple[Union[float, None], Union[float, None]]:
@@ -216,31 +546,7 @@ def compute_lanelet_width_orientation(
 
     :param lanelet: a lanelet
     """
-    # smooth the vertices first:
-    try:
-        center_vertices = smoothing_reference_path(lanelet.center_vertices, 5, 15)
-        left_vertices = smoothing_reference_path(lanelet.left_vertices, 5, 15)
-        right_vertices = smoothing_reference_path(lanelet.right_vertices, 5, 15)
-    except (
-        TypeError,
-        ValueError,
-    ) as e:  # Replace with the specific exceptions you expect
-        logging.error(f"Error smoothing vertices: {e}")
-        center_vertices = lanelet.center_vertices
-        left_vertices = lanelet.left_vertices
-        right_vertices = lanelet.right_vertices
-
-    width_list = _compute_width_from_lanalet_boundary(left_vertices, right_vertices)
-    orient_list = [
-        convert_to_0_2pi(orient)
-        for orient in compute_orientation_from_polyline(center_vertices)
-    ]
-    path_length = compute_pathlength_from_polyline(center_vertices)
-    lanelet_clcs = CurvilinearCoordinateSystem(center_vertices)
-    position_s, _ = lanelet_clcs.convert_to_curvilinear_coords(position[0], position[1])
-    return np.interp(position_s, path_length, width_list), get_orientation_point(
-        position_s, path_length, orient_list
-    )
+    return get_lanelet_geometry(lanelet).width_orientation(position)
 
 
 def extrapolate_resample_polyline(